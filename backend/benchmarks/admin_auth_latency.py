@@ -0,0 +1,39 @@
+import argparse
+import asyncio
+import json
+import sys
+
+from harness import app_client, bench_admin, drive, require_bench_database, summarize
+
+import server
+
+ROUTES = ["/api/analytics", "/api/keywords"]
+
+
+async def run(total, concurrency):
+    results = {}
+    async with app_client(server.app) as client, bench_admin(client, server.db) as headers:
+        # "before" reproduces the old behaviour: every request resolves the admin from Mongo.
+        for mode, ttl in (("before", 0.0), ("after", server.ADMIN_CACHE_TTL_SECONDS)):
+            server.admin_cache.ttl_seconds = ttl
+            server.admin_cache.clear()
+            for route in ROUTES:
+                await drive(client, "GET", route, concurrency, concurrency, headers=headers)
+                latencies, elapsed, errors = await drive(client, "GET", route, total, concurrency, expected_status=200, headers=headers)
+                results.setdefault(route, {})[mode] = {**summarize(latencies, elapsed), "errors": errors}
+                print(f"{mode:>6} {route:<16} p50 {results[route][mode]['p50_ms']:>8.2f} ms  "
+                      f"p99 {results[route][mode]['p99_ms']:>8.2f} ms", file=sys.stderr)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="p50/p99 latency of admin endpoints with and without the admin principal cache")
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+    require_bench_database()
+    print(json.dumps(asyncio.run(run(args.requests, args.concurrency)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
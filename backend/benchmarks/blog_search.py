@@ -0,0 +1,77 @@
+import argparse
+import json
+import random
+import sys
+import time
+
+from harness import summarize
+
+import server
+
+VOCABULARY_SIZE = 20_000
+
+
+def synthetic_post(i, rng, vocabulary):
+    def words(count):
+        return " ".join(rng.choice(vocabulary) for _ in range(count))
+
+    return {
+        "slug": f"synthetic-post-{i}",
+        "title": words(8),
+        "excerpt": words(30),
+        "keywords": ", ".join(rng.choice(vocabulary) for _ in range(5)),
+        "content": words(400),
+        "published": True,
+    }
+
+
+def build(posts, seed):
+    rng = random.Random(seed)
+    # Zipf-ish vocabulary so a handful of terms appear in most posts, like real prose.
+    vocabulary = [f"term{i}" for i in range(VOCABULARY_SIZE)]
+    weighted = [vocabulary[min(int(rng.paretovariate(0.5)) - 1, VOCABULARY_SIZE - 1)] for _ in range(200_000)]
+    index = server.BlogSearchIndex()
+    started = time.perf_counter()
+    index._begin_build()
+    for i in range(posts):
+        index._add(synthetic_post(i, rng, weighted))
+    index._finish_build()
+    index._loaded = True
+    return index, time.perf_counter() - started, rng
+
+
+def run(posts, queries, seed):
+    index, build_seconds, rng = build(posts, seed)
+    print(f"indexed {posts} posts in {build_seconds:.1f}s, {len(index._postings)} terms", file=sys.stderr)
+    results = {"posts": posts, "terms": len(index._postings), "build_s": round(build_seconds, 2)}
+    latencies = []
+    for i in range(50):
+        post = synthetic_post(posts + i, rng, [f"term{n}" for n in range(50)])
+        started = time.perf_counter()
+        index.upsert(post)
+        latencies.append(time.perf_counter() - started)
+    results["upsert"] = summarize(latencies)
+    print(f"{'upsert':>7} single post     p50 {results['upsert']['p50_ms']:>7.3f} ms  p99 {results['upsert']['p99_ms']:>7.3f} ms", file=sys.stderr)
+    for name, pool in (("common", [f"term{i}" for i in range(5)]), ("mixed", [f"term{i}" for i in range(200)]), ("rare", [f"term{i}" for i in range(200, 5000)])):
+        latencies = []
+        for _ in range(queries):
+            terms = rng.sample(pool, 3)
+            started = time.perf_counter()
+            index.search(terms, limit=10)
+            latencies.append(time.perf_counter() - started)
+        results[name] = summarize(latencies)
+        print(f"{name:>7} 3-term queries  p50 {results[name]['p50_ms']:>7.3f} ms  p99 {results[name]['p99_ms']:>7.3f} ms", file=sys.stderr)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="BM25 blog search query latency over a synthetic corpus (index only, no Mongo)")
+    parser.add_argument("--posts", type=int, default=100_000)
+    parser.add_argument("--queries", type=int, default=500)
+    parser.add_argument("--seed", type=int, default=7)
+    args = parser.parse_args()
+    print(json.dumps(run(args.posts, args.queries, args.seed), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,77 @@
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+from harness import app_client
+
+import server
+
+BENCH_SLUG = "bench-compression-post"
+ENCODINGS = ["identity", "gzip", "br"]
+
+
+async def seed(client, posts=60):
+    now = server.datetime.now(server.timezone.utc)
+    content = "\n\n".join(f"Paragraph {i} about cloud migration, Azure landing zones and AWS cost controls." * 4 for i in range(150))
+    for index in range(posts):
+        slug = BENCH_SLUG if index == 0 else f"{BENCH_SLUG}-{index}"
+        await server.db.blogs.update_one(
+            {"slug": slug},
+            {"$setOnInsert": {"id": slug, "slug": slug, "title": f"Compression bench {index}",
+                              "excerpt": "Cloud migration notes for the compression benchmark " * 3, "content": content,
+                              "keywords": "bench", "meta_description": "Bench", "author": "TechResona Team", "published": True,
+                              "created_at": now, "updated_at": now}},
+            upsert=True
+        )
+    server.read_cache.clear()
+
+
+async def measure(client, url, encoding, total, cached):
+    """Bytes on the wire and process CPU per request, with or without the compressed-body cache."""
+    wire_bytes = 0
+    server.compressed_cache.clear()
+    cpu_started = time.process_time()
+    started = time.perf_counter()
+    for _ in range(total):
+        if not cached:
+            server.compressed_cache.clear()
+        async with client.stream("GET", url, headers={"Accept-Encoding": encoding}) as response:
+            async for chunk in response.aiter_raw():
+                wire_bytes += len(chunk)
+    return {
+        "bytes_per_request": wire_bytes // total,
+        "cpu_ms_per_request": round((time.process_time() - cpu_started) * 1000 / total, 3),
+        "wall_ms_per_request": round((time.perf_counter() - started) * 1000 / total, 3),
+    }
+
+
+async def run(total):
+    routes = [f"/api/blogs/{BENCH_SLUG}", "/api/blogs?limit=50", "/robots.txt", "/sitemap.xml"]
+    encodings = [encoding for encoding in ENCODINGS if encoding != "br" or server.brotli is not None]
+    results = {}
+    async with app_client(server.app) as client:
+        await seed(client)
+        for route in routes:
+            for encoding in encodings:
+                for cached in (False, True):
+                    if encoding == "identity" and cached:
+                        continue
+                    name = encoding if encoding == "identity" else f"{encoding}_{'cached' if cached else 'uncached'}"
+                    result = await measure(client, route, encoding, total, cached)
+                    results.setdefault(route, {})[name] = result
+                    print(f"{route:<36} {name:<16} {result['bytes_per_request']:>9} B  cpu {result['cpu_ms_per_request']:>7.3f} ms",
+                          file=sys.stderr)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Bytes on wire and CPU per request for identity, gzip and brotli responses")
+    parser.add_argument("--requests", type=int, default=300)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args.requests)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
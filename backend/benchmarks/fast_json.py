@@ -0,0 +1,61 @@
+import argparse
+import asyncio
+import json
+import sys
+
+from harness import app_client, drive, summarize
+
+import server
+
+BENCH_PREFIX = "bench-fast-json-"
+ROUTES = ["/api/blogs", f"/api/blogs?limit={server.BLOG_PAGE_MAX_LIMIT}", f"/api/blogs?limit={server.BLOG_PAGE_MAX_LIMIT}&fields=title,content"]
+
+
+async def seed(posts):
+    now = server.datetime.now(server.timezone.utc)
+    operations = [
+        server.UpdateOne(
+            {"slug": f"{BENCH_PREFIX}{index}"},
+            {"$setOnInsert": {
+                "id": f"{BENCH_PREFIX}{index}", "slug": f"{BENCH_PREFIX}{index}", "title": f"Fast JSON bench post {index}",
+                "excerpt": "Notes on moving workloads to the cloud " * 3, "content": "Azure and AWS migration playbook. " * 120,
+                "keywords": "cloud, migration, bench", "meta_description": "Bench post", "author": "TechResona Team",
+                "published": True, "created_at": now - server.timedelta(minutes=index), "updated_at": now,
+            }},
+            upsert=True,
+        )
+        for index in range(posts)
+    ]
+    await server.db.blogs.bulk_write(operations, ordered=False)
+    server.read_cache.clear()
+
+
+async def run(posts, total, concurrency):
+    modes = {"response_model": (False, False), "fast_json": (True, False), "fast_json_validate": (True, True)}
+    results = {}
+    async with app_client(server.app) as client:
+        await seed(posts)
+        for route in ROUTES:
+            for mode, (fast, validate) in modes.items():
+                server.FAST_JSON, server.FAST_JSON_VALIDATE = fast, validate
+                server.serialized_cache.clear()
+                # Warm the read cache so the numbers measure serialization, not Mongo.
+                await drive(client, "GET", route, concurrency, concurrency)
+                latencies, elapsed, errors = await drive(client, "GET", route, total, concurrency, expected_status=200)
+                results.setdefault(route, {})[mode] = {**summarize(latencies, elapsed), "errors": errors}
+                print(f"{mode:>18} {route:<52} {results[route][mode]['throughput_rps']:>9.1f} req/s  "
+                      f"p99 {results[route][mode]['p99_ms']:>7.2f} ms", file=sys.stderr)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="GET /api/blogs throughput with response_model serialization vs the orjson fast path")
+    parser.add_argument("--posts", type=int, default=1000)
+    parser.add_argument("--requests", type=int, default=2000)
+    parser.add_argument("--concurrency", type=int, default=20)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args.posts, args.requests, args.concurrency)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
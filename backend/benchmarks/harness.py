@@ -0,0 +1,183 @@
+import asyncio
+import contextlib
+import multiprocessing
+import os
+import queue
+import secrets
+import statistics
+import sys
+import threading
+import time
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+os.environ.setdefault("DB_NAME", "techresona_bench")
+
+import httpx  # noqa: E402
+import uvicorn  # noqa: E402
+
+
+def percentile(values, pct):
+    if not values:
+        return 0.0
+    ordered = sorted(values)
+    index = min(len(ordered) - 1, max(0, round(pct / 100 * (len(ordered) - 1))))
+    return ordered[index]
+
+
+def summarize(latencies, elapsed=None):
+    """Latencies are in seconds; the summary is in milliseconds."""
+    summary = {
+        "requests": len(latencies),
+        "mean_ms": round(statistics.fmean(latencies) * 1000, 3) if latencies else 0.0,
+        "p50_ms": round(percentile(latencies, 50) * 1000, 3),
+        "p95_ms": round(percentile(latencies, 95) * 1000, 3),
+        "p99_ms": round(percentile(latencies, 99) * 1000, 3),
+    }
+    if elapsed:
+        summary["throughput_rps"] = round(len(latencies) / elapsed, 1)
+    return summary
+
+
+class ThreadedServer:
+    """Runs the app under uvicorn on its own thread and event loop, reachable over real TCP."""
+
+    def __init__(self, app, host="127.0.0.1", port=0):
+        self.host = host
+        self.server = uvicorn.Server(uvicorn.Config(app, host=host, port=port, log_level="warning"))
+        self.thread = threading.Thread(target=self.server.run, daemon=True)
+        self.base_url = None
+
+    def __enter__(self):
+        self.thread.start()
+        while not self.server.started:
+            if not self.thread.is_alive():
+                raise RuntimeError("uvicorn failed to start")
+            time.sleep(0.01)
+        port = self.server.servers[0].sockets[0].getsockname()[1]
+        self.base_url = f"http://{self.host}:{port}"
+        return self
+
+    def __exit__(self, *exc):
+        self.server.should_exit = True
+        self.thread.join(timeout=10)
+
+
+def _serve_process(app, host, setup, args, ready):
+    async def main():
+        result = await setup(*args) if setup else None
+        server = uvicorn.Server(uvicorn.Config(app, host=host, port=0, log_level="warning"))
+        serving = asyncio.create_task(server.serve())
+        while not server.started:
+            if serving.done():
+                await serving
+                raise RuntimeError("uvicorn failed to start")
+            await asyncio.sleep(0.01)
+        ready.put((server.servers[0].sockets[0].getsockname()[1], result))
+        await serving
+
+    asyncio.run(main())
+
+
+class ProcessServer:
+    """Runs the app under uvicorn in a spawned process, so the load generator does not share its GIL.
+
+    ``setup(*args)`` is awaited in the child before the server starts (seed data, swap the
+    database); it must be a module-level coroutine function and its picklable result is
+    available as ``result``.
+    """
+
+    def __init__(self, app="server:app", setup=None, args=(), host="127.0.0.1", timeout=600):
+        context = multiprocessing.get_context("spawn")
+        self.host = host
+        self.timeout = timeout
+        self.ready = context.Queue()
+        self.process = context.Process(target=_serve_process, args=(app, host, setup, args, self.ready), daemon=True)
+        self.base_url = None
+        self.result = None
+
+    def __enter__(self):
+        self.process.start()
+        deadline = time.monotonic() + self.timeout
+        while True:
+            try:
+                port, self.result = self.ready.get(timeout=0.5)
+                break
+            except queue.Empty:
+                if not self.process.is_alive() or time.monotonic() > deadline:
+                    self.process.kill()
+                    raise RuntimeError("server process failed to start")
+        self.base_url = f"http://{self.host}:{port}"
+        return self
+
+    def __exit__(self, *exc):
+        self.process.terminate()
+        self.process.join(timeout=10)
+
+
+def http_client(base_url, **kwargs):
+    limits = httpx.Limits(max_connections=256, max_keepalive_connections=256)
+    return httpx.AsyncClient(base_url=base_url, limits=limits, timeout=60, **kwargs)
+
+
+def app_client(app, **kwargs):
+    return httpx.AsyncClient(transport=httpx.ASGITransport(app=app), base_url="http://bench", **kwargs)
+
+
+BENCH_EMAIL = "bench-admin@techresona.com"
+
+
+def require_bench_database(mongomock=False):
+    """Benchmarks seed data and register an admin, so only run them in memory or against a bench database."""
+    if not mongomock and "bench" not in os.environ["DB_NAME"]:
+        raise SystemExit(f"refusing to run against DB_NAME={os.environ['DB_NAME']!r}; "
+                         "use --mongomock or a database whose name contains 'bench'")
+
+
+@contextlib.asynccontextmanager
+async def bench_admin(client, database=None):
+    """Register a throwaway admin with a random password and yield its auth headers.
+
+    The account is deleted from ``database`` on exit; pass None when the app's database lives in
+    another process and disappears with it (mongomock behind ProcessServer)."""
+    if database is not None:
+        await database.admins.delete_one({"email": BENCH_EMAIL})
+    response = await client.post("/api/auth/register", json={"email": BENCH_EMAIL, "password": secrets.token_urlsafe(24)})
+    response.raise_for_status()
+    try:
+        yield {"Authorization": f"Bearer {response.json()['access_token']}"}
+    finally:
+        if database is not None:
+            await database.admins.delete_one({"email": BENCH_EMAIL})
+
+
+def use_mongomock(server):
+    """Point the app at an in-memory mongomock-motor database instead of MONGO_URL."""
+    from mongomock_motor import AsyncMongoMockClient
+
+    server.client = AsyncMongoMockClient(tz_aware=True)
+    server.db = server.client[os.environ["DB_NAME"]]
+    # mongomock has no change streams.
+    server.cache_sync.mode = "poll"
+
+
+async def drive(client, method, url, total, concurrency, expected_status=None, **kwargs):
+    """Issue ``total`` requests with at most ``concurrency`` in flight; return (latencies, elapsed, errors)."""
+    latencies = []
+    errors = 0
+    remaining = iter(range(total))
+
+    async def worker():
+        nonlocal errors
+        for _ in remaining:
+            started = time.perf_counter()
+            response = await client.request(method, url, **kwargs)
+            latencies.append(time.perf_counter() - started)
+            if expected_status is not None and response.status_code != expected_status:
+                errors += 1
+
+    started = time.perf_counter()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    return latencies, time.perf_counter() - started, errors
@@ -0,0 +1,230 @@
+import argparse
+import asyncio
+import json
+import random
+import sys
+import time
+from collections import Counter
+from typing import Any, Callable, NamedTuple, Optional
+
+from harness import ProcessServer, app_client, bench_admin, http_client, require_bench_database, summarize, use_mongomock
+
+import server
+
+BENCH_PREFIX = "load-"
+PAGES = ["home", "about", "services", "contact", "blog"]
+VOCABULARY = (
+    "cloud migration azure aws kubernetes devops terraform security compliance identity network latency "
+    "cost optimisation landing zone backup disaster recovery monitoring observability serverless container "
+    "pipeline automation governance data warehouse analytics machine learning storage database scaling "
+    "availability resilience incident response zero trust firewall endpoint patching licensing workload"
+).split()
+
+
+class Route(NamedTuple):
+    name: str
+    method: str
+    url: Callable[[random.Random, "SeedData"], str]
+    weight: int
+    admin: bool = False
+    body: Optional[Callable[[random.Random], Any]] = None
+
+
+class SeedData(NamedTuple):
+    slugs: list
+    keyword_ids: list
+
+
+ROUTES = [
+    Route("GET /api/blogs", "GET", lambda rng, data: "/api/blogs", 20),
+    Route("GET /api/blogs?limit=100", "GET", lambda rng, data: f"/api/blogs?limit={server.BLOG_PAGE_MAX_LIMIT}", 4),
+    Route("GET /api/blogs/{slug}", "GET", lambda rng, data: f"/api/blogs/{rng.choice(data.slugs)}", 25),
+    Route("GET /api/blogs/{slug}/related", "GET", lambda rng, data: f"/api/blogs/{rng.choice(data.slugs)}/related", 8),
+    Route("GET /api/blogs/search", "GET", lambda rng, data: f"/api/blogs/search?q={'+'.join(rng.sample(VOCABULARY, 2))}", 6),
+    Route("GET /api/seo/bundle", "GET", lambda rng, data: "/api/seo/bundle", 10),
+    Route("GET /api/seo/{page}", "GET", lambda rng, data: f"/api/seo/{rng.choice(PAGES)}", 6),
+    Route("GET /robots.txt", "GET", lambda rng, data: "/robots.txt", 2),
+    Route("GET /sitemap.xml", "GET", lambda rng, data: "/sitemap.xml", 2),
+    Route("GET /blog/{slug}", "GET", lambda rng, data: f"/blog/{rng.choice(data.slugs)}", 8),
+    Route("GET /api/keywords", "GET", lambda rng, data: "/api/keywords", 2, admin=True),
+    Route("GET /api/keywords?sort=-search_volume", "GET", lambda rng, data: "/api/keywords?sort=-search_volume&limit=200", 1, admin=True),
+    Route("GET /api/keywords/trend", "GET", lambda rng, data: f"/api/keywords/trend?page={rng.choice(PAGES)}", 1, admin=True),
+    Route("GET /api/keywords/{id}/trend", "GET", lambda rng, data: f"/api/keywords/{rng.choice(data.keyword_ids)}/trend", 1, admin=True),
+    Route("GET /api/analytics", "GET", lambda rng, data: "/api/analytics", 1, admin=True),
+    Route("PUT /api/blogs/{slug}", "PUT", lambda rng, data: f"/api/blogs/{rng.choice(data.slugs)}", 1, admin=True,
+          body=lambda rng: {"excerpt": " ".join(rng.choices(VOCABULARY, k=20))}),
+]
+
+
+def synthetic_text(rng, words):
+    return " ".join(rng.choices(VOCABULARY, k=words))
+
+
+async def seed(db, blogs, keywords, history_days, rng):
+    """Replace the bench-prefixed blogs and keywords with a fresh synthetic set; other data is left alone."""
+    started = time.perf_counter()
+    prefix = {"$regex": f"^{BENCH_PREFIX}"}
+    await db.blogs.delete_many({"slug": prefix})
+    await db.blog_related.delete_many({"slug": prefix})
+    await db.keywords.delete_many({"id": prefix})
+    await db.keyword_rankings.delete_many({"keyword_id": prefix})
+    await db.keyword_ranking_rollups.delete_many({"scope": "keyword", "key": prefix})
+
+    now = server.datetime.now(server.timezone.utc)
+    posts = []
+    for index in range(blogs):
+        created_at = now - server.timedelta(hours=index)
+        posts.append({
+            "id": f"{BENCH_PREFIX}{index}", "slug": f"{BENCH_PREFIX}post-{index}", "title": synthetic_text(rng, 6).title(),
+            "excerpt": synthetic_text(rng, 30), "content": "\n\n".join(synthetic_text(rng, 80) for _ in range(rng.randint(4, 12))),
+            "keywords": ", ".join(rng.sample(VOCABULARY, 4)), "meta_description": synthetic_text(rng, 20),
+            "author": "TechResona Team", "published": rng.random() > 0.05, "featured_image": None,
+            "created_at": created_at, "updated_at": created_at,
+        })
+    for start in range(0, len(posts), 1000):
+        await db.blogs.insert_many(posts[start:start + 1000], ordered=False)
+
+    rows = [
+        {"id": f"{BENCH_PREFIX}kw-{index}", "keyword": synthetic_text(rng, 3), "page": rng.choice(PAGES), "ranking": rng.randint(1, 100),
+         "search_volume": rng.randint(10, 50000), "difficulty": rng.choice(["easy", "medium", "hard"]), "tracked_at": now}
+        for index in range(keywords)
+    ]
+    for start in range(0, len(rows), 1000):
+        await db.keywords.insert_many(rows[start:start + 1000], ordered=False)
+    observations = [
+        (row, max(1, row["ranking"] + rng.randint(-5, 5)), now - server.timedelta(days=day))
+        for row in rows for day in range(history_days)
+    ]
+    for start in range(0, len(observations), 1000):
+        await server.record_rankings(observations[start:start + 1000])
+
+    for page in PAGES:
+        await db.seo_settings.update_one(
+            {"page": page},
+            {"$setOnInsert": {"id": f"{BENCH_PREFIX}seo-{page}", "page": page, "title": f"TechResona {page.title()}",
+                              "description": synthetic_text(rng, 25), "keywords": ", ".join(rng.sample(VOCABULARY, 5)), "updated_at": now}},
+            upsert=True
+        )
+    await server.related_posts.rebuild(db)
+    print(f"seeded {blogs} blogs, {keywords} keywords x {history_days} days in {time.perf_counter() - started:.1f}s", file=sys.stderr)
+    return SeedData([post["slug"] for post in posts if post["published"]], [row["id"] for row in rows])
+
+
+async def drive_routes(client, routes, data, total, concurrency, headers, rng):
+    """Issue ``total`` requests picked from ``routes`` by weight; return per-route latencies and statuses, elapsed time
+    and the share of it this process spent on CPU (near 100% means the load generator, not the app, is the limit)."""
+    latencies = {route.name: [] for route in routes}
+    statuses = {route.name: Counter() for route in routes}
+    weights = [route.weight for route in routes]
+    remaining = iter(range(total))
+
+    async def worker():
+        for _ in remaining:
+            route = rng.choices(routes, weights)[0]
+            kwargs = {"headers": headers} if route.admin else {}
+            if route.body:
+                kwargs["json"] = route.body(rng)
+            started = time.perf_counter()
+            response = await client.request(route.method, route.url(rng, data), **kwargs)
+            latencies[route.name].append(time.perf_counter() - started)
+            statuses[route.name][response.status_code] += 1
+
+    started = time.perf_counter()
+    cpu_started = time.process_time()
+    await asyncio.gather(*(worker() for _ in range(concurrency)))
+    elapsed = time.perf_counter() - started
+    return latencies, statuses, elapsed, round((time.process_time() - cpu_started) / elapsed * 100, 1)
+
+
+def route_summary(latencies, statuses, elapsed=None, client_cpu_pct=None):
+    summary = {**summarize(latencies, elapsed), "errors": sum(count for status, count in statuses.items() if status >= 400)}
+    summary["status"] = {str(status): count for status, count in sorted(statuses.items())}
+    if client_cpu_pct is not None:
+        summary["client_cpu_pct"] = client_cpu_pct
+    return summary
+
+
+async def exercise(client, data, args, rng, headers):
+    routes = [route for route in ROUTES if args.routes is None or route.name in args.routes]
+    results = {"routes": {}, "mixed": {}}
+    for route in routes:
+        await drive_routes(client, [route], data, args.concurrency, args.concurrency, headers, rng)
+        latencies, statuses, elapsed, client_cpu = await drive_routes(client, [route], data, args.requests, args.concurrency, headers, rng)
+        summary = results["routes"][route.name] = route_summary(latencies[route.name], statuses[route.name], elapsed, client_cpu)
+        print(f"{route.name:<40} {summary['throughput_rps']:>9.1f} req/s  p50 {summary['p50_ms']:>8.2f}  "
+              f"p95 {summary['p95_ms']:>8.2f}  p99 {summary['p99_ms']:>8.2f} ms  "
+              f"errors {summary['errors']}  client cpu {client_cpu:>5.1f}%", file=sys.stderr)
+    if args.mixed_requests:
+        latencies, statuses, elapsed, client_cpu = await drive_routes(client, routes, data, args.mixed_requests, args.concurrency, headers, rng)
+        everything = [latency for values in latencies.values() for latency in values]
+        results["mixed"]["overall"] = route_summary(everything, sum(statuses.values(), Counter()), elapsed, client_cpu)
+        results["mixed"]["routes"] = {name: route_summary(values, statuses[name]) for name, values in latencies.items() if values}
+        overall = results["mixed"]["overall"]
+        print(f"{'mixed':<40} {overall['throughput_rps']:>9.1f} req/s  p50 {overall['p50_ms']:>8.2f}  "
+              f"p95 {overall['p95_ms']:>8.2f}  p99 {overall['p99_ms']:>8.2f} ms  "
+              f"errors {overall['errors']}  client cpu {client_cpu:>5.1f}%", file=sys.stderr)
+    return results
+
+
+async def prepare(mongomock, skip_seed, blogs, keywords, history_days, seed_value):
+    """Runs where the app runs: choose the database, then seed it or pick up an earlier seed."""
+    if mongomock:
+        use_mongomock(server)
+    if not skip_seed:
+        return tuple(await seed(server.db, blogs, keywords, history_days, random.Random(seed_value)))
+    prefix = {"$regex": f"^{BENCH_PREFIX}"}
+    slugs = [blog["slug"] async for blog in server.db.blogs.find({"slug": prefix, "published": True}, {"slug": 1})]
+    keyword_ids = [keyword["id"] async for keyword in server.db.keywords.find({"id": prefix}, {"id": 1})]
+    if not slugs or not keyword_ids:
+        raise SystemExit("--skip-seed needs an earlier seeded run against the same database")
+    return slugs, keyword_ids
+
+
+async def run(args):
+    rng = random.Random(args.seed)
+    setup = (args.mongomock, args.skip_seed, args.blogs, args.keywords, args.history_days, args.seed)
+    config = {key: value for key, value in vars(args).items() if key != "output"}
+    if args.transport == "asgi":
+        data = SeedData(*await prepare(*setup))
+        # ASGITransport does not run lifespan events, so fire the startup hooks by hand.
+        await server.app.router.startup()
+        try:
+            async with app_client(server.app) as client, bench_admin(client, server.db) as headers:
+                results = await exercise(client, data, args, rng, headers)
+        finally:
+            await server.app.router.shutdown()
+    else:
+        with ProcessServer(setup=prepare, args=setup) as running:
+            # A mongomock database lives in the server process and goes away with it.
+            async with http_client(running.base_url) as client, bench_admin(client, None if args.mongomock else server.db) as headers:
+                results = await exercise(client, SeedData(*running.result), args, rng, headers)
+    return {"config": config, **results}
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Seed synthetic data and report throughput and p50/p95/p99 latency per route")
+    parser.add_argument("--mongomock", action="store_true", help="run against an in-memory mongomock-motor database instead of MONGO_URL")
+    parser.add_argument("--transport", choices=["process", "asgi"], default="process",
+                        help="uvicorn in a separate process over loopback TCP, or the app in-process over ASGI")
+    parser.add_argument("--blogs", type=int, default=1000)
+    parser.add_argument("--keywords", type=int, default=500)
+    parser.add_argument("--history-days", type=int, default=14, help="daily ranking observations seeded per keyword")
+    parser.add_argument("--skip-seed", action="store_true", help="reuse the synthetic data from an earlier run")
+    parser.add_argument("--requests", type=int, default=500, help="requests per route in the isolated phase")
+    parser.add_argument("--mixed-requests", type=int, default=5000, help="requests in the weighted mixed phase; 0 to skip")
+    parser.add_argument("--concurrency", type=int, default=20)
+    parser.add_argument("--routes", nargs="+", choices=[route.name for route in ROUTES], metavar="ROUTE", help="only drive these routes")
+    parser.add_argument("--seed", type=int, default=1, help="random seed for the synthetic data and traffic mix")
+    parser.add_argument("--output", help="write the JSON report here instead of stdout")
+    args = parser.parse_args()
+    require_bench_database(args.mongomock)
+    report = json.dumps(asyncio.run(run(args)), indent=2)
+    if args.output:
+        with open(args.output, "w") as handle:
+            handle.write(report + "\n")
+    else:
+        print(report)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,74 @@
+import argparse
+import asyncio
+import json
+import sys
+
+from harness import BENCH_EMAIL, ThreadedServer, bench_admin, drive, http_client, require_bench_database, summarize
+
+import server
+
+BENCH_SLUG = "bench-login-load-post"
+
+
+class InlineHasher(server.PasswordHasher):
+    """Pre-change behaviour: bcrypt runs directly on the event loop."""
+
+    async def _run(self, func, *args):
+        return func(*args)
+
+
+async def prepare(client, headers):
+    post = {
+        "slug": BENCH_SLUG, "title": "Bench", "excerpt": "Bench", "content": "Bench " * 200,
+        "keywords": "bench", "meta_description": "Bench",
+    }
+    await client.post("/api/blogs", json=post, headers=headers)
+
+
+async def hammer_logins(client, stop):
+    attempt = 0
+    while not stop.is_set():
+        attempt += 1
+        await client.post("/api/auth/login", json={"email": BENCH_EMAIL, "password": f"wrong-{attempt}"})
+
+
+async def scenario(client, name, hasher, limiter, total, concurrency, login_concurrency):
+    server.password_hasher = hasher
+    server.login_rate_limiter = limiter
+    server.read_cache.clear()
+    stop = asyncio.Event()
+    attackers = [asyncio.create_task(hammer_logins(client, stop)) for _ in range(login_concurrency)] if login_concurrency else []
+    await asyncio.sleep(0.2)
+    latencies, elapsed, errors = await drive(client, "GET", f"/api/blogs/{BENCH_SLUG}", total, concurrency, expected_status=200)
+    stop.set()
+    await asyncio.gather(*attackers)
+    result = {**summarize(latencies, elapsed), "errors": errors, "hasher": hasher.stats().model_dump(), "limiter": limiter.stats().model_dump()}
+    print(f"{name:>20}  public p50 {result['p50_ms']:>8.2f} ms  p99 {result['p99_ms']:>8.2f} ms", file=sys.stderr)
+    return result
+
+
+async def run(total, concurrency, login_concurrency):
+    unlimited = dict(limit=10**9, window_seconds=1)
+    with ThreadedServer(server.app) as running:
+        async with http_client(running.base_url) as client, bench_admin(client, server.db) as headers:
+            await prepare(client, headers)
+            return {
+                "idle": await scenario(client, "idle", server.PasswordHasher(), server.SlidingWindowRateLimiter(**unlimited), total, concurrency, 0),
+                "inline_bcrypt": await scenario(client, "inline bcrypt", InlineHasher(), server.SlidingWindowRateLimiter(**unlimited), total, concurrency, login_concurrency),
+                "pooled_bcrypt": await scenario(client, "pooled bcrypt", server.PasswordHasher(), server.SlidingWindowRateLimiter(**unlimited), total, concurrency, login_concurrency),
+                "pooled_rate_limited": await scenario(client, "pooled + rate limit", server.PasswordHasher(), server.SlidingWindowRateLimiter(), total, concurrency, login_concurrency),
+            }
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Public endpoint latency while /api/auth/login is hammered")
+    parser.add_argument("--requests", type=int, default=1000)
+    parser.add_argument("--concurrency", type=int, default=10)
+    parser.add_argument("--login-concurrency", type=int, default=8)
+    args = parser.parse_args()
+    require_bench_database()
+    print(json.dumps(asyncio.run(run(args.requests, args.concurrency, args.login_concurrency)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+import argparse
+import asyncio
+import json
+import os
+import resource
+import subprocess
+import sys
+import time
+from datetime import datetime, timedelta, timezone
+from pathlib import Path
+
+BACKEND_DIR = Path(__file__).resolve().parent.parent
+sys.path.insert(0, str(BACKEND_DIR))
+
+SIZES = [1_000, 100_000, 1_000_000]
+
+
+class SyntheticBlogCursor:
+    """Async iterator shaped like a Motor cursor, producing posts lazily in batches."""
+
+    def __init__(self, count, batch_size=1000):
+        self.count = count
+        self.batch_size = batch_size
+        self.start = datetime(2020, 1, 1, tzinfo=timezone.utc)
+
+    async def __aiter__(self):
+        for offset in range(0, self.count, self.batch_size):
+            await asyncio.sleep(0)
+            for i in range(offset, min(offset + self.batch_size, self.count)):
+                yield {"slug": f"synthetic-post-{i}", "updated_at": (self.start + timedelta(minutes=i)).isoformat()}
+
+    async def to_list(self, length=None):
+        return [blog async for blog in self]
+
+
+async def run_materialized(count):
+    import server
+
+    started = time.perf_counter()
+    blogs = await SyntheticBlogCursor(count).to_list(None)
+    urls = server.static_sitemap_urls()
+    urls.extend(server.blog_sitemap_url(blog['slug'], server.sitemap_lastmod(blog['updated_at'])) for blog in blogs)
+    body = server.render_urlset(urls)
+    ttfb = time.perf_counter() - started
+    return ttfb, time.perf_counter() - started, len(body)
+
+
+async def run_streaming(count):
+    import server
+
+    started = time.perf_counter()
+    ttfb = None
+    size = 0
+    async for chunk in server.stream_urlset(SyntheticBlogCursor(count), server.static_sitemap_urls()):
+        if ttfb is None:
+            ttfb = time.perf_counter() - started
+        size += len(chunk)
+    return ttfb, time.perf_counter() - started, size
+
+
+def worker(mode, count):
+    baseline_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    runner = run_streaming if mode == "streaming" else run_materialized
+    ttfb, total, size = asyncio.run(runner(count))
+    peak_kb = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+    print(json.dumps({
+        "mode": mode,
+        "posts": count,
+        "ttfb_ms": round(ttfb * 1000, 2),
+        "total_ms": round(total * 1000, 2),
+        "bytes": size,
+        "peak_rss_mb": round(peak_kb / 1024, 1),
+        "rss_growth_mb": round((peak_kb - baseline_kb) / 1024, 1),
+    }))
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Compare materialized vs streaming sitemap generation")
+    parser.add_argument("--sizes", type=int, nargs="+", default=SIZES)
+    parser.add_argument("--worker", nargs=2, metavar=("MODE", "COUNT"), help=argparse.SUPPRESS)
+    args = parser.parse_args()
+
+    if args.worker:
+        worker(args.worker[0], int(args.worker[1]))
+        return
+
+    # Each measurement runs in a fresh interpreter so ru_maxrss reflects that run only.
+    results = []
+    for count in args.sizes:
+        for mode in ("materialized", "streaming"):
+            output = subprocess.run(
+                [sys.executable, __file__, "--worker", mode, str(count)],
+                check=True, capture_output=True, text=True, cwd=BACKEND_DIR, env=os.environ.copy(),
+            ).stdout
+            result = json.loads(output.strip().splitlines()[-1])
+            results.append(result)
+            print(f"{mode:>13} {count:>9} posts  ttfb {result['ttfb_ms']:>10.2f} ms  "
+                  f"total {result['total_ms']:>10.2f} ms  peak rss {result['peak_rss_mb']:>8.1f} MB", file=sys.stderr)
+    print(json.dumps(results, indent=2))
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,92 @@
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+from harness import ThreadedServer, http_client, summarize
+
+import server
+
+BOT_USER_AGENT = "Mozilla/5.0 (compatible; Googlebot/2.1; +http://www.google.com/bot.html)"
+BENCH_SLUG = "bench-ssr-post"
+ROUTES = ["/", "/about", "/blog", f"/blog/{BENCH_SLUG}"]
+
+
+async def seed():
+    now = server.datetime.now(server.timezone.utc)
+    for page in ("home", "about", "blog"):
+        await server.db.seo_settings.update_one(
+            {"page": page},
+            {"$setOnInsert": {"id": f"bench-{page}", "page": page, "title": f"Bench {page}", "description": "Bench description",
+                              "json_ld": {"@context": "https://schema.org", "@type": "WebPage", "name": page}, "updated_at": now}},
+            upsert=True
+        )
+    await server.db.blogs.update_one(
+        {"slug": BENCH_SLUG},
+        {"$setOnInsert": {"id": BENCH_SLUG, "slug": BENCH_SLUG, "title": "Bench SSR post", "excerpt": "Bench", "content": "Paragraph.\n\n" * 200,
+                          "keywords": "bench", "meta_description": "Bench", "author": "TechResona Team", "published": True,
+                          "created_at": now, "updated_at": now}},
+        upsert=True
+    )
+
+
+async def first_meaningful_byte(client, url):
+    """Seconds until the response bytes containing </head> (i.e. every meta tag) have arrived."""
+    started = time.perf_counter()
+    received = b""
+    async with client.stream("GET", url, headers={"User-Agent": BOT_USER_AGENT}) as response:
+        async for chunk in response.aiter_bytes():
+            received += chunk
+            if b"</head>" in received:
+                break
+    return time.perf_counter() - started
+
+
+async def measure(client, url, total, cold):
+    latencies = []
+    for _ in range(total):
+        if cold:
+            server.read_cache.clear()
+        latencies.append(await first_meaningful_byte(client, url))
+    return summarize(latencies)
+
+
+async def api_metadata(client, route, total):
+    # What a JS-executing crawler waits on after downloading the bundle: the SEO API round trip.
+    page = server.PRERENDERED_PAGES.get(route, "blog")
+    url = f"/api/seo/{page}" if route in server.PRERENDERED_PAGES else f"/api/blogs/{route.rsplit('/', 1)[-1]}"
+    latencies = []
+    for _ in range(total):
+        started = time.perf_counter()
+        (await client.get(url, headers={"User-Agent": BOT_USER_AGENT})).raise_for_status()
+        latencies.append(time.perf_counter() - started)
+    return summarize(latencies)
+
+
+async def run(total):
+    await seed()
+    results = {}
+    with ThreadedServer(server.app) as running:
+        async with http_client(running.base_url) as client:
+            for route in ROUTES:
+                results[route] = {
+                    "ssr_cold": await measure(client, route, total, cold=True),
+                    "ssr_warm": await measure(client, route, total, cold=False),
+                    "client_side_api_only": await api_metadata(client, route, total),
+                }
+                print(f"{route:<24} cold p50 {results[route]['ssr_cold']['p50_ms']:>7.2f} ms  "
+                      f"warm p50 {results[route]['ssr_warm']['p50_ms']:>7.2f} ms  "
+                      f"api-only p50 {results[route]['client_side_api_only']['p50_ms']:>7.2f} ms", file=sys.stderr)
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Time to first meaningful byte (all meta tags received) for bot user agents")
+    parser.add_argument("--requests", type=int, default=200)
+    args = parser.parse_args()
+    print(json.dumps(asyncio.run(run(args.requests)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
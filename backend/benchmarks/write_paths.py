@@ -0,0 +1,129 @@
+import argparse
+import asyncio
+import json
+import sys
+import time
+
+from harness import summarize, use_mongomock
+
+import server
+
+BENCH_SLUG = "bench-write-paths-post"
+
+
+async def update_blog_before(db, index):
+    # Pre-change update_blog: existence check, update, then re-read the document.
+    if not await db.blogs.find_one({"slug": BENCH_SLUG}, {"_id": 0}):
+        raise LookupError(BENCH_SLUG)
+    await db.blogs.update_one({"slug": BENCH_SLUG}, {"$set": {"excerpt": f"Revision {index}", "updated_at": server.datetime.now(server.timezone.utc)}})
+    return await db.blogs.find_one({"slug": BENCH_SLUG}, {"_id": 0})
+
+
+async def update_blog_after(db, index):
+    return await db.blogs.find_one_and_update(
+        {"slug": BENCH_SLUG},
+        {"$set": {"excerpt": f"Revision {index}", "updated_at": server.datetime.now(server.timezone.utc)}},
+        projection={"_id": 0},
+        return_document=server.ReturnDocument.AFTER
+    )
+
+
+def bench_email(mode, index):
+    return f"bench-write-paths-{mode}-{index}@techresona.com"
+
+
+async def register_admin_before(db, index):
+    # Pre-change register_admin: look the email up, then insert.
+    email = bench_email("before", index)
+    if await db.admins.find_one({"email": email}, {"_id": 0}):
+        raise ValueError(email)
+    await db.admins.insert_one({"email": email, "password_hash": "x"})
+
+
+async def register_admin_after(db, index):
+    try:
+        await db.admins.insert_one({"email": bench_email("after", index), "password_hash": "x"})
+    except server.DuplicateKeyError:
+        raise ValueError(index)
+
+
+async def update_robots_before(db, index):
+    await db.robots_txt.delete_many({})
+    await db.robots_txt.insert_one({"id": f"robots-{index}", "content": f"User-agent: *\nAllow: /\n# {index}", "updated_at": server.datetime.now(server.timezone.utc)})
+
+
+async def update_robots_after(db, index):
+    return await db.robots_txt.find_one_and_update(
+        {"_id": server.ROBOTS_TXT_DOC_ID},
+        {"$set": {"content": f"User-agent: *\nAllow: /\n# {index}", "updated_at": server.datetime.now(server.timezone.utc)},
+         "$setOnInsert": {"id": f"robots-{index}"}},
+        projection={"_id": 0},
+        upsert=True,
+        return_document=server.ReturnDocument.AFTER
+    )
+
+
+PATHS = {
+    "update_blog": (update_blog_before, update_blog_after),
+    "register_admin": (register_admin_before, register_admin_after),
+    "update_robots_txt": (update_robots_before, update_robots_after),
+}
+
+
+async def prepare(db):
+    await server.ensure_indexes(db)
+    now = server.datetime.now(server.timezone.utc)
+    await db.blogs.update_one(
+        {"slug": BENCH_SLUG},
+        {"$setOnInsert": {"id": BENCH_SLUG, "slug": BENCH_SLUG, "title": "Write path bench", "excerpt": "Bench", "content": "Bench " * 200,
+                          "keywords": "bench", "meta_description": "Bench", "author": "TechResona Team", "published": False,
+                          "created_at": now, "updated_at": now}},
+        upsert=True
+    )
+
+
+async def measure(db, operation, total):
+    """Sequential calls so each latency is one request's worth of round-trips; commands are counted by the driver listener."""
+    latencies = []
+    commands = []
+    token = server.request_mongo_commands.set(commands)
+    try:
+        for index in range(total):
+            started = time.perf_counter()
+            await operation(db, index)
+            latencies.append(time.perf_counter() - started)
+    finally:
+        server.request_mongo_commands.reset(token)
+    result = summarize(latencies)
+    if commands:
+        result["mongo_commands_per_call"] = round(len(commands) / total, 2)
+    return result
+
+
+async def run(total):
+    db = server.db
+    await prepare(db)
+    results = {}
+    for name, (before, after) in PATHS.items():
+        for mode, operation in (("before", before), ("after", after)):
+            await db.admins.delete_many({"email": {"$regex": "^bench-write-paths-"}})
+            results.setdefault(name, {})[mode] = await measure(db, operation, total)
+            result = results[name][mode]
+            print(f"{name:<26} {mode:>6}  p50 {result['p50_ms']:>7.3f} ms  p99 {result['p99_ms']:>7.3f} ms  "
+                  f"commands {result.get('mongo_commands_per_call', 'n/a')}", file=sys.stderr)
+    await db.admins.delete_many({"email": {"$regex": "^bench-write-paths-"}})
+    return results
+
+
+def main():
+    parser = argparse.ArgumentParser(description="Latency and MongoDB round-trips of the write paths before and after the atomic rewrites")
+    parser.add_argument("--requests", type=int, default=500)
+    parser.add_argument("--mongomock", action="store_true", help="in-memory mongomock-motor; it emits no command events, so only latency is reported")
+    args = parser.parse_args()
+    if args.mongomock:
+        use_mongomock(server)
+    print(json.dumps(asyncio.run(run(args.requests)), indent=2))
+
+
+if __name__ == "__main__":
+    main()
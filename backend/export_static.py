@@ -0,0 +1,132 @@
+import argparse
+import asyncio
+import gzip
+import hashlib
+import json
+import os
+from datetime import datetime, timezone
+from pathlib import Path
+
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+import server
+
+MANIFEST = "manifest.json"
+DEFAULT_OUT_DIR = os.environ.get("STATIC_EXPORT_DIR", str(server.ROOT_DIR / "static_export"))
+
+def page_path(route: str) -> str:
+    return "index.html" if route == "/" else f"{route.strip('/')}/index.html"
+
+def compressed_variants(path: str, body: bytes):
+    yield path, body
+    yield f"{path}.gz", gzip.compress(body, compresslevel=9, mtime=0)
+    if brotli is not None:
+        yield f"{path}.br", brotli.compress(body, quality=11)
+
+class StaticExport:
+    """Writes export files and tracks them in the manifest.
+
+    JSON payloads get content-hashed names so a CDN can cache them forever; HTML routes,
+    robots.txt and sitemaps keep the names crawlers request. Files whose bytes match the
+    previous export are left untouched."""
+
+    def __init__(self, out_dir: Path, previous: dict):
+        self.out_dir = out_dir
+        self.previous = previous.get("files", {})
+        self.files = {}
+        self.written = 0
+        self.unchanged = 0
+        self.removed = 0
+
+    def write(self, logical: str, body: bytes, hashed: bool = False):
+        digest = hashlib.sha256(body).hexdigest()[:12]
+        if hashed:
+            stem, _, ext = logical.rpartition(".")
+            path = f"{stem}.{digest}.{ext}"
+        else:
+            path = logical
+        self.files[logical] = {"path": path, "sha256": digest, "bytes": len(body)}
+        old = self.previous.get(logical)
+        if old and old["sha256"] == digest and (self.out_dir / path).exists():
+            self.unchanged += 1
+            return
+        for name, data in compressed_variants(path, body):
+            target = self.out_dir / name
+            target.parent.mkdir(parents=True, exist_ok=True)
+            tmp = target.with_name(f".{target.name}.tmp")
+            tmp.write_bytes(data)
+            tmp.replace(target)
+        if old and old["path"] != path:
+            self._unlink(old["path"])
+        self.written += 1
+
+    def finish(self, live: set):
+        # Entries not rewritten this run are carried over while their source still exists.
+        for logical, entry in self.previous.items():
+            if logical in self.files:
+                continue
+            if logical in live:
+                self.files[logical] = entry
+            else:
+                self._unlink(entry["path"])
+                self.removed += 1
+
+    def _unlink(self, path: str):
+        for suffix in ("", ".gz", ".br"):
+            (self.out_dir / f"{path}{suffix}").unlink(missing_ok=True)
+
+async def export(out_dir: Path, incremental: bool):
+    db = server.db
+    started = datetime.now(timezone.utc)
+    manifest_path = out_dir / MANIFEST
+    previous = json.loads(manifest_path.read_text()) if manifest_path.exists() else {}
+    since = datetime.fromisoformat(previous["generated_at"]) if incremental and previous else None
+    print(f"Exporting static site to {out_dir}{f' (changes since {since.isoformat()})' if since else ''}...")
+    if brotli is None:
+        print("! brotli is not installed; writing gzip variants only")
+
+    output = StaticExport(out_dir, previous)
+    live = set()
+    changed = {"updated_at": {"$gte": since}} if since else {}
+
+    published = [blog["slug"] async for blog in db.blogs.find({"published": True}, {"_id": 0, "slug": 1})]
+    for slug in published:
+        live.update({f"api/blogs/{slug}.json", page_path(f"/blog/{slug}")})
+    async for blog in db.blogs.find({"published": True, **changed}, {"_id": 0}):
+        output.write(f"api/blogs/{blog['slug']}.json", server.Blog(**blog).model_dump_json().encode("utf-8"), hashed=True)
+        output.write(page_path(f"/blog/{blog['slug']}"), server.render_blog_page(blog))
+    print(f"✓ blogs: {len(published)} published")
+
+    pages = [setting["page"] async for setting in db.seo_settings.find({}, {"_id": 0, "page": 1})]
+    live.update(f"api/seo/{page}.json" for page in pages)
+    async for setting in db.seo_settings.find(changed, {"_id": 0}):
+        output.write(f"api/seo/{setting['page']}.json", server.SEOSettings(**setting).model_dump_json().encode("utf-8"), hashed=True)
+    print(f"✓ seo_settings: {len(pages)} pages")
+
+    # Aggregates depend on many documents; they are cheap to rebuild and only rewritten if their bytes change.
+    output.write("api/seo/bundle.json", (await server.load_seo_bundle()).value, hashed=True)
+    for route in server.PRERENDERED_PAGES:
+        output.write(page_path(route), (await server.load_page_html(route)).value)
+    robots = await server.load_robots_txt()
+    output.write("robots.txt", robots.value.encode("utf-8"))
+    for name, document in (await server.SitemapCache().documents()).items():
+        output.write(name, document.body)
+    print("✓ aggregates: seo bundle, page shells, robots.txt, sitemap")
+
+    output.finish(live)
+    manifest = {"generated_at": started.isoformat(), "files": dict(sorted(output.files.items()))}
+    out_dir.mkdir(parents=True, exist_ok=True)
+    tmp = out_dir / f".{MANIFEST}.tmp"
+    tmp.write_text(json.dumps(manifest, indent=2))
+    tmp.replace(manifest_path)
+    print(f"\n✅ Static export completed: {output.written} written, {output.unchanged} unchanged, {output.removed} removed")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Snapshot blogs, SEO pages, robots.txt and the sitemap into pre-compressed static files")
+    parser.add_argument("--out", default=DEFAULT_OUT_DIR, help="output directory")
+    parser.add_argument("--incremental", action="store_true", help="only re-export documents updated since the last export")
+    args = parser.parse_args()
+    asyncio.run(export(Path(args.out), args.incremental))
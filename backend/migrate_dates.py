@@ -0,0 +1,87 @@
+import argparse
+import asyncio
+import os
+from datetime import datetime, timezone
+
+from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import UpdateOne
+
+mongo_url = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
+db_name = os.environ.get('DB_NAME', 'test_database')
+
+client = AsyncIOMotorClient(mongo_url, tz_aware=True)
+db = client[db_name]
+
+DATE_FIELDS = {
+    "admins": ["created_at"],
+    "seo_settings": ["updated_at"],
+    "robots_txt": ["updated_at"],
+    "blogs": ["created_at", "updated_at"],
+    "keywords": ["tracked_at"],
+}
+
+def parse_timestamp(value: str):
+    try:
+        parsed = datetime.fromisoformat(value)
+    except ValueError:
+        return None
+    if parsed.tzinfo is None:
+        parsed = parsed.replace(tzinfo=timezone.utc)
+    return parsed
+
+def report_unparseable(collection: str, field: str, doc: dict):
+    print(f"  ! {collection}.{field}: unparseable value {doc[field]!r} on _id={doc['_id']}")
+
+async def count_convertible(collection: str, field: str, batch_size: int):
+    # A dry run changes nothing, so one cursor sees every string value exactly once.
+    convertible = 0
+    async for doc in db[collection].find({field: {"$type": "string"}}, {"_id": 1, field: 1}).batch_size(batch_size):
+        if parse_timestamp(doc[field]) is None:
+            report_unparseable(collection, field, doc)
+        else:
+            convertible += 1
+    return convertible
+
+async def migrate_field(collection: str, field: str, batch_size: int, pause: float, dry_run: bool):
+    if dry_run:
+        return await count_convertible(collection, field, batch_size)
+    converted = 0
+    skipped = set()
+    while True:
+        query = {field: {"$type": "string"}}
+        if skipped:
+            query["_id"] = {"$nin": list(skipped)}
+        docs = await db[collection].find(query, {"_id": 1, field: 1}).limit(batch_size).to_list(batch_size)
+        if not docs:
+            break
+        operations = []
+        for doc in docs:
+            parsed = parse_timestamp(doc[field])
+            if parsed is None:
+                skipped.add(doc["_id"])
+                report_unparseable(collection, field, doc)
+                continue
+            # Match on the original string so a concurrent write that already stored a date wins.
+            operations.append(UpdateOne({"_id": doc["_id"], field: doc[field]}, {"$set": {field: parsed}}))
+        if operations:
+            result = await db[collection].bulk_write(operations, ordered=False)
+            converted += result.modified_count
+        if pause:
+            await asyncio.sleep(pause)
+    return converted
+
+async def migrate(batch_size: int, pause: float, dry_run: bool):
+    print(f"Converting ISO string timestamps to BSON dates in {db_name}{' (dry run)' if dry_run else ''}...")
+    for collection, fields in DATE_FIELDS.items():
+        for field in fields:
+            converted = await migrate_field(collection, field, batch_size, pause, dry_run)
+            print(f"✓ {collection}.{field}: {converted} documents {'would be ' if dry_run else ''}converted")
+    print("\n✅ Timestamp migration completed!")
+
+if __name__ == "__main__":
+    parser = argparse.ArgumentParser(description="Convert string timestamps to native BSON dates in batches")
+    parser.add_argument("--batch-size", type=int, default=500)
+    parser.add_argument("--pause", type=float, default=0.0, help="seconds to sleep between batches to limit load")
+    parser.add_argument("--dry-run", action="store_true")
+    args = parser.parse_args()
+    asyncio.run(migrate(args.batch_size, args.pause, args.dry_run))
@@ -0,0 +1,21 @@
+import asyncio
+import os
+
+from motor.motor_asyncio import AsyncIOMotorClient
+
+from server import related_posts
+
+mongo_url = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
+db_name = os.environ.get('DB_NAME', 'test_database')
+
+client = AsyncIOMotorClient(mongo_url, tz_aware=True)
+db = client[db_name]
+
+async def rebuild():
+    print(f"Rebuilding related posts for {db_name}...")
+    count = await related_posts.rebuild(db)
+    print(f"✓ {count} published posts indexed ({related_posts.dim}-dim hashed TF-IDF, top {related_posts.top_n})")
+    print("\n✅ Related posts rebuild completed!")
+
+if __name__ == "__main__":
+    asyncio.run(rebuild())
@@ -3,31 +3,35 @@ import os
 from motor.motor_asyncio import AsyncIOMotorClient
 from datetime import datetime, timezone
 from passlib.context import CryptContext
+from pymongo.errors import DuplicateKeyError
+from server import ROBOTS_TXT_DOC_ID, ensure_indexes, related_posts
 
 pwd_context = CryptContext(schemes=["bcrypt"], deprecated="auto")
 
 mongo_url = os.environ.get('MONGO_URL', 'mongodb://localhost:27017')
 db_name = os.environ.get('DB_NAME', 'test_database')
 
-client = AsyncIOMotorClient(mongo_url)
+client = AsyncIOMotorClient(mongo_url, tz_aware=True)
 db = client[db_name]
 
 async def seed_database():
     print("Starting database seeding...")
     
-    admin_email = "admin@techresona.com"
-    existing_admin = await db.admins.find_one({"email": admin_email})
+    for collection, indexes in (await ensure_indexes(db)).items():
+        for name, state in indexes.items():
+            print(f"✓ Index {collection}.{name}: {state}")
     
-    if not existing_admin:
-        admin_data = {
-            "id": "admin-001",
-            "email": admin_email,
-            "password_hash": pwd_context.hash("admin123"),
-            "created_at": datetime.now(timezone.utc).isoformat()
-        }
+    admin_email = "admin@techresona.com"
+    admin_data = {
+        "id": "admin-001",
+        "email": admin_email,
+        "password_hash": pwd_context.hash("admin123"),
+        "created_at": datetime.now(timezone.utc)
+    }
+    try:
         await db.admins.insert_one(admin_data)
         print(f"✓ Created admin user: {admin_email} / admin123")
-    else:
+    except DuplicateKeyError:
         print(f"✓ Admin user already exists: {admin_email}")
     
     blogs = [
@@ -42,8 +46,8 @@ async def seed_database():
             "author": "TechResona Team",
             "published": True,
             "featured_image": "https://images.unsplash.com/photo-1451187580459-43490279c0fa?crop=entropy&cs=srgb&fm=jpg&q=85",
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "updated_at": datetime.now(timezone.utc).isoformat()
+            "created_at": datetime.now(timezone.utc),
+            "updated_at": datetime.now(timezone.utc)
         },
         {
             "id": "blog-002",
@@ -56,8 +60,8 @@ async def seed_database():
             "author": "TechResona Team",
             "published": True,
             "featured_image": "https://images.unsplash.com/photo-1460925895917-afdab827c52f?crop=entropy&cs=srgb&fm=jpg&q=85",
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "updated_at": datetime.now(timezone.utc).isoformat()
+            "created_at": datetime.now(timezone.utc),
+            "updated_at": datetime.now(timezone.utc)
         },
         {
             "id": "blog-003",
@@ -70,8 +74,8 @@ async def seed_database():
             "author": "TechResona Team",
             "published": True,
             "featured_image": "https://images.unsplash.com/photo-1432888622747-4eb9a8a2c293?crop=entropy&cs=srgb&fm=jpg&q=85",
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "updated_at": datetime.now(timezone.utc).isoformat()
+            "created_at": datetime.now(timezone.utc),
+            "updated_at": datetime.now(timezone.utc)
         },
         {
             "id": "blog-004",
@@ -84,8 +88,8 @@ async def seed_database():
             "author": "TechResona Team",
             "published": True,
             "featured_image": "https://images.unsplash.com/photo-1553877522-43269d4ea984?crop=entropy&cs=srgb&fm=jpg&q=85",
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "updated_at": datetime.now(timezone.utc).isoformat()
+            "created_at": datetime.now(timezone.utc),
+            "updated_at": datetime.now(timezone.utc)
         },
         {
             "id": "blog-005",
@@ -98,17 +102,16 @@ async def seed_database():
             "author": "TechResona Team",
             "published": True,
             "featured_image": "https://images.unsplash.com/photo-1522071820081-009f0129c71c?crop=entropy&cs=srgb&fm=jpg&q=85",
-            "created_at": datetime.now(timezone.utc).isoformat(),
-            "updated_at": datetime.now(timezone.utc).isoformat()
+            "created_at": datetime.now(timezone.utc),
+            "updated_at": datetime.now(timezone.utc)
         }
     ]
     
     for blog in blogs:
-        existing = await db.blogs.find_one({"slug": blog["slug"]})
-        if not existing:
+        try:
             await db.blogs.insert_one(blog)
             print(f"✓ Created blog: {blog['title']}")
-        else:
+        except DuplicateKeyError:
             print(f"✓ Blog already exists: {blog['title']}")
     
     default_seo_settings = [
@@ -136,30 +139,31 @@ async def seed_database():
                     "contactType": "customer service"
                 }
             },
-            "updated_at": datetime.now(timezone.utc).isoformat()
+            "updated_at": datetime.now(timezone.utc)
         }
     ]
     
     for seo in default_seo_settings:
-        existing = await db.seo_settings.find_one({"page": seo["page"]})
-        if not existing:
+        try:
             await db.seo_settings.insert_one(seo)
             print(f"✓ Created SEO settings for: {seo['page']}")
-        else:
+        except DuplicateKeyError:
             print(f"✓ SEO settings already exist for: {seo['page']}")
     
     default_robots = {
         "id": "robots-001",
         "content": "User-agent: *\\nAllow: /\\nDisallow: /admin\\n\\nSitemap: https://seo-llm-connect.preview.emergentagent.com/sitemap.xml",
-        "updated_at": datetime.now(timezone.utc).isoformat()
+        "updated_at": datetime.now(timezone.utc)
     }
     
-    existing_robots = await db.robots_txt.find_one({})
-    if not existing_robots:
-        await db.robots_txt.insert_one(default_robots)
-        print("✓ Created robots.txt")
-    else:
+    if await db.robots_txt.find_one({}, {"_id": 1}):
         print("✓ robots.txt already exists")
+    else:
+        await db.robots_txt.update_one({"_id": ROBOTS_TXT_DOC_ID}, {"$setOnInsert": default_robots}, upsert=True)
+        print("✓ Created robots.txt")
+    
+    related_count = await related_posts.rebuild(db)
+    print(f"✓ Rebuilt related posts for {related_count} published blogs")
     
     print("\\n✅ Database seeding completed!")
     print("\\nAdmin Login Credentials:")
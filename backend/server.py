@@ -1,26 +1,59 @@
-from fastapi import FastAPI, APIRouter, HTTPException, Depends, status
-from fastapi.responses import Response, PlainTextResponse
+from fastapi import FastAPI, APIRouter, HTTPException, Depends, Query, Request, status
+from fastapi.responses import Response, HTMLResponse, PlainTextResponse, StreamingResponse
 from fastapi.security import HTTPBearer, HTTPAuthorizationCredentials
 from dotenv import load_dotenv
 from starlette.middleware.cors import CORSMiddleware
+from starlette.datastructures import Headers, MutableHeaders
 from motor.motor_asyncio import AsyncIOMotorClient
+from pymongo import ASCENDING, DESCENDING, IndexModel, InsertOne, ReplaceOne, ReturnDocument, UpdateOne, monitoring
+from pymongo.read_preferences import Nearest, Primary, PrimaryPreferred, Secondary, SecondaryPreferred
+from pymongo.errors import BulkWriteError, ConnectionFailure, DuplicateKeyError, OperationFailure, PyMongoError
 import os
+import asyncio
+import bisect
+import contextvars
+import gzip
+import hmac
+import ipaddress
 import logging
+import threading
+import time
+import csv
+import io
+import json
+import base64
+import functools
+import hashlib
+import math
+import re
+from collections import OrderedDict, deque
+from concurrent.futures import ThreadPoolExecutor
+from email.utils import format_datetime, parsedate_to_datetime
 from pathlib import Path
-from pydantic import BaseModel, Field, ConfigDict, EmailStr
-from typing import List, Optional, Dict, Any
+from pydantic import BaseModel, Field, ConfigDict, EmailStr, TypeAdapter, ValidationError
+from typing import List, Optional, Dict, Any, Tuple, Hashable, Callable, Awaitable, NamedTuple
+from xml.sax.saxutils import escape
+from urllib.parse import quote
 import uuid
+import zlib
+import numpy as np
 from datetime import datetime, timezone, timedelta
 from passlib.context import CryptContext
 from jose import JWTError, jwt
 
+try:
+    import brotli
+except ImportError:
+    brotli = None
+
+try:
+    import orjson
+except ImportError:
+    orjson = None
+
 ROOT_DIR = Path(__file__).parent
 load_dotenv(ROOT_DIR / '.env')
 
-mongo_url = os.environ['MONGO_URL']
-client = AsyncIOMotorClient(mongo_url)
-db = client[os.environ['DB_NAME']]
-
 app = FastAPI()
 api_router = APIRouter(prefix="/api")
 
@@ -30,6 +63,316 @@ SECRET_KEY = os.environ.get("SECRET_KEY", "techresona-secret-key-change-in-produ
 ALGORITHM = "HS256"
 ACCESS_TOKEN_EXPIRE_MINUTES = 30
 
+SITE_URL = os.environ.get("SITE_URL", "https://seo-llm-connect.preview.emergentagent.com").rstrip('/')
+SITEMAP_MAX_URLS = int(os.environ.get("SITEMAP_MAX_URLS", "50000"))
+SITEMAP_CACHE_DIR = os.environ.get("SITEMAP_CACHE_DIR")
+SITEMAP_STREAMING = os.environ.get("SITEMAP_STREAMING", "false").lower() == "true"
+SITEMAP_STREAM_BATCH_SIZE = int(os.environ.get("SITEMAP_STREAM_BATCH_SIZE", "1000"))
+COMPRESSION_MIN_SIZE = int(os.environ.get("COMPRESSION_MIN_SIZE", "1024"))
+COMPRESSION_GZIP_LEVEL = int(os.environ.get("COMPRESSION_GZIP_LEVEL", "6"))
+COMPRESSION_BROTLI_QUALITY = int(os.environ.get("COMPRESSION_BROTLI_QUALITY", "5"))
+COMPRESSION_CACHE_MAX_ENTRIES = int(os.environ.get("COMPRESSION_CACHE_MAX_ENTRIES", "512"))
+COMPRESSION_CACHE_MAX_BODY = int(os.environ.get("COMPRESSION_CACHE_MAX_BODY", str(1024 * 1024)))
+FAST_JSON = os.environ.get("FAST_JSON", "false").lower() == "true"
+FAST_JSON_VALIDATE = os.environ.get("FAST_JSON_VALIDATE", "false").lower() == "true"
+SERIALIZED_CACHE_MAX_ENTRIES = int(os.environ.get("SERIALIZED_CACHE_MAX_ENTRIES", "512"))
+METRICS_TOKEN = os.environ.get("METRICS_TOKEN")
+# /metrics is served on the public app, so it only exists once a scrape token is configured.
+METRICS_ENABLED = os.environ.get("METRICS_ENABLED", "true").lower() == "true" and bool(METRICS_TOKEN)
+METRICS_LATENCY_BUCKETS = (0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0, 10.0)
+METRICS_OPERATION_BUCKETS = (0, 1, 2, 3, 4, 6, 8, 12, 16, 32, 64)
+MONGO_MAX_POOL_SIZE = int(os.environ.get("MONGO_MAX_POOL_SIZE", "100"))
+MONGO_MIN_POOL_SIZE = int(os.environ.get("MONGO_MIN_POOL_SIZE", "5"))
+MONGO_MAX_IDLE_TIME_MS = int(os.environ.get("MONGO_MAX_IDLE_TIME_MS", "0")) or None
+MONGO_SERVER_SELECTION_TIMEOUT_MS = int(os.environ.get("MONGO_SERVER_SELECTION_TIMEOUT_MS", "5000"))
+MONGO_CONNECT_TIMEOUT_MS = int(os.environ.get("MONGO_CONNECT_TIMEOUT_MS", "5000"))
+MONGO_SOCKET_TIMEOUT_MS = int(os.environ.get("MONGO_SOCKET_TIMEOUT_MS", "30000")) or None
+MONGO_WAIT_QUEUE_TIMEOUT_MS = int(os.environ.get("MONGO_WAIT_QUEUE_TIMEOUT_MS", "5000")) or None
+MONGO_PUBLIC_READ_PREFERENCE = os.environ.get("MONGO_PUBLIC_READ_PREFERENCE", "primary")
+MONGO_MAX_STALENESS_SECONDS = int(os.environ.get("MONGO_MAX_STALENESS_SECONDS", "-1"))
+PRIMARY_READ_AFTER_WRITE_SECONDS = float(os.environ.get("PRIMARY_READ_AFTER_WRITE_SECONDS", "15"))
+READINESS_PING_TIMEOUT_SECONDS = float(os.environ.get("READINESS_PING_TIMEOUT_SECONDS", "2"))
+CACHE_SYNC_MODE = os.environ.get("CACHE_SYNC_MODE", "auto").lower()
+CACHE_SYNC_POLL_INTERVAL_SECONDS = float(os.environ.get("CACHE_SYNC_POLL_INTERVAL_SECONDS", "2"))
+CACHE_SYNC_POLL_LOOKBACK_SECONDS = float(os.environ.get("CACHE_SYNC_POLL_LOOKBACK_SECONDS", "5"))
+CACHE_SYNC_RETRY_SECONDS = float(os.environ.get("CACHE_SYNC_RETRY_SECONDS", "5"))
+CACHE_SYNC_TOMBSTONE_TTL_SECONDS = int(os.environ.get("CACHE_SYNC_TOMBSTONE_TTL_SECONDS", "86400"))
+COMPRESSIBLE_TYPES = ("application/json", "application/xml", "application/x-ndjson", "application/javascript", "image/svg+xml", "text/")
+CACHE_MAX_ENTRIES = int(os.environ.get("CACHE_MAX_ENTRIES", "2048"))
+CACHE_TTL_SECONDS = float(os.environ.get("CACHE_TTL_SECONDS", "300"))
+ADMIN_CACHE_TTL_SECONDS = float(os.environ.get("ADMIN_CACHE_TTL_SECONDS", "60"))
+ADMIN_CACHE_MAX_ENTRIES = int(os.environ.get("ADMIN_CACHE_MAX_ENTRIES", "256"))
+ANALYTICS_SNAPSHOT_TTL_SECONDS = float(os.environ.get("ANALYTICS_SNAPSHOT_TTL_SECONDS", "30"))
+KEYWORD_BULK_BATCH_SIZE = int(os.environ.get("KEYWORD_BULK_BATCH_SIZE", "500"))
+KEYWORD_BULK_MAX_ERRORS = int(os.environ.get("KEYWORD_BULK_MAX_ERRORS", "1000"))
+KEYWORD_EXPORT_FIELDS = ["id", "keyword", "page", "ranking", "search_volume", "difficulty", "tracked_at"]
+RANKING_RAW_RETENTION_DAYS = int(os.environ.get("RANKING_RAW_RETENTION_DAYS", "90"))
+RANKING_TREND_DEFAULT_DAYS = int(os.environ.get("RANKING_TREND_DEFAULT_DAYS", "365"))
+PASSWORD_HASH_WORKERS = int(os.environ.get("PASSWORD_HASH_WORKERS", "2"))
+PASSWORD_HASH_MAX_QUEUE = int(os.environ.get("PASSWORD_HASH_MAX_QUEUE", "16"))
+LOGIN_RATE_LIMIT = int(os.environ.get("LOGIN_RATE_LIMIT", "10"))
+LOGIN_RATE_WINDOW_SECONDS = float(os.environ.get("LOGIN_RATE_WINDOW_SECONDS", "60"))
+# Peers whose X-Forwarded-For is honoured: loopback and private ranges, where the ingress runs.
+TRUSTED_PROXIES = [
+    ipaddress.ip_network(network.strip())
+    for network in os.environ.get("TRUSTED_PROXIES", "127.0.0.0/8,10.0.0.0/8,172.16.0.0/12,192.168.0.0/16,::1/128,fc00::/7").split(",")
+    if network.strip()
+]
+BLOG_PAGE_DEFAULT_LIMIT = 20
+BLOG_PAGE_MAX_LIMIT = 100
+BLOG_SEARCH_DEFAULT_LIMIT = 10
+BLOG_SEARCH_MAX_LIMIT = 50
+BLOG_SEARCH_MAX_OFFSET = 1000
+SEARCH_FIELD_WEIGHTS = {"title": 3.0, "keywords": 2.0, "excerpt": 1.5, "content": 1.0}
+SEARCH_SNIPPET_CHARS = 160
+RELATED_POSTS_DIM = int(os.environ.get("RELATED_POSTS_DIM", "1024"))
+RELATED_POSTS_COUNT = int(os.environ.get("RELATED_POSTS_COUNT", "10"))
+RELATED_POSTS_DEFAULT_LIMIT = 3
+RELATED_FIELD_WEIGHTS = {"keywords": 3.0, "title": 2.0, "content": 1.0}
+KEYWORD_PAGE_DEFAULT_LIMIT = 50
+KEYWORD_PAGE_MAX_LIMIT = 500
+KEYWORD_SORT_FIELDS = ("ranking", "search_volume", "tracked_at", "keyword")
+ROBOTS_TXT_DOC_ID = "robots.txt"
+DEFAULT_ROBOTS_TXT = "User-agent: *\nAllow: /\nSitemap: https://seo-llm-connect.preview.emergentagent.com/sitemap.xml"
+
+FRONTEND_INDEX_HTML = os.environ.get("FRONTEND_INDEX_HTML", str(ROOT_DIR.parent / "frontend" / "build" / "index.html"))
+FALLBACK_INDEX_HTML = (
+    '<!doctype html>\n<html lang="en">\n<head>\n<meta charset="utf-8" />\n'
+    '<meta name="viewport" content="width=device-width, initial-scale=1" />\n'
+    '<title>TechResona | Your Tech Partner</title>\n</head>\n<body>\n<div id="root"></div>\n</body>\n</html>\n'
+)
+PRERENDERED_PAGES = {"/": "home", "/about": "about", "/services": "services", "/contact": "contact", "/blog": "blog"}
+
+def metric_labels(names: Tuple[str, ...], values: Tuple[Any, ...]) -> str:
+    escaped = (str(value).replace("\\", "\\\\").replace('"', '\\"').replace("\n", "\\n") for value in values)
+    return ",".join(f'{name}="{value}"' for name, value in zip(names, escaped))
+
+def metric_line(name: str, labels: str, value: float) -> str:
+    return f"{name}{{{labels}}} {value}" if labels else f"{name} {value}"
+
+class Metric:
+    """Counter or gauge with one value per label tuple, rendered in the Prometheus text format."""
+
+    def __init__(self, name: str, help_text: str, kind: str, labels: Tuple[str, ...] = ()):
+        self.name = name
+        self.help_text = help_text
+        self.kind = kind
+        self.labels = labels
+        self._values: Dict[Tuple[Any, ...], float] = {}
+        self._lock = threading.Lock()
+
+    def inc(self, labels: Tuple[Any, ...] = (), amount: float = 1):
+        with self._lock:
+            self._values[labels] = self._values.get(labels, 0) + amount
+
+    def render(self) -> List[str]:
+        with self._lock:
+            values = sorted(self._values.items())
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} {self.kind}"]
+        lines.extend(metric_line(self.name, metric_labels(self.labels, labels), value) for labels, value in values)
+        return lines
+
+class Histogram:
+    """Prometheus histogram; per label tuple it keeps non-cumulative bucket counts and a sum."""
+
+    def __init__(self, name: str, help_text: str, labels: Tuple[str, ...], buckets: Tuple[float, ...]):
+        self.name = name
+        self.help_text = help_text
+        self.labels = labels
+        self.buckets = buckets
+        self._series: Dict[Tuple[Any, ...], Tuple[List[int], float]] = {}
+        self._lock = threading.Lock()
+
+    def observe(self, labels: Tuple[Any, ...], value: float):
+        with self._lock:
+            counts, total = self._series.get(labels) or ([0] * (len(self.buckets) + 1), 0)
+            counts[bisect.bisect_left(self.buckets, value)] += 1
+            self._series[labels] = (counts, total + value)
+
+    def render(self) -> List[str]:
+        with self._lock:
+            series = sorted((labels, list(counts), total) for labels, (counts, total) in self._series.items())
+        lines = [f"# HELP {self.name} {self.help_text}", f"# TYPE {self.name} histogram"]
+        for labels, counts, total in series:
+            base = metric_labels(self.labels, labels)
+            cumulative = 0
+            for bound, count in zip(self.buckets + (math.inf,), counts):
+                cumulative += count
+                le = "+Inf" if bound == math.inf else repr(float(bound))
+                lines.append(metric_line(f"{self.name}_bucket", f'{base},le="{le}"' if base else f'le="{le}"', cumulative))
+            lines.append(metric_line(f"{self.name}_sum", base, round(total, 6)))
+            lines.append(metric_line(f"{self.name}_count", base, cumulative))
+        return lines
+
+http_requests_total = Metric("http_requests_total", "HTTP responses by route template and status.", "counter", ("method", "route", "status"))
+http_requests_in_flight = Metric("http_requests_in_flight", "HTTP requests currently being served.", "gauge")
+http_request_duration = Histogram(
+    "http_request_duration_seconds", "Time from request start to the end of the response body.",
+    ("method", "route"), METRICS_LATENCY_BUCKETS
+)
+http_request_mongo_operations = Histogram(
+    "http_request_mongo_operations", "MongoDB commands (including getMore) issued while serving one request.",
+    ("method", "route"), METRICS_OPERATION_BUCKETS
+)
+http_request_mongo_duration = Histogram(
+    "http_request_mongo_duration_seconds", "Summed MongoDB command time while serving one request.",
+    ("method", "route"), METRICS_LATENCY_BUCKETS
+)
+mongo_command_duration = Histogram(
+    "mongo_command_duration_seconds", "MongoDB command round-trip time as reported by the driver.",
+    ("command",), METRICS_LATENCY_BUCKETS
+)
+mongo_command_failures = Metric("mongo_command_failures_total", "MongoDB commands that returned an error.", "counter", ("command",))
+cache_sync_changes = Metric(
+    "cache_sync_changes_total", "Document changes applied to in-process caches by the cache sync subscriber.",
+    "counter", ("collection", "source")
+)
+METRICS = [
+    http_requests_total, http_requests_in_flight, http_request_duration, http_request_mongo_operations,
+    http_request_mongo_duration, mongo_command_duration, mongo_command_failures, cache_sync_changes,
+]
+
+# Durations of the Mongo commands issued on behalf of the current request. Motor runs commands on
+# executor threads with a copy of the caller's context, so the listener sees the request's list.
+request_mongo_commands: contextvars.ContextVar[Optional[List[float]]] = contextvars.ContextVar("request_mongo_commands", default=None)
+
+class MongoCommandMetrics(monitoring.CommandListener):
+    def started(self, event):
+        pass
+
+    def succeeded(self, event):
+        self._record(event.command_name, event.duration_micros / 1_000_000)
+
+    def failed(self, event):
+        mongo_command_failures.inc((event.command_name,))
+        self._record(event.command_name, event.duration_micros / 1_000_000)
+
+    def _record(self, command: str, seconds: float):
+        mongo_command_duration.observe((command,), seconds)
+        commands = request_mongo_commands.get()
+        if commands is not None:
+            commands.append(seconds)
+
+class MongoPoolMonitor(monitoring.ConnectionPoolListener):
+    """Connection counts per server from driver pool events; a pool is paused from a clear
+    (network error, failed handshake) until the driver marks it ready again."""
+
+    def __init__(self):
+        self.open: Dict[str, int] = {}
+        self.checked_out: Dict[str, int] = {}
+        self.paused: set = set()
+        self.check_out_failures = 0
+        self._lock = threading.Lock()
+
+    def _adjust(self, counts: Dict[str, int], address, delta: int):
+        key = "%s:%s" % address
+        with self._lock:
+            counts[key] = counts.get(key, 0) + delta
+
+    def pool_created(self, event):
+        pass
+
+    def pool_ready(self, event):
+        with self._lock:
+            self.paused.discard("%s:%s" % event.address)
+
+    def pool_cleared(self, event):
+        with self._lock:
+            self.paused.add("%s:%s" % event.address)
+
+    def pool_closed(self, event):
+        key = "%s:%s" % event.address
+        with self._lock:
+            self.open.pop(key, None)
+            self.checked_out.pop(key, None)
+            self.paused.discard(key)
+
+    def connection_created(self, event):
+        self._adjust(self.open, event.address, 1)
+
+    def connection_ready(self, event):
+        pass
+
+    def connection_closed(self, event):
+        self._adjust(self.open, event.address, -1)
+
+    def connection_check_out_started(self, event):
+        pass
+
+    def connection_check_out_failed(self, event):
+        with self._lock:
+            self.check_out_failures += 1
+
+    def connection_checked_out(self, event):
+        self._adjust(self.checked_out, event.address, 1)
+
+    def connection_checked_in(self, event):
+        self._adjust(self.checked_out, event.address, -1)
+
+    def stats(self) -> List[Dict[str, Any]]:
+        with self._lock:
+            addresses = sorted(set(self.open) | self.paused)
+            return [
+                {"address": address, "open_connections": self.open.get(address, 0),
+                 "checked_out": self.checked_out.get(address, 0), "paused": address in self.paused}
+                for address in addresses
+            ]
+
+READ_PREFERENCES = {
+    "primary": Primary,
+    "primaryPreferred": PrimaryPreferred,
+    "secondary": Secondary,
+    "secondaryPreferred": SecondaryPreferred,
+    "nearest": Nearest,
+}
+
+def public_read_preference():
+    mode = READ_PREFERENCES[MONGO_PUBLIC_READ_PREFERENCE]
+    return mode() if mode is Primary else mode(max_staleness=MONGO_MAX_STALENESS_SECONDS)
+
+def mongo_client_options() -> Dict[str, Any]:
+    options = {
+        "maxPoolSize": MONGO_MAX_POOL_SIZE,
+        "minPoolSize": MONGO_MIN_POOL_SIZE,
+        "maxIdleTimeMS": MONGO_MAX_IDLE_TIME_MS,
+        "serverSelectionTimeoutMS": MONGO_SERVER_SELECTION_TIMEOUT_MS,
+        "connectTimeoutMS": MONGO_CONNECT_TIMEOUT_MS,
+        "socketTimeoutMS": MONGO_SOCKET_TIMEOUT_MS,
+        "waitQueueTimeoutMS": MONGO_WAIT_QUEUE_TIMEOUT_MS,
+    }
+    return {name: value for name, value in options.items() if value is not None}
+
+mongo_pool_monitor = MongoPoolMonitor()
+mongo_url = os.environ['MONGO_URL']
+client = AsyncIOMotorClient(
+    mongo_url,
+    tz_aware=True,
+    event_listeners=[mongo_pool_monitor] + ([MongoCommandMetrics()] if METRICS_ENABLED else []),
+    **mongo_client_options()
+)
+db = client[os.environ['DB_NAME']]
+PUBLIC_READ_PREFERENCE = public_read_preference()
+last_local_write = -math.inf
+
+def public_reads():
+    """Handle for public, cacheable reads. They may go to secondaries, except for a short window
+    after this process wrote, so a cache refilled right after an edit does not load a lagging copy."""
+    if isinstance(PUBLIC_READ_PREFERENCE, Primary) or time.monotonic() - last_local_write < PRIMARY_READ_AFTER_WRITE_SECONDS:
+        return db
+    return db.client.get_database(db.name, read_preference=PUBLIC_READ_PREFERENCE)
+
+def note_local_write():
+    global last_local_write
+    last_local_write = time.monotonic()
+
+SITEMAP_STATIC_PAGES = [
+    ("/", "1.0"),
+    ("/about", "0.8"),
+    ("/services", "0.9"),
+    ("/contact", "0.7"),
+    ("/blog", "0.8"),
+]
+
 class Admin(BaseModel):
     model_config = ConfigDict(extra="ignore")
     id: str = Field(default_factory=lambda: str(uuid.uuid4()))
@@ -92,6 +435,47 @@ class Blog(BaseModel):
     created_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
     updated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
 
+class BlogSummary(BaseModel):
+    model_config = ConfigDict(extra="ignore")
+    id: str
+    slug: str
+    title: Optional[str] = None
+    excerpt: Optional[str] = None
+    content: Optional[str] = None
+    keywords: Optional[str] = None
+    meta_description: Optional[str] = None
+    author: Optional[str] = None
+    published: Optional[bool] = None
+    featured_image: Optional[str] = None
+    created_at: Optional[datetime] = None
+    updated_at: Optional[datetime] = None
+
+BLOG_FIELDS = list(Blog.model_fields)
+BLOG_SUMMARY_FIELDS = [field for field in BLOG_FIELDS if field != "content"]
+BLOG_CURSOR_FIELDS = ["id", "slug", "created_at"]
+
+class BlogSearchHit(BaseModel):
+    slug: str
+    title: str
+    excerpt: str
+    featured_image: Optional[str] = None
+    created_at: datetime
+    score: float
+    snippet: str
+
+class BlogSearchResults(BaseModel):
+    query: str
+    total: int
+    items: List[BlogSearchHit]
+
+class RelatedBlog(BaseModel):
+    slug: str
+    title: str
+    excerpt: str
+    featured_image: Optional[str] = None
+    created_at: datetime
+    score: float
+
 class BlogCreate(BaseModel):
     slug: str
     title: str
@@ -129,11 +513,89 @@ class KeywordCreate(BaseModel):
     search_volume: Optional[int] = None
     difficulty: Optional[str] = None
 
+class KeywordBulkError(BaseModel):
+    line: int
+    error: str
+
+class KeywordBulkResult(BaseModel):
+    inserted: int
+    updated: int = 0
+    failed: int
+    errors: List[KeywordBulkError]
+
+class KeywordBulkDelete(BaseModel):
+    ids: List[str]
+
+class RankingObservation(BaseModel):
+    ranking: int
+    observed_at: Optional[datetime] = None
+
+class RankingPoint(BaseModel):
+    bucket: datetime
+    avg: float
+    min: int
+    max: int
+    count: int
+
+class RankingTrend(BaseModel):
+    scope: str
+    key: str
+    period: str
+    points: List[RankingPoint]
+
 class AnalyticsData(BaseModel):
     total_pages: int
     total_blogs: int
     total_keywords: int
     recent_updates: List[str]
+    blog_status_counts: Dict[str, int] = {}
+    keyword_ranking_distribution: Dict[str, int] = {}
+    generated_at: datetime = Field(default_factory=lambda: datetime.now(timezone.utc))
+
+class PasswordHasherStats(BaseModel):
+    workers: int
+    max_queue: int
+    in_flight: int
+    queue_depth: int
+    peak_queue_depth: int
+    completed: int
+    rejected: int
+
+class RateLimiterStats(BaseModel):
+    limit: int
+    window_seconds: float
+    tracked_keys: int
+    rejected: int
+
+class AuthStats(BaseModel):
+    password_hasher: PasswordHasherStats
+    login_rate_limiter: RateLimiterStats
+
+class CacheStats(BaseModel):
+    size: int
+    max_entries: int
+    ttl_seconds: float
+    hits: int
+    misses: int
+    evictions: int
+    expirations: int
+    invalidations: int
+    hit_ratio: float
+
+class MongoPoolStats(BaseModel):
+    address: str
+    open_connections: int
+    checked_out: int
+    paused: bool
+
+class ReadinessStatus(BaseModel):
+    ready: bool
+    mongo_ping_ms: Optional[float] = None
+
+class MongoHealth(ReadinessStatus):
+    error: Optional[str] = None
+    pools: List[MongoPoolStats]
+    check_out_failures: int
 
 def verify_password(plain_password, hashed_password):
     return pwd_context.verify(plain_password, hashed_password)
@@ -141,80 +603,889 @@ def verify_password(plain_password, hashed_password):
 def get_password_hash(password):
     return pwd_context.hash(password)
 
+class PasswordHasher:
+    """Runs bcrypt on a dedicated thread pool so hashing never blocks the event loop.
+
+    At most ``workers`` hashes run at once and ``max_queue`` more may wait; beyond
+    that callers get a 503 instead of piling up behind the pool.
+    """
+
+    def __init__(self, workers: int = PASSWORD_HASH_WORKERS, max_queue: int = PASSWORD_HASH_MAX_QUEUE):
+        self.workers = workers
+        self.max_queue = max_queue
+        self._executor = ThreadPoolExecutor(max_workers=workers, thread_name_prefix="bcrypt")
+        self.in_flight = 0
+        self.peak_queue_depth = 0
+        self.completed = 0
+        self.rejected = 0
+
+    @property
+    def queue_depth(self) -> int:
+        return max(0, self.in_flight - self.workers)
+
+    async def _run(self, func, *args):
+        if self.in_flight >= self.workers + self.max_queue:
+            self.rejected += 1
+            raise HTTPException(status_code=503, detail="Authentication is busy, please retry", headers={"Retry-After": "1"})
+        self.in_flight += 1
+        self.peak_queue_depth = max(self.peak_queue_depth, self.queue_depth)
+        try:
+            return await asyncio.get_running_loop().run_in_executor(self._executor, func, *args)
+        finally:
+            self.in_flight -= 1
+            self.completed += 1
+
+    async def verify(self, plain_password: str, hashed_password: str) -> bool:
+        return await self._run(verify_password, plain_password, hashed_password)
+
+    async def hash(self, password: str) -> str:
+        return await self._run(get_password_hash, password)
+
+    def stats(self) -> PasswordHasherStats:
+        return PasswordHasherStats(
+            workers=self.workers,
+            max_queue=self.max_queue,
+            in_flight=self.in_flight,
+            queue_depth=self.queue_depth,
+            peak_queue_depth=self.peak_queue_depth,
+            completed=self.completed,
+            rejected=self.rejected,
+        )
+
+    def shutdown(self):
+        self._executor.shutdown(wait=False, cancel_futures=True)
+
+class SlidingWindowRateLimiter:
+    def __init__(self, limit: int = LOGIN_RATE_LIMIT, window_seconds: float = LOGIN_RATE_WINDOW_SECONDS, max_keys: int = 10000):
+        self.limit = limit
+        self.window_seconds = window_seconds
+        self.max_keys = max_keys
+        self._hits: Dict[Hashable, deque] = {}
+        self.rejected = 0
+
+    def hit(self, key: Hashable) -> Optional[float]:
+        """Record an attempt; return seconds until retry if the key is over its limit."""
+        now = time.monotonic()
+        hits = self._hits.get(key)
+        if hits is None:
+            if len(self._hits) >= self.max_keys:
+                self._purge(now)
+            hits = self._hits[key] = deque()
+        while hits and hits[0] <= now - self.window_seconds:
+            hits.popleft()
+        if len(hits) >= self.limit:
+            self.rejected += 1
+            return hits[0] + self.window_seconds - now
+        hits.append(now)
+        return None
+
+    def reset(self, key: Hashable):
+        self._hits.pop(key, None)
+
+    def _purge(self, now: float):
+        for key in [k for k, hits in self._hits.items() if not hits or hits[-1] <= now - self.window_seconds]:
+            del self._hits[key]
+        while len(self._hits) >= self.max_keys:
+            del self._hits[next(iter(self._hits))]
+
+    def stats(self) -> RateLimiterStats:
+        return RateLimiterStats(limit=self.limit, window_seconds=self.window_seconds, tracked_keys=len(self._hits), rejected=self.rejected)
+
+password_hasher = PasswordHasher()
+login_rate_limiter = SlidingWindowRateLimiter()
+
+def is_trusted_proxy(host: str) -> bool:
+    try:
+        address = ipaddress.ip_address(host)
+    except ValueError:
+        return False
+    return any(address in network for network in TRUSTED_PROXIES)
+
+def client_ip(request: Request) -> Optional[str]:
+    """The first address, walking X-Forwarded-For back from the peer, that is not a trusted proxy.
+
+    None when every hop is a proxy (no forwarding header), since that address is shared by all clients."""
+    hops = [hop.strip() for hop in request.headers.get("x-forwarded-for", "").split(",") if hop.strip()]
+    hops.append(request.client.host if request.client else "unknown")
+    for hop in reversed(hops):
+        if not is_trusted_proxy(hop):
+            return hop
+    return None
+
+def enforce_login_rate_limit(request: Request, email: str):
+    ip = client_ip(request)
+    keys = [("email", email.lower())] if ip is None else [("ip", ip), ("email", email.lower())]
+    for key in keys:
+        retry_after = login_rate_limiter.hit(key)
+        if retry_after is not None:
+            raise HTTPException(
+                status_code=429,
+                detail="Too many login attempts, please try again later",
+                headers={"Retry-After": str(max(1, int(retry_after + 0.5)))}
+            )
+
 def create_access_token(data: dict):
     to_encode = data.copy()
     expire = datetime.now(timezone.utc) + timedelta(minutes=ACCESS_TOKEN_EXPIRE_MINUTES)
-    to_encode.update({"exp": expire})
+    to_encode.update({"exp": expire, "jti": uuid.uuid4().hex})
     encoded_jwt = jwt.encode(to_encode, SECRET_KEY, algorithm=ALGORITHM)
     return encoded_jwt
 
-async def get_current_admin(credentials: HTTPAuthorizationCredentials = Depends(security)):
-    token = credentials.credentials
+INDEXES: Dict[str, List[IndexModel]] = {
+    "blogs": [
+        IndexModel([("slug", ASCENDING)], name="slug_unique", unique=True),
+        IndexModel([("published", ASCENDING), ("created_at", DESCENDING), ("id", DESCENDING)], name="published_created_at"),
+        IndexModel([("created_at", DESCENDING), ("id", DESCENDING)], name="created_at"),
+        IndexModel([("updated_at", DESCENDING)], name="updated_at"),
+    ],
+    "blog_related": [
+        IndexModel([("slug", ASCENDING)], name="slug_unique", unique=True),
+        IndexModel([("updated_at", ASCENDING)], name="updated_at"),
+    ],
+    "seo_settings": [
+        IndexModel([("page", ASCENDING)], name="page_unique", unique=True),
+        IndexModel([("updated_at", DESCENDING)], name="updated_at"),
+    ],
+    "admins": [
+        IndexModel([("email", ASCENDING)], name="email_unique", unique=True),
+    ],
+    "keywords": [
+        IndexModel([("id", ASCENDING)], name="id_unique", unique=True),
+        IndexModel([("ranking", ASCENDING), ("id", ASCENDING)], name="ranking_id"),
+        IndexModel([("search_volume", ASCENDING), ("id", ASCENDING)], name="search_volume_id"),
+        IndexModel([("tracked_at", ASCENDING), ("id", ASCENDING)], name="tracked_at_id"),
+        IndexModel([("keyword", ASCENDING), ("id", ASCENDING)], name="keyword_id"),
+        IndexModel([("page", ASCENDING), ("ranking", ASCENDING), ("id", ASCENDING)], name="page_ranking_id"),
+        IndexModel([("page", ASCENDING), ("search_volume", ASCENDING), ("id", ASCENDING)], name="page_search_volume_id"),
+        IndexModel([("page", ASCENDING), ("tracked_at", ASCENDING), ("id", ASCENDING)], name="page_tracked_at_id"),
+        IndexModel([("difficulty", ASCENDING), ("ranking", ASCENDING), ("id", ASCENDING)], name="difficulty_ranking_id"),
+    ],
+    "robots_txt": [
+        IndexModel([("updated_at", DESCENDING)], name="updated_at"),
+    ],
+    "revoked_tokens": [
+        IndexModel([("jti", ASCENDING)], name="jti_unique", unique=True),
+        IndexModel([("expires_at", ASCENDING)], name="expires_at_ttl", expireAfterSeconds=0),
+    ],
+    "keyword_rankings": [
+        IndexModel([("keyword_id", ASCENDING), ("observed_at", DESCENDING)], name="keyword_observed_at"),
+        IndexModel([("observed_at", ASCENDING)], name="observed_at_ttl", expireAfterSeconds=RANKING_RAW_RETENTION_DAYS * 86400),
+    ],
+    "keyword_ranking_rollups": [
+        IndexModel([("scope", ASCENDING), ("key", ASCENDING), ("period", ASCENDING), ("bucket", ASCENDING)], name="series_unique", unique=True),
+    ],
+    "deletions": [
+        IndexModel([("deleted_at", ASCENDING)], name="deleted_at_ttl", expireAfterSeconds=CACHE_SYNC_TOMBSTONE_TTL_SECONDS),
+    ],
+}
+
+index_status: Dict[str, Dict[str, str]] = {}
+
+async def ensure_indexes(database=None) -> Dict[str, Dict[str, str]]:
+    database = db if database is None else database
+    report = {collection: {model.document["name"]: "pending" for model in models} for collection, models in INDEXES.items()}
+    for collection, models in INDEXES.items():
+        for model in models:
+            name = model.document["name"]
+            try:
+                await database[collection].create_indexes([model])
+                report[collection][name] = "ok"
+            except ConnectionFailure as exc:
+                logger.error("Index provisioning aborted, MongoDB unreachable: %s", exc)
+                return report
+            except PyMongoError as exc:
+                report[collection][name] = f"failed: {exc}"
+                logger.error("Index %s.%s could not be built: %s", collection, name, exc)
+    return report
+
+class CachedResource(NamedTuple):
+    value: Any
+    etag: str
+    last_modified: Optional[datetime]
+
+class SitemapDocument(NamedTuple):
+    body: bytes
+    gzipped: bytes
+    etag: str
+    last_modified: datetime
+
+def make_etag(payload: bytes) -> str:
+    return '"' + hashlib.sha256(payload).hexdigest()[:32] + '"'
+
+def as_utc(value: Any) -> Optional[datetime]:
+    if not isinstance(value, datetime):
+        return None
+    if value.tzinfo is None:
+        return value.replace(tzinfo=timezone.utc)
+    return value.astimezone(timezone.utc)
+
+def cached_resource(value: Any, last_modified: Optional[datetime] = None) -> CachedResource:
+    payload = json.dumps(value, sort_keys=True, default=str, separators=(",", ":")).encode("utf-8")
+    return CachedResource(value, make_etag(payload), as_utc(last_modified))
+
+def validator_headers(etag: str, last_modified: Optional[datetime]) -> Dict[str, str]:
+    headers = {"ETag": etag, "Cache-Control": "no-cache"}
+    if last_modified is not None:
+        headers["Last-Modified"] = format_datetime(last_modified, usegmt=True)
+    return headers
+
+def encoded_etag(etag: str, encoding: str) -> str:
+    return f'{etag[:-1]}-{encoding}"'
+
+def identity_etag(tag: str) -> str:
+    for encoding in ("gzip", "br"):
+        if tag.endswith(f'-{encoding}"'):
+            return tag[:-len(encoding) - 2] + '"'
+    return tag
+
+def is_not_modified(request: Request, etag: str, last_modified: Optional[datetime]) -> bool:
+    if_none_match = request.headers.get("if-none-match")
+    if if_none_match is not None:
+        # Compressed representations carry a suffixed ETag; they validate against the same content.
+        tags = [identity_etag(tag.strip().removeprefix("W/")) for tag in if_none_match.split(",")]
+        return "*" in tags or etag in tags
+    if_modified_since = request.headers.get("if-modified-since")
+    if if_modified_since and last_modified is not None:
+        try:
+            since = parsedate_to_datetime(if_modified_since)
+        except (TypeError, ValueError):
+            return False
+        return last_modified.replace(microsecond=0) <= as_utc(since)
+    return False
+
+def not_modified_response(request: Request, resource: CachedResource) -> Optional[Response]:
+    if is_not_modified(request, resource.etag, resource.last_modified):
+        return Response(status_code=304, headers=validator_headers(resource.etag, resource.last_modified))
+    return None
+
+@functools.lru_cache(maxsize=None)
+def response_fields(model: type) -> Tuple[Tuple[str, bool, Any], ...]:
+    return tuple(
+        (name, field.default_factory is None and not field.is_required(), field.default)
+        for name, field in model.model_fields.items()
+    )
+
+def shape_document(model: type, document: Dict[str, Any], exclude_unset: bool = False) -> Dict[str, Any]:
+    # The response model's field list and plain defaults, without constructing the model.
+    shaped = {}
+    for name, has_default, default in response_fields(model):
+        if name in document:
+            shaped[name] = document[name]
+        elif has_default and not exclude_unset:
+            shaped[name] = default
+    return shaped
+
+def json_default(value: Any):
+    if isinstance(value, datetime):
+        return value.isoformat().replace("+00:00", "Z")
+    raise TypeError(f"{type(value).__name__} is not JSON serializable")
+
+def dumps_json(value: Any) -> bytes:
+    if orjson is not None:
+        return orjson.dumps(value, option=orjson.OPT_UTC_Z)
+    return json.dumps(value, ensure_ascii=False, separators=(",", ":"), default=json_default).encode("utf-8")
+
+@functools.lru_cache(maxsize=None)
+def response_adapter(model: type, many: bool) -> TypeAdapter:
+    return TypeAdapter(List[model] if many else model)
+
+def check_json_body(model: type, value: Any, body: bytes, many: bool, exclude_unset: bool):
+    adapter = response_adapter(model, many)
+    expected = adapter.dump_python(adapter.validate_python(value), mode="json", exclude_unset=exclude_unset)
+    if json.loads(body) != expected:
+        raise ValueError(f"Fast JSON body does not match the {model.__name__} response model")
+
+def json_body(model: type, value: Any, many: bool = False, exclude_unset: bool = False) -> bytes:
+    if many:
+        body = dumps_json([shape_document(model, item, exclude_unset) for item in value])
+    else:
+        body = dumps_json(shape_document(model, value, exclude_unset))
+    if FAST_JSON_VALIDATE:
+        check_json_body(model, value, body, many, exclude_unset)
+    return body
+
+def cached_json_body(model: type, value: Any, etag: str, many: bool = False, exclude_unset: bool = False) -> bytes:
+    # ETags hash the cached value, so the encoded bytes can be reused for as long as the tag is.
+    key = (model.__name__, many, exclude_unset, etag)
+    body = serialized_cache.get(key)
+    if body is None:
+        body = json_body(model, value, many, exclude_unset)
+        serialized_cache.set(key, body)
+    return body
+
+def json_response(body: bytes, headers: Optional[Dict[str, str]] = None) -> Response:
+    return Response(body, media_type="application/json", headers=headers)
+
+class TTLCache:
+    """Bounded in-process cache with per-entry TTL, LRU eviction and single-flight loads.
+
+    Keys are tuples whose first element names the resource (``("blog", slug)``),
+    so writers can drop every variant of a resource with ``invalidate_prefix``.
+    """
+
+    def __init__(self, max_entries: int = CACHE_MAX_ENTRIES, ttl_seconds: float = CACHE_TTL_SECONDS):
+        self.max_entries = max_entries
+        self.ttl_seconds = ttl_seconds
+        self._data: "OrderedDict[Hashable, Tuple[float, Any]]" = OrderedDict()
+        self._pending: Dict[Hashable, asyncio.Future] = {}
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.expirations = 0
+        self.invalidations = 0
+
+    def get(self, key: Hashable, default=None):
+        item = self._data.get(key)
+        if item is None:
+            self.misses += 1
+            return default
+        expires_at, value = item
+        if expires_at <= time.monotonic():
+            del self._data[key]
+            self.expirations += 1
+            self.misses += 1
+            return default
+        self._data.move_to_end(key)
+        self.hits += 1
+        return value
+
+    def set(self, key: Hashable, value: Any):
+        self._data[key] = (time.monotonic() + self.ttl_seconds, value)
+        self._data.move_to_end(key)
+        while len(self._data) > self.max_entries:
+            self._data.popitem(last=False)
+            self.evictions += 1
+
+    async def get_or_load(self, key: Hashable, loader: Callable[[], Awaitable[Any]]):
+        missing = object()
+        value = self.get(key, missing)
+        if value is not missing:
+            return value
+        pending = self._pending.get(key)
+        if pending is not None:
+            return await asyncio.shield(pending)
+        future = asyncio.get_running_loop().create_future()
+        self._pending[key] = future
+        try:
+            value = await loader()
+        except BaseException as exc:
+            future.set_exception(exc)
+            future.exception()
+            raise
+        else:
+            future.set_result(value)
+            if value is not None and self._pending.get(key) is future:
+                self.set(key, value)
+            return value
+        finally:
+            if self._pending.get(key) is future:
+                del self._pending[key]
+
+    def invalidate(self, key: Hashable):
+        self._pending.pop(key, None)
+        if self._data.pop(key, None) is not None:
+            self.invalidations += 1
+
+    def invalidate_prefix(self, prefix: str):
+        for key in [k for k in self._pending if k[0] == prefix]:
+            del self._pending[key]
+        for key in [k for k in self._data if k[0] == prefix]:
+            del self._data[key]
+            self.invalidations += 1
+
+    def clear(self):
+        self.invalidations += len(self._data)
+        self._data.clear()
+        self._pending.clear()
+
+    def stats(self) -> CacheStats:
+        lookups = self.hits + self.misses
+        return CacheStats(
+            size=len(self._data),
+            max_entries=self.max_entries,
+            ttl_seconds=self.ttl_seconds,
+            hits=self.hits,
+            misses=self.misses,
+            evictions=self.evictions,
+            expirations=self.expirations,
+            invalidations=self.invalidations,
+            hit_ratio=self.hits / lookups if lookups else 0.0,
+        )
+
+class TokenRevocationList:
+    """In-memory set of revoked token ids, each kept only until the token would expire anyway."""
+
+    def __init__(self):
+        self._revoked: Dict[str, float] = {}
+
+    def revoke(self, jti: str, expires_at: float):
+        self._revoked[jti] = expires_at
+        if len(self._revoked) % 256 == 0:
+            self.purge()
+
+    def is_revoked(self, jti: str) -> bool:
+        expires_at = self._revoked.get(jti)
+        if expires_at is None:
+            return False
+        if expires_at <= time.time():
+            del self._revoked[jti]
+            return False
+        return True
+
+    def purge(self):
+        now = time.time()
+        for jti in [jti for jti, expires_at in self._revoked.items() if expires_at <= now]:
+            del self._revoked[jti]
+
+    def __len__(self):
+        return len(self._revoked)
+
+read_cache = TTLCache()
+admin_cache = TTLCache(max_entries=ADMIN_CACHE_MAX_ENTRIES, ttl_seconds=ADMIN_CACHE_TTL_SECONDS)
+analytics_cache = TTLCache(max_entries=1, ttl_seconds=ANALYTICS_SNAPSHOT_TTL_SECONDS)
+compressed_cache = TTLCache(max_entries=COMPRESSION_CACHE_MAX_ENTRIES)
+serialized_cache = TTLCache(max_entries=SERIALIZED_CACHE_MAX_ENTRIES)
+CACHES: Dict[str, TTLCache] = {
+    "reads": read_cache,
+    "admins": admin_cache,
+    "analytics": analytics_cache,
+    "compressed": compressed_cache,
+    "serialized": serialized_cache,
+}
+revoked_tokens = TokenRevocationList()
+
+def invalidate_admin(email: str):
+    admin_cache.invalidate(("admin", email))
+
+def invalidate_blog_reads(slug: str):
+    note_local_write()
+    read_cache.invalidate(("blog", slug))
+    read_cache.invalidate_prefix("blogs")
+    read_cache.invalidate(("seo_bundle",))
+    read_cache.invalidate_prefix("html")
+
+def invalidate_seo_reads(page: str):
+    note_local_write()
+    read_cache.invalidate(("seo", page))
+    read_cache.invalidate_prefix("seo_all")
+    read_cache.invalidate(("seo_bundle",))
+    read_cache.invalidate_prefix("html")
+
+async def record_deletions(collection: str, keys: List[str], database=None):
+    # Tombstones let polling workers see deletes by timestamp like any other write; the TTL index
+    # drops them long after every worker has polled past.
+    if keys:
+        database = database if database is not None else db
+        now = datetime.now(timezone.utc)
+        await database.deletions.insert_many([{"collection": collection, "key": key, "deleted_at": now} for key in keys], ordered=False)
+
+def encode_cursor(values: List[Any]) -> str:
+    values = [value.isoformat() if isinstance(value, datetime) else value for value in values]
+    raw = json.dumps(values, separators=(",", ":")).encode("utf-8")
+    return base64.urlsafe_b64encode(raw).decode("ascii").rstrip("=")
+
+def decode_cursor(cursor: str, size: int) -> List[Any]:
+    try:
+        values = json.loads(base64.urlsafe_b64decode(cursor + "=" * (-len(cursor) % 4)))
+    except (ValueError, TypeError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    if not isinstance(values, list) or len(values) != size:
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+    return values
+
+def parse_cursor_datetime(value: Any) -> datetime:
+    try:
+        return datetime.fromisoformat(value)
+    except (TypeError, ValueError):
+        raise HTTPException(status_code=400, detail="Invalid cursor")
+
+def parse_blog_fields(fields: Optional[str]) -> List[str]:
+    if not fields:
+        return BLOG_SUMMARY_FIELDS
+    requested = [field.strip() for field in fields.split(",") if field.strip()]
+    unknown = [field for field in requested if field not in BLOG_FIELDS]
+    if unknown:
+        raise HTTPException(status_code=400, detail=f"Unknown blog fields: {', '.join(unknown)}")
+    return [field for field in BLOG_FIELDS if field in requested or field in BLOG_CURSOR_FIELDS]
+
+def sitemap_lastmod(value) -> str:
+    if isinstance(value, str):
+        return value.split('T')[0]
+    if isinstance(value, datetime):
+        return value.strftime('%Y-%m-%d')
+    return datetime.now(timezone.utc).strftime('%Y-%m-%d')
+
+URLSET_HEAD = (
+    '<?xml version="1.0" encoding="UTF-8"?>\n'
+    '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
+)
+URLSET_TAIL = '</urlset>'
+
+def render_url_entries(urls: List[Tuple[str, Optional[str], str, str]]) -> str:
+    parts = []
+    for loc, lastmod, changefreq, priority in urls:
+        parts.append('  <url>\n')
+        parts.append(f'    <loc>{escape(loc)}</loc>\n')
+        if lastmod:
+            parts.append(f'    <lastmod>{lastmod}</lastmod>\n')
+        parts.append(f'    <changefreq>{changefreq}</changefreq>\n')
+        parts.append(f'    <priority>{priority}</priority>\n')
+        parts.append('  </url>\n')
+    return ''.join(parts)
+
+def render_urlset(urls: List[Tuple[str, Optional[str], str, str]]) -> bytes:
+    return (URLSET_HEAD + render_url_entries(urls) + URLSET_TAIL).encode('utf-8')
+
+def static_sitemap_urls() -> List[Tuple[str, Optional[str], str, str]]:
+    return [(f"{SITE_URL}{loc}", None, "weekly", priority) for loc, priority in SITEMAP_STATIC_PAGES]
+
+def blog_sitemap_url(slug: str, lastmod: Optional[str]) -> Tuple[str, Optional[str], str, str]:
+    return (f"{SITE_URL}/blog/{slug}", lastmod, "monthly", "0.6")
+
+async def stream_urlset(cursor, static_urls=(), batch_size: int = SITEMAP_STREAM_BATCH_SIZE,
+                        on_complete: Optional[Callable[[Dict[str, str]], None]] = None):
+    yield (URLSET_HEAD + render_url_entries(list(static_urls))).encode('utf-8')
+    batch = []
+    entries = {}
+    async for blog in cursor:
+        lastmod = sitemap_lastmod(blog.get('updated_at'))
+        if on_complete is not None:
+            entries[blog['slug']] = lastmod
+        batch.append(blog_sitemap_url(blog['slug'], lastmod))
+        if len(batch) >= batch_size:
+            yield render_url_entries(batch).encode('utf-8')
+            batch = []
+    yield (render_url_entries(batch) + URLSET_TAIL).encode('utf-8')
+    if on_complete is not None:
+        on_complete(entries)
+
+def render_sitemap_index(shards: List[Tuple[str, Optional[str]]]) -> bytes:
+    parts = [
+        '<?xml version="1.0" encoding="UTF-8"?>\n',
+        '<sitemapindex xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n',
+    ]
+    for name, lastmod in shards:
+        parts.append('  <sitemap>\n')
+        parts.append(f'    <loc>{escape(SITE_URL)}/{name}</loc>\n')
+        if lastmod:
+            parts.append(f'    <lastmod>{lastmod}</lastmod>\n')
+        parts.append('  </sitemap>\n')
+    parts.append('</sitemapindex>')
+    return ''.join(parts).encode('utf-8')
+
+class SitemapCache:
+    """Pre-rendered sitemap XML (plain + gzip), patched by blog write hooks and
+    split into a <sitemapindex> of ``max_urls``-sized shards when it outgrows one file."""
+
+    def __init__(self, max_urls: int = SITEMAP_MAX_URLS, cache_dir: Optional[str] = None):
+        self.max_urls = max_urls
+        self.cache_dir = Path(cache_dir) if cache_dir else None
+        self._entries: Dict[str, str] = {}
+        self._documents: Dict[str, SitemapDocument] = {}
+        self._loaded = False
+        self._loading = False
+        self._reload_requested = False
+        self._dirty = True
+        self._writes = 0
+        self._lock = asyncio.Lock()
+        self._warming: Optional[asyncio.Task] = None
+
+    @property
+    def warm(self) -> bool:
+        return self._loaded
+
+    def warm_in_background(self):
+        if self._warming is None or self._warming.done():
+            self._warming = asyncio.create_task(self.get("sitemap.xml"))
+
+    async def load(self):
+        async with self._lock:
+            await self._load()
+
+    async def _load(self):
+        self._loading = True
+        try:
+            while True:
+                self._reload_requested = False
+                entries = {}
+                async for blog in published_blog_cursor():
+                    entries[blog['slug']] = sitemap_lastmod(blog.get('updated_at'))
+                if not self._reload_requested:
+                    break
+        finally:
+            self._loading = False
+        self._entries = entries
+        self._loaded = True
+        self._dirty = True
+
+    def filler(self) -> Callable[[Dict[str, str]], None]:
+        """Callback for a cold streamed response to hand over the full entry set it read, so the
+        cache is filled without a second scan. A write during the stream makes it load instead."""
+        writes = self._writes
+
+        def fill(entries: Dict[str, str]):
+            if self._loaded or self._loading:
+                return
+            if self._writes != writes:
+                self.warm_in_background()
+                return
+            self._entries = entries
+            self._loaded = True
+            self._dirty = True
+        return fill
+
+    def upsert(self, slug: str, updated_at):
+        self._writes += 1
+        if self._loading:
+            self._reload_requested = True
+        if not self._loaded:
+            return
+        self._entries[slug] = sitemap_lastmod(updated_at)
+        self._dirty = True
+
+    def remove(self, slug: str):
+        self._writes += 1
+        if self._loading:
+            self._reload_requested = True
+        if self._loaded and self._entries.pop(slug, None) is not None:
+            self._dirty = True
+
+    def invalidate(self):
+        self._writes += 1
+        if self._loading:
+            self._reload_requested = True
+        self._loaded = False
+
+    async def get(self, name: str) -> Optional[SitemapDocument]:
+        return (await self.documents()).get(name)
+
+    async def documents(self) -> Dict[str, SitemapDocument]:
+        if not self._loaded or self._dirty:
+            async with self._lock:
+                if not self._loaded:
+                    await self._load()
+                if self._dirty:
+                    self._render()
+                    if self.cache_dir:
+                        await asyncio.to_thread(self._write_to_disk, dict(self._documents))
+        return dict(self._documents)
+
+    def _render(self):
+        urls = static_sitemap_urls()
+        urls.extend(blog_sitemap_url(slug, lastmod) for slug, lastmod in self._entries.items())
+        rendered_at = datetime.now(timezone.utc).replace(microsecond=0)
+
+        def document(body: bytes) -> SitemapDocument:
+            return SitemapDocument(body, gzip.compress(body), make_etag(body), rendered_at)
+
+        documents = {}
+        if len(urls) <= self.max_urls:
+            documents["sitemap.xml"] = document(render_urlset(urls))
+        else:
+            shards = []
+            for start in range(0, len(urls), self.max_urls):
+                name = f"sitemap-{len(shards) + 1}.xml"
+                chunk = urls[start:start + self.max_urls]
+                documents[name] = document(render_urlset(chunk))
+                shards.append((name, max((url[1] for url in chunk if url[1]), default=None)))
+            documents["sitemap.xml"] = document(render_sitemap_index(shards))
+        self._documents = documents
+        self._dirty = False
+
+    def _write_to_disk(self, documents: Dict[str, SitemapDocument]):
+        self.cache_dir.mkdir(parents=True, exist_ok=True)
+        for name, document in documents.items():
+            for filename, data in ((name, document.body), (f"{name}.gz", document.gzipped)):
+                tmp = self.cache_dir / f".{filename}.tmp"
+                tmp.write_bytes(data)
+                tmp.replace(self.cache_dir / filename)
+        for stale in self.cache_dir.glob("sitemap-*.xml*"):
+            if stale.name.removesuffix(".gz") not in documents:
+                stale.unlink(missing_ok=True)
+
+sitemap_cache = SitemapCache(cache_dir=SITEMAP_CACHE_DIR)
+
+def published_blog_cursor(skip: int = 0, limit: int = 0):
+    cursor = public_reads().blogs.find({"published": True}, {"_id": 0, "slug": 1, "updated_at": 1}).sort("created_at", 1)
+    if skip:
+        cursor = cursor.skip(skip)
+    if limit:
+        cursor = cursor.limit(limit)
+    return cursor.batch_size(SITEMAP_STREAM_BATCH_SIZE)
+
+async def stream_sitemap_response(name: str, fill: bool = False) -> Response:
+    max_urls = sitemap_cache.max_urls
+    static_urls = static_sitemap_urls()
+    total = len(static_urls) + await public_reads().blogs.count_documents({"published": True})
+    shard_count = -(-total // max_urls)
+    if fill and not (name == "sitemap.xml" and total <= max_urls):
+        # The index and single shards read only part of the collection; load the cache separately.
+        sitemap_cache.warm_in_background()
+    if name == "sitemap.xml":
+        if total <= max_urls:
+            on_complete = sitemap_cache.filler() if fill else None
+            cursor = published_blog_cursor()
+            return StreamingResponse(stream_urlset(cursor, static_urls, on_complete=on_complete), media_type="application/xml")
+        body = render_sitemap_index([(f"sitemap-{n}.xml", None) for n in range(1, shard_count + 1)])
+        return Response(content=body, media_type="application/xml")
+    shard = int(name[len("sitemap-"):-len(".xml")])
+    if total <= max_urls or not 1 <= shard <= shard_count:
+        raise HTTPException(status_code=404, detail="Sitemap not found")
+    if shard == 1:
+        cursor = published_blog_cursor(limit=max_urls - len(static_urls))
+        return StreamingResponse(stream_urlset(cursor, static_urls), media_type="application/xml")
+    cursor = published_blog_cursor(skip=(shard - 1) * max_urls - len(static_urls), limit=max_urls)
+    return StreamingResponse(stream_urlset(cursor), media_type="application/xml")
+
+async def sitemap_document_response(request: Request, name: str) -> Response:
+    if SITEMAP_STREAMING or not sitemap_cache.warm:
+        return await stream_sitemap_response(name, fill=not SITEMAP_STREAMING)
+    document = await sitemap_cache.get(name)
+    if document is None:
+        raise HTTPException(status_code=404, detail="Sitemap not found")
+    return sitemap_response(request, document)
+
+def sitemap_response(request: Request, document: SitemapDocument) -> Response:
+    use_gzip = negotiate_encoding(request.headers.get("accept-encoding", ""), ("gzip",)) is not None
+    etag = encoded_etag(document.etag, "gzip") if use_gzip else document.etag
+    headers = {"Vary": "Accept-Encoding", **validator_headers(etag, document.last_modified)}
+    if is_not_modified(request, document.etag, document.last_modified):
+        return Response(status_code=304, headers=headers)
+    if use_gzip:
+        headers["Content-Encoding"] = "gzip"
+        return Response(content=document.gzipped, media_type="application/xml", headers=headers)
+    return Response(content=document.body, media_type="application/xml", headers=headers)
+
+def decode_access_token(token: str) -> dict:
     try:
         payload = jwt.decode(token, SECRET_KEY, algorithms=[ALGORITHM])
-        email: str = payload.get("sub")
-        if email is None:
-            raise HTTPException(status_code=401, detail="Invalid authentication credentials")
     except JWTError:
         raise HTTPException(status_code=401, detail="Invalid authentication credentials")
-    
-    admin = await db.admins.find_one({"email": email}, {"_id": 0})
+    if payload.get("sub") is None:
+        raise HTTPException(status_code=401, detail="Invalid authentication credentials")
+    jti = payload.get("jti")
+    if jti and revoked_tokens.is_revoked(jti):
+        raise HTTPException(status_code=401, detail="Token has been revoked")
+    return payload
+
+async def load_admin(email: str):
+    return await db.admins.find_one({"email": email}, {"_id": 0, "password_hash": 0})
+
+async def get_current_admin(credentials: HTTPAuthorizationCredentials = Depends(security)):
+    email = decode_access_token(credentials.credentials)["sub"]
+    admin = await admin_cache.get_or_load(("admin", email), lambda: load_admin(email))
     if admin is None:
         raise HTTPException(status_code=401, detail="Admin not found")
     return admin
 
 @api_router.post("/auth/register", response_model=TokenResponse)
-async def register_admin(admin_data: AdminCreate):
-    existing = await db.admins.find_one({"email": admin_data.email}, {"_id": 0})
-    if existing:
-        raise HTTPException(status_code=400, detail="Email already registered")
-    
-    password_hash = get_password_hash(admin_data.password)
+async def register_admin(admin_data: AdminCreate, request: Request):
+    enforce_login_rate_limit(request, admin_data.email)
+    password_hash = await password_hasher.hash(admin_data.password)
     admin = Admin(email=admin_data.email, password_hash=password_hash)
     
     doc = admin.model_dump()
-    doc['created_at'] = doc['created_at'].isoformat()
-    await db.admins.insert_one(doc)
+    try:
+        await db.admins.insert_one(doc)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="Email already registered")
+    invalidate_admin(admin.email)
     
     access_token = create_access_token(data={"sub": admin.email})
     return TokenResponse(access_token=access_token, token_type="bearer")
 
 @api_router.post("/auth/login", response_model=TokenResponse)
-async def login_admin(login_data: AdminLogin):
+async def login_admin(login_data: AdminLogin, request: Request):
+    enforce_login_rate_limit(request, login_data.email)
     admin = await db.admins.find_one({"email": login_data.email}, {"_id": 0})
-    if not admin or not verify_password(login_data.password, admin['password_hash']):
+    if not admin or not await password_hasher.verify(login_data.password, admin['password_hash']):
         raise HTTPException(status_code=401, detail="Invalid email or password")
     
+    login_rate_limiter.reset(("email", login_data.email.lower()))
     access_token = create_access_token(data={"sub": admin['email']})
     return TokenResponse(access_token=access_token, token_type="bearer")
 
+@api_router.post("/auth/logout")
+async def logout_admin(credentials: HTTPAuthorizationCredentials = Depends(security), admin: dict = Depends(get_current_admin)):
+    payload = decode_access_token(credentials.credentials)
+    jti = payload.get("jti")
+    if jti:
+        expires_at = datetime.fromtimestamp(payload["exp"], tz=timezone.utc)
+        revoked_tokens.revoke(jti, expires_at.timestamp())
+        await db.revoked_tokens.update_one(
+            {"jti": jti},
+            {"$set": {"jti": jti, "expires_at": expires_at, "revoked_at": datetime.now(timezone.utc)}},
+            upsert=True
+        )
+    return {"message": "Logged out successfully"}
+
+@api_router.get("/auth/stats", response_model=AuthStats)
+async def get_auth_stats(admin: dict = Depends(get_current_admin)):
+    return AuthStats(password_hasher=password_hasher.stats(), login_rate_limiter=login_rate_limiter.stats())
+
+async def load_all_seo_settings():
+    return await public_reads().seo_settings.find({}, {"_id": 0}).to_list(1000)
+
+async def load_seo_settings(page: str):
+    setting = await public_reads().seo_settings.find_one({"page": page}, {"_id": 0})
+    if not setting:
+        return None
+    return cached_resource(setting, setting.get('updated_at'))
+
 @api_router.get("/seo", response_model=List[SEOSettings])
 async def get_all_seo_settings():
-    settings = await db.seo_settings.find({}, {"_id": 0}).to_list(1000)
-    for s in settings:
-        if isinstance(s.get('updated_at'), str):
-            s['updated_at'] = datetime.fromisoformat(s['updated_at'])
+    settings = await read_cache.get_or_load(("seo_all",), load_all_seo_settings)
+    if FAST_JSON:
+        return json_response(json_body(SEOSettings, settings, many=True))
     return settings
 
+async def load_seo_bundle() -> CachedResource:
+    # Serialized once per change so a page view is one cache hit and a byte copy, with no
+    # Pydantic validation on the way out.
+    settings, blogs = await asyncio.gather(
+        load_all_seo_settings(),
+        load_blogs(True, BLOG_PAGE_DEFAULT_LIMIT, None, BLOG_SUMMARY_FIELDS)
+    )
+    bundle = {
+        "seo": {setting["page"]: setting for setting in settings},
+        "blogs": blogs.value["items"],
+        "next_cursor": blogs.value["next_cursor"],
+    }
+    body = dumps_json(bundle)
+    timestamps = [as_utc(setting.get("updated_at")) for setting in settings] + [blogs.last_modified]
+    last_modified = max((timestamp for timestamp in timestamps if timestamp), default=None)
+    return CachedResource(body, make_etag(body), last_modified)
+
+@api_router.get("/seo/bundle")
+async def get_seo_bundle(request: Request):
+    resource = await read_cache.get_or_load(("seo_bundle",), load_seo_bundle)
+    not_modified = not_modified_response(request, resource)
+    if not_modified:
+        return not_modified
+    return Response(resource.value, media_type="application/json", headers=validator_headers(resource.etag, resource.last_modified))
+
 @api_router.get("/seo/{page}", response_model=SEOSettings)
-async def get_seo_settings(page: str):
-    setting = await db.seo_settings.find_one({"page": page}, {"_id": 0})
-    if not setting:
+async def get_seo_settings(page: str, request: Request, response: Response):
+    resource = await read_cache.get_or_load(("seo", page), lambda: load_seo_settings(page))
+    if not resource:
         raise HTTPException(status_code=404, detail="SEO settings not found")
-    if isinstance(setting.get('updated_at'), str):
-        setting['updated_at'] = datetime.fromisoformat(setting['updated_at'])
-    return setting
+    not_modified = not_modified_response(request, resource)
+    if not_modified:
+        return not_modified
+    if FAST_JSON:
+        return json_response(cached_json_body(SEOSettings, resource.value, resource.etag), validator_headers(resource.etag, resource.last_modified))
+    response.headers.update(validator_headers(resource.etag, resource.last_modified))
+    return resource.value
 
 @api_router.post("/seo", response_model=SEOSettings)
 async def create_seo_settings(seo_data: SEOSettingsCreate, admin: dict = Depends(get_current_admin)):
-    existing = await db.seo_settings.find_one({"page": seo_data.page}, {"_id": 0})
-    if existing:
-        raise HTTPException(status_code=400, detail="SEO settings already exist for this page")
-    
     seo = SEOSettings(**seo_data.model_dump())
     doc = seo.model_dump()
-    doc['updated_at'] = doc['updated_at'].isoformat()
-    await db.seo_settings.insert_one(doc)
+    try:
+        await db.seo_settings.insert_one(doc)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="SEO settings already exist for this page")
+    invalidate_seo_reads(seo.page)
     return seo
 
 @api_router.put("/seo/{page}", response_model=SEOSettings)
@@ -223,84 +1494,597 @@ async def update_seo_settings(page: str, seo_data: SEOSettingsCreate, admin: dic
     data['page'] = page
     seo = SEOSettings(**data)
     doc = seo.model_dump()
-    doc['updated_at'] = doc['updated_at'].isoformat()
     
     result = await db.seo_settings.update_one(
         {"page": page},
         {"$set": doc},
         upsert=True
     )
+    invalidate_seo_reads(page)
     return seo
 
+async def load_robots_txt():
+    robots = await public_reads().robots_txt.find_one({}, {"_id": 0}, sort=[("updated_at", -1)])
+    if not robots:
+        return cached_resource(DEFAULT_ROBOTS_TXT)
+    return cached_resource(robots['content'], robots.get('updated_at'))
+
+async def get_robots_txt_resource() -> CachedResource:
+    return await read_cache.get_or_load(("robots",), load_robots_txt)
+
 @api_router.get("/robots-txt")
 async def get_robots_txt():
-    robots = await db.robots_txt.find_one({}, {"_id": 0}, sort=[("updated_at", -1)])
-    if not robots:
-        default_content = "User-agent: *\nAllow: /\nSitemap: https://seo-llm-connect.preview.emergentagent.com/sitemap.xml"
-        return {"content": default_content}
-    return {"content": robots['content']}
+    return {"content": (await get_robots_txt_resource()).value}
 
 @api_router.put("/robots-txt", response_model=RobotsTxt)
 async def update_robots_txt(robots_data: RobotsTxtCreate, admin: dict = Depends(get_current_admin)):
-    robots = RobotsTxt(content=robots_data.content)
-    doc = robots.model_dump()
-    doc['updated_at'] = doc['updated_at'].isoformat()
-    
-    await db.robots_txt.delete_many({})
-    await db.robots_txt.insert_one(doc)
+    # One document under a fixed _id, replaced in place; older rows from before this layout sort behind it.
+    robots = await db.robots_txt.find_one_and_update(
+        {"_id": ROBOTS_TXT_DOC_ID},
+        {"$set": {"content": robots_data.content, "updated_at": datetime.now(timezone.utc)}, "$setOnInsert": {"id": str(uuid.uuid4())}},
+        projection={"_id": 0},
+        upsert=True,
+        return_document=ReturnDocument.AFTER
+    )
+    note_local_write()
+    read_cache.invalidate(("robots",))
     return robots
 
-@api_router.get("/blogs", response_model=List[Blog])
-async def get_all_blogs(published_only: bool = True):
-    query = {"published": True} if published_only else {}
-    blogs = await db.blogs.find(query, {"_id": 0}).sort("created_at", -1).to_list(1000)
-    for blog in blogs:
-        if isinstance(blog.get('created_at'), str):
-            blog['created_at'] = datetime.fromisoformat(blog['created_at'])
-        if isinstance(blog.get('updated_at'), str):
-            blog['updated_at'] = datetime.fromisoformat(blog['updated_at'])
-    return blogs
+SEARCH_TOKEN_RE = re.compile(r"[a-z0-9]+")
+SEARCH_STOPWORDS = frozenset(
+    "a an and are as at be but by for from how if in into is it its not of on or so such that the "
+    "their then there these they this to was we what when which will with you your".split()
+)
 
-@api_router.get("/blogs/{slug}", response_model=Blog)
-async def get_blog(slug: str):
-    blog = await db.blogs.find_one({"slug": slug}, {"_id": 0})
+def search_tokens(text: Optional[str]) -> List[str]:
+    return [token for token in SEARCH_TOKEN_RE.findall((text or "").lower()) if token not in SEARCH_STOPWORDS]
+
+class BlogSearchIndex:
+    """In-memory BM25 inverted index over published posts, patched by blog write hooks.
+
+    Each term's postings are a pair of NumPy arrays (slots, weighted term frequencies) so
+    scoring is vectorised. A full load collects postings in lists and converts them once;
+    single-post writes patch the affected arrays in place."""
+
+    def __init__(self, k1: float = 1.2, b: float = 0.75):
+        self.k1 = k1
+        self.b = b
+        self._loaded = False
+        self._loading = False
+        self._reload_requested = False
+        self._lock = asyncio.Lock()
+        self._warming: Optional[asyncio.Task] = None
+        self._reset()
+
+    def _reset(self):
+        self._pending: Optional[Dict[str, Tuple[List[int], List[float]]]] = None
+        self._postings: Dict[str, Tuple[np.ndarray, np.ndarray]] = {}
+        self._slots: Dict[str, int] = {}
+        self._slugs: List[Optional[str]] = []
+        self._doc_terms: List[Tuple[str, ...]] = []
+        self._free: List[int] = []
+        self._lengths = np.zeros(1024, dtype=np.float32)
+        self._total_length = 0.0
+
+    @property
+    def warm(self) -> bool:
+        return self._loaded
+
+    def warm_in_background(self):
+        if self._warming is None or self._warming.done():
+            self._warming = asyncio.create_task(self._warm())
+
+    async def _warm(self):
+        try:
+            await self.ensure_loaded()
+        except PyMongoError as exc:
+            logger.error("Could not build the blog search index: %s", exc)
+
+    async def ensure_loaded(self):
+        if not self._loaded:
+            async with self._lock:
+                if not self._loaded:
+                    await self._load()
+
+    async def _load(self):
+        self._loading = True
+        try:
+            while True:
+                self._reload_requested = False
+                self._begin_build()
+                projection = {"_id": 0, "slug": 1, **{field: 1 for field in SEARCH_FIELD_WEIGHTS}}
+                async for blog in public_reads().blogs.find({"published": True}, projection).batch_size(SITEMAP_STREAM_BATCH_SIZE):
+                    self._add(blog)
+                    if len(self._slots) % 500 == 0:
+                        await asyncio.sleep(0)
+                self._finish_build()
+                if not self._reload_requested:
+                    break
+        finally:
+            self._loading = False
+        self._loaded = True
+
+    def _begin_build(self):
+        self._reset()
+        self._pending = {}
+
+    def _finish_build(self):
+        self._postings = {
+            term: (np.array(slots, dtype=np.int64), np.array(frequencies, dtype=np.float32))
+            for term, (slots, frequencies) in self._pending.items()
+        }
+        self._pending = None
+
+    def _add(self, blog: dict):
+        weighted: Dict[str, float] = {}
+        for field, weight in SEARCH_FIELD_WEIGHTS.items():
+            for token in search_tokens(blog.get(field)):
+                weighted[token] = weighted.get(token, 0.0) + weight
+        if self._free:
+            slot = self._free.pop()
+            self._slugs[slot] = blog["slug"]
+            self._doc_terms[slot] = tuple(weighted)
+        else:
+            slot = len(self._slugs)
+            self._slugs.append(blog["slug"])
+            self._doc_terms.append(tuple(weighted))
+            if slot >= len(self._lengths):
+                self._lengths = np.concatenate([self._lengths, np.zeros(len(self._lengths), dtype=np.float32)])
+        self._slots[blog["slug"]] = slot
+        length = sum(weighted.values())
+        self._lengths[slot] = length
+        self._total_length += length
+        for term, frequency in weighted.items():
+            if self._pending is not None:
+                slots, frequencies = self._pending.setdefault(term, ([], []))
+                slots.append(slot)
+                frequencies.append(frequency)
+            elif term in self._postings:
+                slots, frequencies = self._postings[term]
+                self._postings[term] = (np.append(slots, slot), np.append(frequencies, np.float32(frequency)))
+            else:
+                self._postings[term] = (np.array([slot], dtype=np.int64), np.array([frequency], dtype=np.float32))
+
+    def _remove(self, slug: str):
+        slot = self._slots.pop(slug, None)
+        if slot is None:
+            return
+        for term in self._doc_terms[slot]:
+            slots, frequencies = self._postings[term]
+            keep = slots != slot
+            if keep.any():
+                self._postings[term] = (slots[keep], frequencies[keep])
+            else:
+                del self._postings[term]
+        self._total_length -= float(self._lengths[slot])
+        self._lengths[slot] = 0.0
+        self._slugs[slot] = None
+        self._doc_terms[slot] = ()
+        self._free.append(slot)
+
+    def upsert(self, blog: dict):
+        if self._loading:
+            self._reload_requested = True
+        if not self._loaded:
+            return
+        self._remove(blog["slug"])
+        if blog.get("published"):
+            self._add(blog)
+
+    def remove(self, slug: str):
+        if self._loading:
+            self._reload_requested = True
+        if self._loaded:
+            self._remove(slug)
+
+    def invalidate(self):
+        if self._loading:
+            self._reload_requested = True
+        self._loaded = False
+
+    def search(self, terms: List[str], limit: int, offset: int = 0) -> Tuple[int, List[Tuple[str, float]]]:
+        terms = [term for term in dict.fromkeys(terms) if term in self._postings]
+        documents = len(self._slots)
+        if not terms or not documents:
+            return 0, []
+        average_length = self._total_length / documents
+        scores = np.zeros(len(self._slugs), dtype=np.float32)
+        for term in terms:
+            slots, frequencies = self._postings[term]
+            idf = math.log(1 + (documents - len(slots) + 0.5) / (len(slots) + 0.5))
+            norms = frequencies + self.k1 * (1 - self.b + self.b * self._lengths[slots] / average_length)
+            scores[slots] += idf * frequencies * (self.k1 + 1) / norms
+        matched = np.flatnonzero(scores)
+        wanted = offset + limit
+        if wanted < len(matched):
+            matched = matched[np.argpartition(-scores[matched], wanted - 1)[:wanted]]
+        ranked = matched[np.argsort(-scores[matched], kind="stable")][offset:wanted]
+        return int(np.count_nonzero(scores)), [(self._slugs[slot], round(float(scores[slot]), 4)) for slot in ranked]
+
+blog_search_index = BlogSearchIndex()
+
+def search_snippet(blog: dict, terms: List[str]) -> str:
+    pattern = re.compile(r"(?<![a-z0-9])(" + "|".join(map(re.escape, terms)) + r")(?![a-z0-9])", re.IGNORECASE)
+    candidates = [re.sub(r"\s+", " ", re.sub(r"<[^>]+>|[#*_`>|\[\]]", " ", blog.get(field) or "")).strip()
+                  for field in ("content", "excerpt", "title")]
+    text, match = next(((text, pattern.search(text)) for text in candidates if pattern.search(text)), (candidates[1], None))
+    start = max(0, match.start() - SEARCH_SNIPPET_CHARS // 4) if match else 0
+    end = min(len(text), start + SEARCH_SNIPPET_CHARS)
+    # Match on the raw text and escape each piece, so terms like "amp" never land inside an entity.
+    pieces = pattern.split(text[start:end]) if terms else [text[start:end]]
+    snippet = "".join(f"<mark>{escape(piece)}</mark>" if index % 2 else escape(piece) for index, piece in enumerate(pieces))
+    return f"{'…' if start else ''}{snippet}{'…' if end < len(text) else ''}"
+
+async def load_blog_search(q: str, limit: int, offset: int) -> BlogSearchResults:
+    await blog_search_index.ensure_loaded()
+    terms = search_tokens(q)
+    total, ranked = blog_search_index.search(terms, limit, offset)
+    projection = {"_id": 0, "slug": 1, "title": 1, "excerpt": 1, "content": 1, "featured_image": 1, "created_at": 1}
+    blogs = {blog["slug"]: blog async for blog in public_reads().blogs.find({"slug": {"$in": [slug for slug, _ in ranked]}}, projection)}
+    items = [
+        BlogSearchHit(**blogs[slug], score=score, snippet=search_snippet(blogs[slug], terms))
+        for slug, score in ranked if slug in blogs
+    ]
+    return BlogSearchResults(query=q, total=total, items=items)
+
+def related_features(blog: dict, dim: int) -> np.ndarray:
+    buckets: List[int] = []
+    weights: List[float] = []
+    for field, weight in RELATED_FIELD_WEIGHTS.items():
+        for token in search_tokens(blog.get(field)):
+            buckets.append(zlib.crc32(token.encode("utf-8")) % dim)
+            weights.append(weight)
+    counts = np.bincount(np.array(buckets, dtype=np.int64), weights=np.array(weights, dtype=np.float64), minlength=dim)
+    return np.log1p(counts).astype(np.float32)
+
+class RelatedPostsIndex:
+    """Hashed TF-IDF vectors for published posts and each post's precomputed top-N neighbours.
+
+    Served lists live in ``blog_related`` so a request is a single lookup. The in-memory matrix
+    is only needed to patch those lists when a post is written, so it is loaded from the stored
+    vectors on the first write; IDF comes from live document frequencies and is applied at
+    comparison time. Rows written by other workers are queued by ``sync`` and folded into the
+    matrix before the next local update.
+
+    Row norms under the live IDF are kept incrementally: with ``a = log(1 + N) + 1`` and
+    ``b = log(1 + df)`` each row's squared norm is ``a²·Σm² - 2a·Σm²b + Σm²b²``, so a write
+    only updates the columns whose document frequency it changed."""
+
+    def __init__(self, dim: int = RELATED_POSTS_DIM, top_n: int = RELATED_POSTS_COUNT):
+        self.dim = dim
+        self.top_n = top_n
+        self._loaded = False
+        self._lock = asyncio.Lock()
+        self._building: Optional[asyncio.Task] = None
+        self._reset()
+
+    def _reset(self):
+        self._slots: Dict[str, int] = {}
+        self._slugs: List[Optional[str]] = []
+        self._free: List[int] = []
+        self._matrix = np.zeros((0, self.dim), dtype=np.float32)
+        self._active = np.zeros(0, dtype=bool)
+        self._df = np.zeros(self.dim, dtype=np.float64)
+        self._norm_terms = np.zeros((0, 3), dtype=np.float64)
+        self._related: Dict[str, List[Tuple[str, float]]] = {}
+        self._pending: Dict[str, Optional[dict]] = {}
+
+    def _set_vector(self, slug: str, vector: np.ndarray, incremental: bool = True) -> int:
+        self._drop_vector(slug, incremental)
+        if self._free:
+            slot = self._free.pop()
+            self._slugs[slot] = slug
+        else:
+            slot = len(self._slugs)
+            self._slugs.append(slug)
+            if slot >= len(self._matrix):
+                grow = max(256, len(self._matrix))
+                self._matrix = np.vstack([self._matrix, np.zeros((grow, self.dim), dtype=np.float32)])
+                self._active = np.concatenate([self._active, np.zeros(grow, dtype=bool)])
+                self._norm_terms = np.vstack([self._norm_terms, np.zeros((grow, 3), dtype=np.float64)])
+        self._slots[slug] = slot
+        self._matrix[slot] = vector
+        self._active[slot] = True
+        if incremental:
+            self._norm_terms[slot] = self._row_norm_terms(vector)
+            self._shift_df(np.flatnonzero(vector > 0), 1)
+        else:
+            self._df += vector > 0
+        return slot
+
+    def _drop_vector(self, slug: str, incremental: bool = True):
+        slot = self._slots.pop(slug, None)
+        if slot is None:
+            return
+        if incremental:
+            self._shift_df(np.flatnonzero(self._matrix[slot] > 0), -1)
+        else:
+            self._df -= self._matrix[slot] > 0
+        self._matrix[slot] = 0.0
+        self._norm_terms[slot] = 0.0
+        self._active[slot] = False
+        self._slugs[slot] = None
+        self._free.append(slot)
+
+    def _row_norm_terms(self, rows: np.ndarray) -> np.ndarray:
+        squares = rows.astype(np.float64) ** 2
+        b = np.log1p(self._df)
+        return np.stack([squares.sum(-1), squares @ b, squares @ (b ** 2)], axis=-1)
+
+    def _shift_df(self, dims: np.ndarray, delta: int):
+        before = np.log1p(self._df[dims])
+        self._df[dims] += delta
+        after = np.log1p(self._df[dims])
+        # Only the changed columns are read: an N x k temporary instead of the whole matrix.
+        squares = self._matrix[:, dims].astype(np.float64) ** 2
+        self._norm_terms[:, 1:] += squares @ np.column_stack([after - before, after ** 2 - before ** 2])
+
+    def _recompute_norm_terms(self, block: int = 4096):
+        for start in range(0, len(self._matrix), block):
+            self._norm_terms[start:start + block] = self._row_norm_terms(self._matrix[start:start + block])
+
+    def _norms(self) -> np.ndarray:
+        a = np.log1p(len(self._slots)) + 1
+        s0, s1, s2 = self._norm_terms.T
+        return np.sqrt(np.maximum(a * a * s0 - 2 * a * s1 + s2, 0.0))
+
+    def _similarities(self, slots: List[int]) -> np.ndarray:
+        idf = np.log((1 + len(self._slots)) / (1 + self._df)) + 1
+        squared = (idf ** 2).astype(np.float32)
+        norms = self._norms()
+        norms[norms == 0] = 1.0
+        rows = self._matrix[slots] * squared
+        return (rows @ self._matrix.T) / np.outer(norms[slots], norms)
+
+    def _neighbours(self, slots: List[int], block: int = 512) -> Dict[str, List[Tuple[str, float]]]:
+        neighbours = {}
+        for start in range(0, len(slots), block):
+            chunk = slots[start:start + block]
+            for slot, row in zip(chunk, self._similarities(chunk)):
+                row[slot] = 0.0
+                row[~self._active] = 0.0
+                candidates = np.flatnonzero(row > 0)
+                if len(candidates) > self.top_n:
+                    candidates = candidates[np.argpartition(-row[candidates], self.top_n - 1)[:self.top_n]]
+                ranked = candidates[np.argsort(-row[candidates], kind="stable")]
+                neighbours[self._slugs[slot]] = [(self._slugs[other], round(float(row[other]), 4)) for other in ranked]
+        return neighbours
+
+    def _floor(self, slug: str) -> float:
+        related = self._related.get(slug, [])
+        return related[-1][1] if len(related) >= self.top_n else 0.0
+
+    def _apply(self, slug: str, vector: Optional[np.ndarray]) -> Dict[str, List[Tuple[str, float]]]:
+        affected = {other for other, related in self._related.items() if any(s == slug for s, _ in related)}
+        self._related.pop(slug, None)
+        if vector is None:
+            self._drop_vector(slug)
+            affected.discard(slug)
+        else:
+            slot = self._set_vector(slug, vector)
+            similarities = self._similarities([slot])[0]
+            affected.add(slug)
+            affected.update(
+                self._slugs[other] for other in np.flatnonzero(self._active)
+                if other != slot and similarities[other] > self._floor(self._slugs[other])
+            )
+        updated = self._neighbours([self._slots[other] for other in affected if other in self._slots])
+        self._related.update(updated)
+        return updated
+
+    def _apply_pending(self):
+        pending, self._pending = self._pending, {}
+        for slug, row in pending.items():
+            if row is None:
+                self._drop_vector(slug)
+                self._related.pop(slug, None)
+                continue
+            vector = np.frombuffer(row.get("vector", b""), dtype=np.float32)
+            slot = self._slots.get(slug)
+            # Echoes of this worker's own writes carry the vector it already holds.
+            if len(vector) == self.dim and (slot is None or not np.array_equal(self._matrix[slot], vector)):
+                self._set_vector(slug, vector)
+            self._related[slug] = [(entry["slug"], entry["score"]) for entry in row.get("related", [])]
+
+    async def _load(self, database):
+        self._reset()
+        async for doc in database.blog_related.find({}, {"_id": 0, "slug": 1, "vector": 1, "related": 1}):
+            vector = np.frombuffer(doc["vector"], dtype=np.float32)
+            if len(vector) != self.dim:
+                continue
+            self._set_vector(doc["slug"], vector, incremental=False)
+            self._related[doc["slug"]] = [(entry["slug"], entry["score"]) for entry in doc.get("related", [])]
+        self._recompute_norm_terms()
+        self._loaded = True
+
+    async def _persist(self, database, updated: Dict[str, List[Tuple[str, float]]], vectors: Dict[str, np.ndarray]):
+        now = datetime.now(timezone.utc)
+        operations = []
+        for slug, related in updated.items():
+            fields = {"related": [{"slug": other, "score": score} for other, score in related], "updated_at": now}
+            if slug in vectors:
+                fields["vector"] = vectors[slug].tobytes()
+            operations.append(UpdateOne({"slug": slug}, {"$set": fields}, upsert=True))
+        for start in range(0, len(operations), 500):
+            await database.blog_related.bulk_write(operations[start:start + 500], ordered=False)
+
+    async def upsert(self, blog: dict):
+        vector = related_features(blog, self.dim) if blog.get("published") else None
+        try:
+            async with self._lock:
+                if not self._loaded:
+                    await self._load(db)
+                self._apply_pending()
+                updated = await asyncio.to_thread(self._apply, blog["slug"], vector)
+                if vector is None and (await db.blog_related.delete_one({"slug": blog["slug"]})).deleted_count:
+                    await record_deletions("blog_related", [blog["slug"]])
+                await self._persist(db, updated, {blog["slug"]: vector} if vector is not None else {})
+        except PyMongoError as exc:
+            self._loaded = False
+            logger.error("Could not update related posts for %s: %s", blog["slug"], exc)
+
+    async def remove(self, slug: str):
+        await self.upsert({"slug": slug, "published": False})
+
+    def sync(self, slug: str, row: Optional[dict]):
+        """Record a ``blog_related`` row written by any worker; ``None`` means it was deleted."""
+        self._pending[slug] = row
+
+    def invalidate(self):
+        # Changes may have been missed; reload the persisted vectors before the next local update.
+        self._loaded = False
+
+    def build_if_missing_in_background(self):
+        if self._building is None or self._building.done():
+            self._building = asyncio.create_task(self._build_if_missing())
+
+    async def _build_if_missing(self):
+        # Deployments that predate related posts have no blog_related rows and would serve empty
+        # lists until rebuild_related.py is run, so the first start builds them.
+        try:
+            if await db.blog_related.find_one({}, {"_id": 1}) is None and await db.blogs.find_one({"published": True}, {"_id": 1}):
+                logger.info("Related posts built for %d published posts", await self.rebuild())
+        except PyMongoError as exc:
+            logger.error("Could not build related posts: %s", exc)
+
+    async def rebuild(self, database=None) -> int:
+        database = database if database is not None else db
+        started = datetime.now(timezone.utc)
+        async with self._lock:
+            self._reset()
+            vectors = {}
+            projection = {"_id": 0, "slug": 1, **{field: 1 for field in RELATED_FIELD_WEIGHTS}}
+            async for blog in database.blogs.find({"published": True}, projection).batch_size(SITEMAP_STREAM_BATCH_SIZE):
+                vectors[blog["slug"]] = related_features(blog, self.dim)
+                self._set_vector(blog["slug"], vectors[blog["slug"]], incremental=False)
+            self._recompute_norm_terms()
+            self._related = await asyncio.to_thread(self._neighbours, list(self._slots.values()))
+            await self._persist(database, self._related, vectors)
+            stale = {"updated_at": {"$lt": started}}
+            removed = [doc["slug"] async for doc in database.blog_related.find(stale, {"_id": 0, "slug": 1})]
+            await database.blog_related.delete_many(stale)
+            await record_deletions("blog_related", removed, database)
+            self._loaded = database is db
+        return len(self._related)
+
+related_posts = RelatedPostsIndex()
+
+async def load_related_blogs(slug: str, limit: int) -> List[RelatedBlog]:
+    doc = await public_reads().blog_related.find_one({"slug": slug}, {"_id": 0, "related": 1})
+    related = (doc or {}).get("related", [])
+    scores = {entry["slug"]: entry["score"] for entry in related}
+    projection = {"_id": 0, "slug": 1, "title": 1, "excerpt": 1, "featured_image": 1, "created_at": 1}
+    blogs = {blog["slug"]: blog async for blog in public_reads().blogs.find({"slug": {"$in": list(scores)}, "published": True}, projection)}
+    return [RelatedBlog(**blogs[entry["slug"]], score=entry["score"]) for entry in related if entry["slug"] in blogs][:limit]
+
+async def load_blogs(published_only: bool, limit: int, cursor: Optional[str], fields: List[str]):
+    query: Dict[str, Any] = {"published": True} if published_only else {}
+    if cursor:
+        created_at, blog_id = decode_cursor(cursor, 2)
+        created_at = parse_cursor_datetime(created_at)
+        query["$or"] = [
+            {"created_at": {"$lt": created_at}},
+            {"created_at": created_at, "id": {"$lt": blog_id}},
+        ]
+    projection = {"_id": 0, **{field: 1 for field in fields}}
+    blogs = await public_reads().blogs.find(query, projection).sort([("created_at", -1), ("id", -1)]).limit(limit + 1).to_list(limit + 1)
+    next_cursor = None
+    if len(blogs) > limit:
+        blogs = blogs[:limit]
+        next_cursor = encode_cursor([blogs[-1]['created_at'], blogs[-1]['id']])
+    last_modified = max((as_utc(blog['updated_at']) for blog in blogs if blog.get('updated_at')), default=None)
+    return cached_resource({"items": blogs, "next_cursor": next_cursor}, last_modified)
+
+async def load_blog(slug: str):
+    blog = await public_reads().blogs.find_one({"slug": slug}, {"_id": 0})
     if not blog:
+        return None
+    return cached_resource(blog, blog.get('updated_at'))
+
+@api_router.get("/blogs", response_model=List[BlogSummary], response_model_exclude_unset=True)
+async def get_all_blogs(
+    request: Request,
+    response: Response,
+    published_only: bool = True,
+    limit: int = Query(BLOG_PAGE_DEFAULT_LIMIT, ge=1, le=BLOG_PAGE_MAX_LIMIT),
+    cursor: Optional[str] = None,
+    fields: Optional[str] = None,
+):
+    selected = parse_blog_fields(fields)
+    key = ("blogs", published_only, limit, cursor, tuple(selected))
+    resource = await read_cache.get_or_load(key, lambda: load_blogs(published_only, limit, cursor, selected))
+    headers = validator_headers(resource.etag, resource.last_modified)
+    if resource.value["next_cursor"]:
+        headers["X-Next-Cursor"] = resource.value["next_cursor"]
+    if is_not_modified(request, resource.etag, resource.last_modified):
+        return Response(status_code=304, headers=headers)
+    if FAST_JSON:
+        return json_response(cached_json_body(BlogSummary, resource.value["items"], resource.etag, many=True, exclude_unset=True), headers)
+    response.headers.update(headers)
+    return resource.value["items"]
+
+@api_router.get("/blogs/search", response_model=BlogSearchResults)
+async def search_blogs(
+    q: str = Query(..., min_length=1, max_length=200),
+    limit: int = Query(BLOG_SEARCH_DEFAULT_LIMIT, ge=1, le=BLOG_SEARCH_MAX_LIMIT),
+    offset: int = Query(0, ge=0, le=BLOG_SEARCH_MAX_OFFSET),
+):
+    key = ("blogs", "search", " ".join(search_tokens(q)), limit, offset)
+    results = await read_cache.get_or_load(key, lambda: load_blog_search(q, limit, offset))
+    return results.model_copy(update={"query": q})
+
+@api_router.get("/blogs/{slug}", response_model=Blog)
+async def get_blog(slug: str, request: Request, response: Response):
+    resource = await read_cache.get_or_load(("blog", slug), lambda: load_blog(slug))
+    if not resource:
         raise HTTPException(status_code=404, detail="Blog not found")
-    if isinstance(blog.get('created_at'), str):
-        blog['created_at'] = datetime.fromisoformat(blog['created_at'])
-    if isinstance(blog.get('updated_at'), str):
-        blog['updated_at'] = datetime.fromisoformat(blog['updated_at'])
-    return blog
+    not_modified = not_modified_response(request, resource)
+    if not_modified:
+        return not_modified
+    if FAST_JSON:
+        return json_response(cached_json_body(Blog, resource.value, resource.etag), validator_headers(resource.etag, resource.last_modified))
+    response.headers.update(validator_headers(resource.etag, resource.last_modified))
+    return resource.value
+
+@api_router.get("/blogs/{slug}/related", response_model=List[RelatedBlog])
+async def get_related_blogs(slug: str, limit: int = Query(RELATED_POSTS_DEFAULT_LIMIT, ge=1, le=RELATED_POSTS_COUNT)):
+    return await read_cache.get_or_load(("blogs", "related", slug, limit), lambda: load_related_blogs(slug, limit))
 
 @api_router.post("/blogs", response_model=Blog)
 async def create_blog(blog_data: BlogCreate, admin: dict = Depends(get_current_admin)):
-    existing = await db.blogs.find_one({"slug": blog_data.slug}, {"_id": 0})
-    if existing:
-        raise HTTPException(status_code=400, detail="Blog with this slug already exists")
-    
     blog = Blog(**blog_data.model_dump())
     doc = blog.model_dump()
-    doc['created_at'] = doc['created_at'].isoformat()
-    doc['updated_at'] = doc['updated_at'].isoformat()
-    await db.blogs.insert_one(doc)
+    try:
+        await db.blogs.insert_one(doc)
+    except DuplicateKeyError:
+        raise HTTPException(status_code=400, detail="Blog with this slug already exists")
+    invalidate_blog_reads(blog.slug)
+    blog_search_index.upsert(doc)
+    await related_posts.upsert(doc)
+    if blog.published:
+        sitemap_cache.upsert(blog.slug, doc['updated_at'])
     return blog
 
 @api_router.put("/blogs/{slug}", response_model=Blog)
 async def update_blog(slug: str, blog_data: BlogUpdate, admin: dict = Depends(get_current_admin)):
-    existing = await db.blogs.find_one({"slug": slug}, {"_id": 0})
-    if not existing:
-        raise HTTPException(status_code=404, detail="Blog not found")
-    
     update_data = {k: v for k, v in blog_data.model_dump().items() if v is not None}
-    update_data['updated_at'] = datetime.now(timezone.utc).isoformat()
+    update_data['updated_at'] = datetime.now(timezone.utc)
     
-    await db.blogs.update_one({"slug": slug}, {"$set": update_data})
-    
-    updated_blog = await db.blogs.find_one({"slug": slug}, {"_id": 0})
-    if isinstance(updated_blog.get('created_at'), str):
-        updated_blog['created_at'] = datetime.fromisoformat(updated_blog['created_at'])
-    if isinstance(updated_blog.get('updated_at'), str):
-        updated_blog['updated_at'] = datetime.fromisoformat(updated_blog['updated_at'])
+    updated_blog = await db.blogs.find_one_and_update(
+        {"slug": slug},
+        {"$set": update_data},
+        projection={"_id": 0},
+        return_document=ReturnDocument.AFTER
+    )
+    if not updated_blog:
+        raise HTTPException(status_code=404, detail="Blog not found")
+    invalidate_blog_reads(slug)
+    blog_search_index.upsert(updated_blog)
+    await related_posts.upsert(updated_blog)
+    if updated_blog.get('published'):
+        sitemap_cache.upsert(slug, updated_blog.get('updated_at'))
+    else:
+        sitemap_cache.remove(slug)
     return updated_blog
 
 @api_router.delete("/blogs/{slug}")
@@ -308,154 +2092,1039 @@ async def delete_blog(slug: str, admin: dict = Depends(get_current_admin)):
     result = await db.blogs.delete_one({"slug": slug})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Blog not found")
+    await record_deletions("blogs", [slug])
+    invalidate_blog_reads(slug)
+    blog_search_index.remove(slug)
+    await related_posts.remove(slug)
+    sitemap_cache.remove(slug)
     return {"message": "Blog deleted successfully"}
 
+def keyword_range(low: Optional[int], high: Optional[int]) -> Optional[Dict[str, int]]:
+    bounds = {op: value for op, value in (("$gte", low), ("$lte", high)) if value is not None}
+    return bounds or None
+
+def keyword_keyset(sort: str, descending: bool, value: Any, keyword_id: str) -> Dict[str, Any]:
+    # Nulls sort first ascending and last descending, so the page after a null (or before the
+    # first null) needs its own branch; the id tie-breaker follows the sort direction.
+    op = "$lt" if descending else "$gt"
+    if value is None:
+        same = {sort: None, "id": {op: keyword_id}}
+        return same if descending else {"$or": [same, {sort: {"$ne": None}}]}
+    branches = [{sort: {op: value}}, {sort: value, "id": {op: keyword_id}}]
+    if descending:
+        branches.append({sort: None})
+    return {"$or": branches}
+
+async def load_keywords(filters: Dict[str, Any], sort: str, descending: bool, limit: int, cursor: Optional[str]):
+    query = dict(filters)
+    if cursor:
+        cursor_sort, cursor_order, value, keyword_id = decode_cursor(cursor, 4)
+        if cursor_sort != sort or cursor_order != descending:
+            raise HTTPException(status_code=400, detail="Cursor does not match the requested sort")
+        if sort == "tracked_at" and value is not None:
+            value = parse_cursor_datetime(value)
+        query = {"$and": [query, keyword_keyset(sort, descending, value, keyword_id)]} if query else keyword_keyset(sort, descending, value, keyword_id)
+    direction = DESCENDING if descending else ASCENDING
+    keywords = await db.keywords.find(query, {"_id": 0}).sort([(sort, direction), ("id", direction)]).limit(limit + 1).to_list(limit + 1)
+    next_cursor = None
+    if len(keywords) > limit:
+        keywords = keywords[:limit]
+        next_cursor = encode_cursor([sort, descending, keywords[-1].get(sort), keywords[-1]["id"]])
+    return keywords, next_cursor
+
 @api_router.get("/keywords", response_model=List[Keyword])
-async def get_all_keywords(admin: dict = Depends(get_current_admin)):
-    keywords = await db.keywords.find({}, {"_id": 0}).to_list(1000)
-    for kw in keywords:
-        if isinstance(kw.get('tracked_at'), str):
-            kw['tracked_at'] = datetime.fromisoformat(kw['tracked_at'])
+async def get_all_keywords(
+    response: Response,
+    page: Optional[str] = None,
+    difficulty: Optional[str] = None,
+    ranking_min: Optional[int] = None,
+    ranking_max: Optional[int] = None,
+    volume_min: Optional[int] = None,
+    volume_max: Optional[int] = None,
+    sort: str = Query("-tracked_at", pattern=f"^-?({'|'.join(KEYWORD_SORT_FIELDS)})$"),
+    limit: int = Query(KEYWORD_PAGE_DEFAULT_LIMIT, ge=1, le=KEYWORD_PAGE_MAX_LIMIT),
+    cursor: Optional[str] = None,
+    admin: dict = Depends(get_current_admin)
+):
+    filters = {
+        "page": page,
+        "difficulty": difficulty,
+        "ranking": keyword_range(ranking_min, ranking_max),
+        "search_volume": keyword_range(volume_min, volume_max),
+    }
+    filters = {field: value for field, value in filters.items() if value is not None}
+    keywords, next_cursor = await load_keywords(filters, sort.lstrip("-"), sort.startswith("-"), limit, cursor)
+    headers = {"X-Next-Cursor": next_cursor} if next_cursor else {}
+    if FAST_JSON:
+        return json_response(json_body(Keyword, keywords, many=True), headers)
+    response.headers.update(headers)
     return keywords
 
+RANKING_PERIODS = ("day", "week")
+
+def ranking_bucket(observed_at: datetime, period: str) -> datetime:
+    day = as_utc(observed_at).replace(hour=0, minute=0, second=0, microsecond=0)
+    return day - timedelta(days=day.weekday()) if period == "week" else day
+
+def rollup_operations(keyword: dict, ranking: int, observed_at: datetime) -> List[UpdateOne]:
+    return [
+        UpdateOne(
+            {"scope": scope, "key": key, "period": period, "bucket": ranking_bucket(observed_at, period)},
+            {"$inc": {"count": 1, "sum": ranking}, "$min": {"min": ranking}, "$max": {"max": ranking}},
+            upsert=True
+        )
+        for scope, key in (("keyword", keyword["id"]), ("page", keyword["page"]))
+        for period in RANKING_PERIODS
+    ]
+
+async def record_rankings(observations: List[Tuple[dict, int, datetime]]):
+    # Raw observations expire after RANKING_RAW_RETENTION_DAYS; the day/week rollups are kept and
+    # are what the trend endpoints read, one document per series bucket.
+    if not observations:
+        return
+    await db.keyword_rankings.insert_many([
+        {"keyword_id": keyword["id"], "keyword": keyword["keyword"], "page": keyword["page"], "ranking": ranking, "observed_at": observed_at}
+        for keyword, ranking, observed_at in observations
+    ], ordered=False)
+    await db.keyword_ranking_rollups.bulk_write(
+        [op for keyword, ranking, observed_at in observations for op in rollup_operations(keyword, ranking, observed_at)],
+        ordered=False
+    )
+
+async def delete_ranking_history(keyword_ids: List[str]):
+    # Page series keep the deleted keywords' contribution; they describe the page, not the keyword set.
+    await db.keyword_rankings.delete_many({"keyword_id": {"$in": keyword_ids}})
+    await db.keyword_ranking_rollups.delete_many({"scope": "keyword", "key": {"$in": keyword_ids}})
+
+async def load_ranking_trend(scope: str, key: str, period: str, since: Optional[datetime], until: Optional[datetime]) -> RankingTrend:
+    until = as_utc(until) or datetime.now(timezone.utc)
+    since = as_utc(since) or until - timedelta(days=RANKING_TREND_DEFAULT_DAYS)
+    query = {"scope": scope, "key": key, "period": period, "bucket": {"$gte": ranking_bucket(since, period), "$lte": until}}
+    points = [
+        RankingPoint(bucket=doc["bucket"], avg=round(doc["sum"] / doc["count"], 2), min=doc["min"], max=doc["max"], count=doc["count"])
+        async for doc in db.keyword_ranking_rollups.find(query, {"_id": 0}).sort("bucket", ASCENDING)
+    ]
+    return RankingTrend(scope=scope, key=key, period=period, points=points)
+
 @api_router.post("/keywords", response_model=Keyword)
 async def create_keyword(keyword_data: KeywordCreate, admin: dict = Depends(get_current_admin)):
     keyword = Keyword(**keyword_data.model_dump())
     doc = keyword.model_dump()
-    doc['tracked_at'] = doc['tracked_at'].isoformat()
     await db.keywords.insert_one(doc)
+    if keyword.ranking is not None:
+        await record_rankings([(doc, keyword.ranking, keyword.tracked_at)])
     return keyword
 
+@api_router.post("/keywords/{keyword_id}/rankings", response_model=Keyword)
+async def record_keyword_ranking(keyword_id: str, observation: RankingObservation, admin: dict = Depends(get_current_admin)):
+    observed_at = as_utc(observation.observed_at) or datetime.now(timezone.utc)
+    # Backfilled observations land in the history without rolling the current snapshot back.
+    keyword = await db.keywords.find_one_and_update(
+        {"id": keyword_id, "tracked_at": {"$lte": observed_at}},
+        {"$set": {"ranking": observation.ranking, "tracked_at": observed_at}},
+        projection={"_id": 0},
+        return_document=ReturnDocument.AFTER
+    ) or await db.keywords.find_one({"id": keyword_id}, {"_id": 0})
+    if not keyword:
+        raise HTTPException(status_code=404, detail="Keyword not found")
+    await record_rankings([(keyword, observation.ranking, observed_at)])
+    return keyword
+
+@api_router.get("/keywords/trend", response_model=RankingTrend)
+async def get_page_ranking_trend(
+    page: str,
+    period: str = Query("day", pattern="^(day|week)$"),
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    admin: dict = Depends(get_current_admin)
+):
+    return await load_ranking_trend("page", page, period, since, until)
+
+@api_router.get("/keywords/{keyword_id}/trend", response_model=RankingTrend)
+async def get_keyword_ranking_trend(
+    keyword_id: str,
+    period: str = Query("day", pattern="^(day|week)$"),
+    since: Optional[datetime] = None,
+    until: Optional[datetime] = None,
+    admin: dict = Depends(get_current_admin)
+):
+    trend = await load_ranking_trend("keyword", keyword_id, period, since, until)
+    # Deleting a keyword drops its series, so only an empty one needs telling apart from a bad id.
+    if not trend.points and not await db.keywords.find_one({"id": keyword_id}, {"_id": 1}):
+        raise HTTPException(status_code=404, detail="Keyword not found")
+    return trend
+
+async def iter_lines(request: Request):
+    buffer = b""
+    async for chunk in request.stream():
+        buffer += chunk
+        *lines, buffer = buffer.split(b"\n")
+        for line in lines:
+            yield line
+    if buffer:
+        yield buffer
+
+async def iter_keyword_rows(request: Request):
+    content_type = request.headers.get("content-type", "").split(";")[0].strip().lower()
+    header = None
+    line_number = 0
+    async for raw in iter_lines(request):
+        line_number += 1
+        try:
+            line = raw.decode("utf-8").rstrip("\r")
+        except UnicodeDecodeError as exc:
+            yield line_number, exc
+            continue
+        if not line.strip():
+            continue
+        if content_type == "text/csv":
+            values = next(csv.reader([line]))
+            if header is None:
+                header = [value.strip() for value in values]
+                continue
+            yield line_number, {k: (v if v.strip() else None) for k, v in zip(header, values)}
+        else:
+            try:
+                row = json.loads(line)
+            except ValueError as exc:
+                yield line_number, exc
+                continue
+            yield line_number, row if isinstance(row, dict) else ValueError("expected a JSON object")
+
+class KeywordBulkImport:
+    def __init__(self):
+        self.inserted = 0
+        self.updated = 0
+        self.failed = 0
+        self.errors: List[KeywordBulkError] = []
+
+    def error(self, line: int, message: str):
+        self.failed += 1
+        if len(self.errors) < KEYWORD_BULK_MAX_ERRORS:
+            self.errors.append(KeywordBulkError(line=line, error=message))
+
+    async def flush(self, batch: List[Tuple[int, dict, bool]]):
+        if not batch:
+            return
+        # Rows that carry an id, such as a re-imported export, replace that keyword instead of duplicating
+        # it; a ranking observation is only recorded when it is new for the keyword.
+        known_ids = [doc["id"] for _, doc, replace in batch if replace]
+        previous = {}
+        if known_ids:
+            async for doc in db.keywords.find({"id": {"$in": known_ids}}, {"_id": 0, "id": 1, "ranking": 1, "tracked_at": 1}):
+                previous[doc["id"]] = (doc.get("ranking"), as_utc(doc.get("tracked_at")))
+        operations = [ReplaceOne({"id": doc["id"]}, doc, upsert=True) if replace else InsertOne(doc) for _, doc, replace in batch]
+        failed = set()
+        try:
+            counts = (await db.keywords.bulk_write(operations, ordered=False)).bulk_api_result
+        except BulkWriteError as exc:
+            counts = exc.details
+            for write_error in counts.get("writeErrors", []):
+                failed.add(write_error["index"])
+                self.error(batch[write_error["index"]][0], write_error.get("errmsg", "write failed"))
+        self.inserted += counts.get("nInserted", 0) + counts.get("nUpserted", 0)
+        self.updated += counts.get("nMatched", 0)
+        await record_rankings([
+            (doc, doc["ranking"], doc["tracked_at"])
+            for index, (_, doc, _) in enumerate(batch)
+            if index not in failed and doc["ranking"] is not None and previous.get(doc["id"]) != (doc["ranking"], doc["tracked_at"])
+        ])
+
+    def result(self) -> KeywordBulkResult:
+        return KeywordBulkResult(inserted=self.inserted, updated=self.updated, failed=self.failed, errors=self.errors)
+
+@api_router.post("/keywords/bulk", response_model=KeywordBulkResult)
+async def bulk_import_keywords(request: Request, admin: dict = Depends(get_current_admin)):
+    report = KeywordBulkImport()
+    batch: List[Tuple[int, dict, bool]] = []
+    async for line_number, row in iter_keyword_rows(request):
+        if isinstance(row, Exception):
+            report.error(line_number, f"Invalid row: {row}")
+            continue
+        exported = {field: row[field] for field in ("id", "tracked_at") if row.get(field) is not None}
+        try:
+            keyword = Keyword(**KeywordCreate(**row).model_dump(), **exported)
+        except ValidationError as exc:
+            report.error(line_number, "; ".join(f"{'.'.join(map(str, e['loc']))}: {e['msg']}" for e in exc.errors()))
+            continue
+        doc = keyword.model_dump()
+        doc["tracked_at"] = as_utc(doc["tracked_at"])
+        batch.append((line_number, doc, "id" in exported))
+        if len(batch) >= KEYWORD_BULK_BATCH_SIZE:
+            await report.flush(batch)
+            batch = []
+    await report.flush(batch)
+    return report.result()
+
+@api_router.post("/keywords/bulk-delete")
+async def bulk_delete_keywords(payload: KeywordBulkDelete, admin: dict = Depends(get_current_admin)):
+    result = await db.keywords.delete_many({"id": {"$in": payload.ids}})
+    await delete_ranking_history(payload.ids)
+    return {"deleted": result.deleted_count}
+
+def keyword_export_value(value):
+    return value.isoformat() if isinstance(value, datetime) else value
+
+async def stream_keywords_export(export_format: str):
+    cursor = db.keywords.find({}, {"_id": 0}).batch_size(KEYWORD_BULK_BATCH_SIZE)
+    if export_format == "csv":
+        buffer = io.StringIO()
+        writer = csv.writer(buffer)
+        writer.writerow(KEYWORD_EXPORT_FIELDS)
+        async for keyword in cursor:
+            writer.writerow([keyword_export_value(keyword.get(field)) if keyword.get(field) is not None else "" for field in KEYWORD_EXPORT_FIELDS])
+            if buffer.tell() >= 64 * 1024:
+                yield buffer.getvalue().encode("utf-8")
+                buffer.seek(0)
+                buffer.truncate()
+        yield buffer.getvalue().encode("utf-8")
+        return
+    lines = []
+    async for keyword in cursor:
+        lines.append(json.dumps({field: keyword_export_value(keyword.get(field)) for field in KEYWORD_EXPORT_FIELDS}))
+        if len(lines) >= KEYWORD_BULK_BATCH_SIZE:
+            yield ("\n".join(lines) + "\n").encode("utf-8")
+            lines = []
+    if lines:
+        yield ("\n".join(lines) + "\n").encode("utf-8")
+
+@api_router.get("/keywords/export")
+async def export_keywords(format: str = Query("ndjson", pattern="^(ndjson|csv)$"), admin: dict = Depends(get_current_admin)):
+    media_type = "text/csv" if format == "csv" else "application/x-ndjson"
+    return StreamingResponse(
+        stream_keywords_export(format),
+        media_type=media_type,
+        headers={"Content-Disposition": f'attachment; filename="keywords.{format}"'}
+    )
+
 @api_router.delete("/keywords/{keyword_id}")
 async def delete_keyword(keyword_id: str, admin: dict = Depends(get_current_admin)):
     result = await db.keywords.delete_one({"id": keyword_id})
     if result.deleted_count == 0:
         raise HTTPException(status_code=404, detail="Keyword not found")
+    await delete_ranking_history([keyword_id])
     return {"message": "Keyword deleted successfully"}
 
-@api_router.get("/analytics", response_model=AnalyticsData)
-async def get_analytics(admin: dict = Depends(get_current_admin)):
-    total_seo = await db.seo_settings.count_documents({})
-    total_blogs = await db.blogs.count_documents({})
-    total_keywords = await db.keywords.count_documents({})
-    
-    recent_blogs = await db.blogs.find({}, {"_id": 0, "title": 1, "updated_at": 1}).sort("updated_at", -1).limit(5).to_list(5)
-    recent_updates = [blog['title'] for blog in recent_blogs]
+KEYWORD_RANKING_BUCKETS = [(3, "1-3"), (10, "4-10"), (20, "11-20"), (50, "21-50"), (100, "51-100")]
+
+BLOG_ANALYTICS_PIPELINE = [
+    {"$facet": {
+        "status": [{"$group": {"_id": "$published", "count": {"$sum": 1}}}],
+        "recent": [{"$sort": {"updated_at": -1}}, {"$limit": 5}, {"$project": {"_id": 0, "title": 1}}],
+    }}
+]
+
+KEYWORD_ANALYTICS_PIPELINE = [
+    {"$group": {
+        "_id": {"$switch": {
+            "branches": [{"case": {"$eq": [{"$isNumber": "$ranking"}, False]}, "then": "unranked"}] + [
+                {"case": {"$lte": ["$ranking", upper]}, "then": label} for upper, label in KEYWORD_RANKING_BUCKETS
+            ],
+            "default": "100+",
+        }},
+        "count": {"$sum": 1},
+    }}
+]
+
+async def load_analytics() -> AnalyticsData:
+    total_seo, blog_facets, keyword_buckets = await asyncio.gather(
+        db.seo_settings.estimated_document_count(),
+        db.blogs.aggregate(BLOG_ANALYTICS_PIPELINE).to_list(1),
+        db.keywords.aggregate(KEYWORD_ANALYTICS_PIPELINE).to_list(None),
+    )
+    facets = blog_facets[0] if blog_facets else {"status": [], "recent": []}
+    blog_status_counts = {"published": 0, "draft": 0}
+    for bucket in facets["status"]:
+        blog_status_counts["published" if bucket["_id"] else "draft"] += bucket["count"]
+    distribution = {label: 0 for _, label in KEYWORD_RANKING_BUCKETS}
+    distribution.update({"100+": 0, "unranked": 0})
+    for bucket in keyword_buckets:
+        distribution[bucket["_id"]] = bucket["count"]
     
     return AnalyticsData(
         total_pages=total_seo,
-        total_blogs=total_blogs,
-        total_keywords=total_keywords,
-        recent_updates=recent_updates
+        total_blogs=sum(blog_status_counts.values()),
+        total_keywords=sum(distribution.values()),
+        recent_updates=[blog['title'] for blog in facets["recent"]],
+        blog_status_counts=blog_status_counts,
+        keyword_ranking_distribution=distribution
     )
 
+@api_router.get("/analytics", response_model=AnalyticsData)
+async def get_analytics(admin: dict = Depends(get_current_admin)):
+    return await analytics_cache.get_or_load(("analytics",), load_analytics)
+
+@api_router.get("/cache/stats", response_model=Dict[str, CacheStats])
+async def get_cache_stats(admin: dict = Depends(get_current_admin)):
+    return {name: cache.stats() for name, cache in CACHES.items()}
+
+async def check_mongo_health() -> MongoHealth:
+    ping_ms = None
+    error = None
+    started = time.perf_counter()
+    try:
+        await asyncio.wait_for(client.admin.command("ping"), READINESS_PING_TIMEOUT_SECONDS)
+        ping_ms = round((time.perf_counter() - started) * 1000, 2)
+    except (PyMongoError, asyncio.TimeoutError) as exc:
+        logger.warning("Readiness ping failed: %r", exc)
+        error = type(exc).__name__
+    pools = mongo_pool_monitor.stats()
+    return MongoHealth(
+        ready=error is None and not any(pool["paused"] for pool in pools),
+        mongo_ping_ms=ping_ms,
+        error=error,
+        pools=pools,
+        check_out_failures=mongo_pool_monitor.check_out_failures,
+    )
+
+# The probe is public, so it only says whether this worker can serve; pool
+# addresses and failure counts are behind admin auth on /health/mongo.
+@api_router.get("/health/ready", response_model=ReadinessStatus)
+async def get_readiness(response: Response):
+    health = await check_mongo_health()
+    if not health.ready:
+        response.status_code = 503
+    return ReadinessStatus(ready=health.ready, mongo_ping_ms=health.mongo_ping_ms)
+
+@api_router.get("/health/mongo", response_model=MongoHealth)
+async def get_mongo_health(response: Response, admin: dict = Depends(get_current_admin)):
+    health = await check_mongo_health()
+    if not health.ready:
+        response.status_code = 503
+    return health
+
+@api_router.get("/indexes", response_model=Dict[str, Dict[str, str]])
+async def get_index_status(admin: dict = Depends(get_current_admin)):
+    return index_status
+
 @api_router.get("/sitemap/generate")
-async def generate_sitemap():
-    blogs = await db.blogs.find({"published": True}, {"_id": 0, "slug": 1, "updated_at": 1}).to_list(1000)
-    
-    base_url = "https://seo-llm-connect.preview.emergentagent.com"
-    
-    sitemap = '<?xml version="1.0" encoding="UTF-8"?>\n'
-    sitemap += '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
-    
-    static_pages = [
-        {"loc": "/", "priority": "1.0"},
-        {"loc": "/about", "priority": "0.8"},
-        {"loc": "/services", "priority": "0.9"},
-        {"loc": "/contact", "priority": "0.7"},
-        {"loc": "/blog", "priority": "0.8"},
-    ]
-    
-    for page in static_pages:
-        sitemap += f'  <url>\n'
-        sitemap += f'    <loc>{base_url}{page["loc"]}</loc>\n'
-        sitemap += f'    <changefreq>weekly</changefreq>\n'
-        sitemap += f'    <priority>{page["priority"]}</priority>\n'
-        sitemap += f'  </url>\n'
-    
-    for blog in blogs:
-        updated = blog.get('updated_at')
-        if isinstance(updated, str):
-            lastmod = updated.split('T')[0]
-        else:
-            lastmod = datetime.now(timezone.utc).strftime('%Y-%m-%d')
-        
-        sitemap += f'  <url>\n'
-        sitemap += f'    <loc>{base_url}/blog/{blog["slug"]}</loc>\n'
-        sitemap += f'    <lastmod>{lastmod}</lastmod>\n'
-        sitemap += f'    <changefreq>monthly</changefreq>\n'
-        sitemap += f'    <priority>0.6</priority>\n'
-        sitemap += f'  </url>\n'
-    
-    sitemap += '</urlset>'
-    
-    return Response(content=sitemap, media_type="application/xml")
+async def generate_sitemap(request: Request, admin: dict = Depends(get_current_admin)):
+    # Writes keep the cache current; this forces a full rebuild from the database.
+    await sitemap_cache.load()
+    return sitemap_response(request, await sitemap_cache.get("sitemap.xml"))
 
 app.include_router(api_router)
 
+def negotiate_encoding(accept_encoding: str, available: Optional[Tuple[str, ...]] = None) -> Optional[str]:
+    accepted: Dict[str, float] = {}
+    for part in accept_encoding.lower().split(","):
+        name, _, params = part.partition(";")
+        quality = 1.0
+        if params.strip().startswith("q="):
+            try:
+                quality = float(params.strip()[2:])
+            except ValueError:
+                quality = 0.0
+        accepted[name.strip()] = quality
+    if available is None:
+        available = ("br", "gzip") if brotli is not None else ("gzip",)
+    for encoding in available:
+        if accepted.get(encoding, accepted.get("*", 0.0)) > 0:
+            return encoding
+    return None
+
+def compress_body(body: bytes, encoding: str) -> bytes:
+    if encoding == "br":
+        return brotli.compress(body, quality=COMPRESSION_BROTLI_QUALITY)
+    return gzip.compress(body, compresslevel=COMPRESSION_GZIP_LEVEL, mtime=0)
+
+class StreamCompressor:
+    def __init__(self, encoding: str):
+        self.encoding = encoding
+        if encoding == "br":
+            self._compressor = brotli.Compressor(quality=COMPRESSION_BROTLI_QUALITY)
+        else:
+            self._compressor = zlib.compressobj(COMPRESSION_GZIP_LEVEL, zlib.DEFLATED, 31)
+
+    def compress(self, chunk: bytes) -> bytes:
+        # Flush per chunk so a streamed response keeps its time to first byte.
+        if self.encoding == "br":
+            return self._compressor.process(chunk) + self._compressor.flush()
+        return self._compressor.compress(chunk) + self._compressor.flush(zlib.Z_SYNC_FLUSH)
+
+    def finish(self) -> bytes:
+        return self._compressor.finish() if self.encoding == "br" else self._compressor.flush()
+
+class CompressionMiddleware:
+    """gzip/brotli negotiation for compressible responses of at least ``minimum_size`` bytes.
+
+    Complete bodies that carry an ETag are content-addressed, so their compressed bytes are
+    cached by (ETag, encoding) and a repeat request skips the compressor. Responses that
+    already set Content-Encoding (the pre-gzipped sitemap) pass through untouched."""
+
+    def __init__(self, app, minimum_size: int = COMPRESSION_MIN_SIZE):
+        self.app = app
+        self.minimum_size = minimum_size
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        request_headers = Headers(scope=scope)
+        encoding = negotiate_encoding(request_headers.get("accept-encoding", ""))
+        start_message = None
+        compressor: Optional[StreamCompressor] = None
+        passthrough = False
+
+        async def send_compressed(message):
+            nonlocal start_message, compressor, passthrough
+            if message["type"] == "http.response.start":
+                start_message = message
+                return
+            if message["type"] != "http.response.body" or passthrough:
+                await send(message)
+                return
+            body = message.get("body", b"")
+            more_body = message.get("more_body", False)
+            if compressor is not None:
+                body = compressor.compress(body) + (b"" if more_body else compressor.finish())
+                await send({"type": "http.response.body", "body": body, "more_body": more_body})
+                return
+
+            headers = MutableHeaders(scope=start_message)
+            compressible = headers.get("content-type", "").startswith(COMPRESSIBLE_TYPES) and "content-encoding" not in headers
+            if compressible:
+                headers.add_vary_header("Accept-Encoding")
+            etag = headers.get("etag")
+            if start_message["status"] == 304 and etag and encoding is not None:
+                # A 304 carries the tag of the representation the client validated, so its cached
+                # compressed copy is refreshed rather than treated as a different response.
+                validated = [tag.strip().removeprefix("W/") for tag in request_headers.get("if-none-match", "").split(",")]
+                if encoded_etag(etag, encoding) in validated:
+                    headers["ETag"] = encoded_etag(etag, encoding)
+                    headers.add_vary_header("Accept-Encoding")
+            if (not compressible or encoding is None or start_message["status"] in (204, 304)
+                    or (not more_body and len(body) < self.minimum_size)):
+                passthrough = True
+                await send(start_message)
+                await send(message)
+                return
+
+            headers["Content-Encoding"] = encoding
+            if etag and etag.startswith('"'):
+                headers["ETag"] = encoded_etag(etag, encoding)
+            if more_body:
+                del headers["Content-Length"]
+                compressor = StreamCompressor(encoding)
+                await send(start_message)
+                await send({"type": "http.response.body", "body": compressor.compress(body), "more_body": True})
+                return
+
+            cacheable = etag is not None and start_message["status"] == 200 and len(body) <= COMPRESSION_CACHE_MAX_BODY
+            compressed = compressed_cache.get((etag, encoding)) if cacheable else None
+            if compressed is None:
+                compressed = compress_body(body, encoding)
+                if cacheable:
+                    compressed_cache.set((etag, encoding), compressed)
+            headers["Content-Length"] = str(len(compressed))
+            passthrough = True
+            await send(start_message)
+            await send({"type": "http.response.body", "body": compressed, "more_body": False})
+
+        await self.app(scope, receive, send_compressed)
+
+app.add_middleware(CompressionMiddleware)
+
 app.add_middleware(
     CORSMiddleware,
     allow_credentials=True,
     allow_origins=os.environ.get('CORS_ORIGINS', '*').split(','),
     allow_methods=["*"],
     allow_headers=["*"],
+    expose_headers=["X-Next-Cursor"],
 )
 
+class MetricsMiddleware:
+    """Per-route latency, in-flight count and the Mongo commands each request issued.
+
+    Routes are labelled by their template (``/api/blogs/{slug}``) so label cardinality stays
+    bounded; requests that match no route share ``unmatched``."""
+
+    def __init__(self, app):
+        self.app = app
+
+    async def __call__(self, scope, receive, send):
+        if scope["type"] != "http":
+            await self.app(scope, receive, send)
+            return
+        status_code = 500
+
+        async def send_with_status(message):
+            nonlocal status_code
+            if message["type"] == "http.response.start":
+                status_code = message["status"]
+            await send(message)
+
+        commands: List[float] = []
+        token = request_mongo_commands.set(commands)
+        http_requests_in_flight.inc()
+        started = time.perf_counter()
+        try:
+            await self.app(scope, receive, send_with_status)
+        finally:
+            elapsed = time.perf_counter() - started
+            http_requests_in_flight.inc(amount=-1)
+            request_mongo_commands.reset(token)
+            labels = (scope["method"], getattr(scope.get("route"), "path", "unmatched"))
+            http_requests_total.inc(labels + (status_code,))
+            http_request_duration.observe(labels, elapsed)
+            http_request_mongo_operations.observe(labels, len(commands))
+            http_request_mongo_duration.observe(labels, sum(commands))
+
+if METRICS_ENABLED:
+    app.add_middleware(MetricsMiddleware)
+
 logging.basicConfig(
     level=logging.INFO,
     format='%(asctime)s - %(name)s - %(levelname)s - %(message)s'
 )
 logger = logging.getLogger(__name__)
 
+# Server error codes meaning the deployment has no change streams (standalone mongod, very old servers).
+CHANGE_STREAM_UNSUPPORTED_CODES = (40573, 40324, 115)
+
+class CacheSync:
+    """Applies writes made by any worker to this worker's in-process caches and indexes.
+
+    Follows one change stream over the cached collections where the deployment supports it and
+    otherwise polls each collection's write timestamp, re-reading a short lookback window so that
+    clock skew between workers does not lose writes. Deletes arrive with only the document ``_id``,
+    so the natural keys of the collections in ``KEYED`` are tracked by ``_id``. When polling, the
+    app's own deletes are read back from their tombstones in ``deletions``, and the tracked keys are
+    only rescanned when a collection's document count disagrees with them, which catches deletes
+    made outside the app unless a create of the same count lands in the same interval."""
+
+    POLLED = {
+        # First, so that a create of a just-deleted slug in the same interval is applied after it.
+        "deletions": "deleted_at",
+        "blogs": "updated_at",
+        "blog_related": "updated_at",
+        "seo_settings": "updated_at",
+        "robots_txt": "updated_at",
+        "revoked_tokens": "revoked_at",
+    }
+    WATCHED = tuple(collection for collection in POLLED if collection != "deletions") + ("admins",)
+    KEYED = {"blogs": "slug", "blog_related": "slug", "seo_settings": "page"}
+
+    def __init__(self, mode: str = CACHE_SYNC_MODE, poll_interval: float = CACHE_SYNC_POLL_INTERVAL_SECONDS,
+                 lookback: float = CACHE_SYNC_POLL_LOOKBACK_SECONDS):
+        self.mode = mode
+        self.poll_interval = poll_interval
+        self.lookback = timedelta(seconds=lookback)
+        self.source: Optional[str] = None
+        self._resume_token = None
+        self._watermarks: Dict[str, datetime] = {}
+        self._seen: Dict[str, Dict[Any, datetime]] = {collection: {} for collection in self.POLLED}
+        self._keys: Dict[str, Dict[Any, str]] = {collection: {} for collection in self.KEYED}
+        self._keys_loaded = False
+        self._task: Optional[asyncio.Task] = None
+
+    def start(self):
+        if self.mode != "off" and (self._task is None or self._task.done()):
+            self._task = asyncio.create_task(self._run())
+
+    async def stop(self):
+        if self._task is not None:
+            self._task.cancel()
+            await asyncio.gather(self._task, return_exceptions=True)
+
+    async def _run(self):
+        if self.mode in ("auto", "change_stream"):
+            while True:
+                try:
+                    await self._follow_change_stream()
+                    continue
+                except OperationFailure as exc:
+                    if exc.code in CHANGE_STREAM_UNSUPPORTED_CODES and self.mode == "auto":
+                        logger.info("Change streams unavailable (%s); polling for cache changes every %.1fs", exc, self.poll_interval)
+                        break
+                    # Includes a resume token that fell off the oplog; start over from a clean cache.
+                    logger.error("Cache sync change stream failed: %s", exc)
+                    self._resume_token = None
+                except PyMongoError as exc:
+                    logger.error("Cache sync change stream interrupted: %s", exc)
+                await asyncio.sleep(CACHE_SYNC_RETRY_SECONDS)
+        await self._poll_forever()
+
+    async def _follow_change_stream(self):
+        if self.source is not None and self._resume_token is None:
+            await self.resync()
+        pipeline = [{"$match": {"ns.coll": {"$in": list(self.WATCHED)}}}]
+        async with db.watch(pipeline, full_document="updateLookup", resume_after=self._resume_token) as stream:
+            if self.source != "change_stream":
+                logger.info("Following MongoDB change stream for cache invalidation")
+            self.source = "change_stream"
+            if self._resume_token is None:
+                # Read after the stream opens so that no document goes untracked in between.
+                await self._load_keys()
+            async for change in stream:
+                collection = change.get("ns", {}).get("coll")
+                if change["operationType"] in ("insert", "update", "replace", "delete", "drop"):
+                    self.apply(collection, change.get("fullDocument"), change.get("documentKey", {}).get("_id"))
+                    self._resume_token = stream.resume_token
+                else:
+                    # invalidate, rename or dropDatabase: the stream closes and cannot be resumed.
+                    self._resume_token = None
+                    await self.resync()
+
+    async def _poll_forever(self):
+        self.source = "poll"
+        started = datetime.now(timezone.utc)
+        self._watermarks = {collection: started for collection in self.POLLED}
+        while True:
+            try:
+                await self.poll()
+            except PyMongoError as exc:
+                logger.error("Cache sync poll failed: %s", exc)
+            await asyncio.sleep(self.poll_interval)
+
+    async def poll(self):
+        if not self._keys_loaded:
+            await self._load_keys()
+        polled_at = datetime.now(timezone.utc)
+        for collection, field in self.POLLED.items():
+            watermark = self._watermarks.get(collection, polled_at)
+            seen = self._seen[collection]
+            async for document in db[collection].find({field: {"$gte": watermark - self.lookback}}).sort(field, ASCENDING):
+                key = document.pop("_id")
+                written_at = as_utc(document.get(field))
+                if seen.get(key) == written_at:
+                    continue
+                seen[key] = written_at
+                # A writer whose clock runs ahead must not push the window past later writes.
+                watermark = max(watermark, min(written_at, polled_at))
+                self.apply(collection, document, key)
+            self._watermarks[collection] = watermark
+            for key in [key for key, written_at in seen.items() if written_at < watermark - self.lookback]:
+                del seen[key]
+        for collection, keys in self._keys.items():
+            if await db[collection].estimated_document_count() != len(keys):
+                await self._reconcile(collection)
+
+    async def _reconcile(self, collection: str):
+        field = self.KEYED[collection]
+        current = {doc["_id"]: doc.get(field) async for doc in db[collection].find({}, {field: 1})}
+        gone = {key: name for key, name in self._keys[collection].items() if key not in current}
+        self._keys[collection] = {**current, **gone}
+        names = set(current.values())
+        for key, name in gone.items():
+            if name in names:
+                # Deleted and created again under a new id, which the scan above has applied.
+                del self._keys[collection][key]
+            else:
+                self.apply(collection, None, key)
+
+    async def _load_keys(self):
+        keys = {}
+        for collection, field in self.KEYED.items():
+            keys[collection] = {doc["_id"]: doc.get(field) async for doc in db[collection].find({}, {field: 1})}
+        self._keys = keys
+        self._keys_loaded = True
+
+    def apply(self, collection: Optional[str], document: Optional[dict], key: Any = None):
+        """Refresh this worker's state for one changed document; ``None`` means deleted or unknown.
+
+        ``key`` is the document's ``_id``, which resolves a delete to the slug or page it removed."""
+        cache_sync_changes.inc((collection, self.source))
+        # Reloads that follow should see this write even when public reads go to secondaries.
+        note_local_write()
+        if collection == "deletions":
+            if document is not None and document.get("collection") in self.KEYED:
+                keys = self._keys[document["collection"]]
+                for tracked in [tracked for tracked, name in keys.items() if name == document["key"]]:
+                    del keys[tracked]
+                self.forget(document["collection"], document["key"])
+            return
+        if collection in self.KEYED and key is not None:
+            if document is None:
+                name = self._keys[collection].pop(key, None)
+                if name is not None:
+                    self.forget(collection, name)
+                    return
+            else:
+                self._keys[collection][key] = document.get(self.KEYED[collection])
+        if collection == "blogs":
+            if document is None:
+                self.forget_blogs()
+                return
+            invalidate_blog_reads(document["slug"])
+            blog_search_index.upsert(document)
+            if document.get("published"):
+                sitemap_cache.upsert(document["slug"], document.get("updated_at"))
+            else:
+                sitemap_cache.remove(document["slug"])
+        elif collection == "blog_related":
+            if document is None:
+                read_cache.invalidate_prefix("blogs")
+                related_posts.invalidate()
+                return
+            for limit in range(1, RELATED_POSTS_COUNT + 1):
+                read_cache.invalidate(("blogs", "related", document["slug"], limit))
+            related_posts.sync(document["slug"], document)
+        elif collection == "seo_settings":
+            if document is None:
+                for prefix in ("seo", "seo_all", "seo_bundle", "html"):
+                    read_cache.invalidate_prefix(prefix)
+                return
+            invalidate_seo_reads(document["page"])
+        elif collection == "robots_txt":
+            read_cache.invalidate(("robots",))
+        elif collection == "revoked_tokens":
+            if document is not None and document.get("jti") and as_utc(document.get("expires_at")):
+                revoked_tokens.revoke(document["jti"], as_utc(document["expires_at"]).timestamp())
+        elif collection == "admins":
+            if document is None:
+                admin_cache.clear()
+            else:
+                invalidate_admin(document["email"])
+
+    def forget(self, collection: str, name: str):
+        # A delete whose slug or page is known only touches that entry.
+        if collection == "blogs":
+            invalidate_blog_reads(name)
+            blog_search_index.remove(name)
+            sitemap_cache.remove(name)
+        elif collection == "blog_related":
+            for limit in range(1, RELATED_POSTS_COUNT + 1):
+                read_cache.invalidate(("blogs", "related", name, limit))
+            related_posts.sync(name, None)
+        elif collection == "seo_settings":
+            invalidate_seo_reads(name)
+
+    def forget_blogs(self):
+        for prefix in ("blog", "blogs", "seo_bundle", "html"):
+            read_cache.invalidate_prefix(prefix)
+        blog_search_index.invalidate()
+        sitemap_cache.invalidate()
+
+    async def resync(self):
+        # Changes may have been missed, so drop everything that mirrors the database.
+        note_local_write()
+        read_cache.clear()
+        admin_cache.clear()
+        self.forget_blogs()
+        related_posts.invalidate()
+        await load_revoked_tokens()
+
+cache_sync = CacheSync()
+
+@app.on_event("startup")
+async def warm_mongo_pool():
+    # Open the minimum pool up front and prove the server answers, so the first requests after a
+    # deploy skip connection setup. A failure is logged, and /api/health/ready reports it.
+    started = time.perf_counter()
+    try:
+        await asyncio.gather(*(client.admin.command("ping") for _ in range(max(1, MONGO_MIN_POOL_SIZE))))
+    except PyMongoError as exc:
+        logger.error("MongoDB warm-up failed: %s", exc)
+        return
+    open_connections = sum(pool["open_connections"] for pool in mongo_pool_monitor.stats())
+    logger.info("MongoDB pool warmed: %d connections in %.0f ms", open_connections, (time.perf_counter() - started) * 1000)
+
+@app.on_event("startup")
+async def ensure_db_indexes():
+    index_status.update(await ensure_indexes())
+    failed = [f"{c}.{n}" for c, names in index_status.items() for n, state in names.items() if state != "ok"]
+    if failed:
+        logger.warning("Index provisioning incomplete: %s", ", ".join(failed))
+    else:
+        logger.info("Index provisioning complete for %d collections", len(index_status))
+
+@app.on_event("startup")
+async def load_revoked_tokens():
+    try:
+        async for entry in db.revoked_tokens.find({"expires_at": {"$gt": datetime.now(timezone.utc)}}, {"_id": 0}):
+            revoked_tokens.revoke(entry["jti"], entry["expires_at"].timestamp())
+    except PyMongoError as exc:
+        logger.error("Could not load revoked tokens: %s", exc)
+
+@app.on_event("startup")
+async def warm_blog_search_index():
+    blog_search_index.warm_in_background()
+
+@app.on_event("startup")
+async def build_missing_related_posts():
+    related_posts.build_if_missing_in_background()
+
+@app.on_event("startup")
+async def start_cache_sync():
+    cache_sync.start()
+
 @app.on_event("shutdown")
 async def shutdown_db_client():
+    await cache_sync.stop()
     client.close()
+    password_hasher.shutdown()
+
+class PageMeta(NamedTuple):
+    title: Optional[str]
+    description: Optional[str]
+    keywords: Optional[str]
+    og_image: Optional[str]
+    json_ld: Optional[Dict[str, Any]]
+    url: str
+    og_type: str = "website"
+
+HEAD_OVERRIDES_RE = re.compile(r'\s*<title>.*?</title>|\s*<meta\s+name="description"[^>]*>', re.IGNORECASE | re.DOTALL)
+
+@functools.lru_cache(maxsize=1)
+def index_html_template() -> str:
+    try:
+        return Path(FRONTEND_INDEX_HTML).read_text(encoding="utf-8")
+    except OSError:
+        return FALLBACK_INDEX_HTML
+
+def html_attr(value: str) -> str:
+    return escape(value, {'"': "&quot;"})
+
+def blog_path(slug: str) -> str:
+    return f"/blog/{quote(slug, safe='')}"
+
+def render_head_tags(meta: PageMeta) -> str:
+    # data-react-helmet lets SEOHead replace these tags once the SPA boots instead of duplicating them.
+    tags = [f'<title>{escape(meta.title)}</title>'] if meta.title else []
+    for kind, key, value in (
+        ("name", "description", meta.description),
+        ("name", "keywords", meta.keywords),
+        ("property", "og:title", meta.title),
+        ("property", "og:description", meta.description),
+        ("property", "og:image", meta.og_image),
+        ("property", "og:url", meta.url),
+        ("property", "og:type", meta.og_type),
+        ("name", "twitter:card", "summary_large_image"),
+        ("name", "twitter:title", meta.title),
+        ("name", "twitter:description", meta.description),
+        ("name", "twitter:image", meta.og_image),
+        ("name", "robots", "index, follow"),
+    ):
+        if value:
+            tags.append(f'<meta {kind}="{key}" content="{html_attr(value)}" data-react-helmet="true" />')
+    tags.append(f'<link rel="canonical" href="{html_attr(meta.url)}" data-react-helmet="true" />')
+    if meta.json_ld:
+        payload = json.dumps(meta.json_ld, default=lambda value: value.isoformat() if isinstance(value, datetime) else str(value))
+        payload = payload.replace("</", "<\\/")
+        tags.append(f'<script type="application/ld+json" data-react-helmet="true">{payload}</script>')
+    return "\n".join(tags)
+
+def render_html_shell(meta: PageMeta, body: str = "") -> bytes:
+    html = index_html_template()
+    if meta.title:
+        html = HEAD_OVERRIDES_RE.sub("", html)
+    html = html.replace("</head>", render_head_tags(meta) + "\n</head>", 1)
+    if body:
+        html = html.replace('<div id="root"></div>', f'<div id="root">{body}</div>', 1)
+    return html.encode("utf-8")
+
+def render_blog_list_body(blogs: List[dict]) -> str:
+    items = "".join(
+        f'<li><a href="{html_attr(blog_path(blog["slug"]))}">{escape(blog.get("title") or "")}</a>'
+        f'<p>{escape(blog.get("excerpt") or "")}</p></li>'
+        for blog in blogs
+    )
+    return f"<main><ul>{items}</ul></main>"
+
+def render_blog_body(blog: dict) -> str:
+    paragraphs = "".join(f"<p>{escape(paragraph)}</p>" for paragraph in (blog.get("content") or "").split("\n\n"))
+    return f'<article><h1>{escape(blog["title"])}</h1>{paragraphs}</article>'
+
+async def load_page_html(route: str) -> CachedResource:
+    page = PRERENDERED_PAGES[route]
+    setting = await public_reads().seo_settings.find_one({"page": page}, {"_id": 0}) or {}
+    last_modified = as_utc(setting.get("updated_at"))
+    body = ""
+    if page == "blog":
+        blogs = await load_blogs(True, BLOG_PAGE_DEFAULT_LIMIT, None, BLOG_SUMMARY_FIELDS)
+        body = render_blog_list_body(blogs.value["items"])
+        last_modified = max((t for t in (last_modified, blogs.last_modified) if t), default=None)
+    meta = PageMeta(setting.get("title"), setting.get("description"), setting.get("keywords"),
+                    setting.get("og_image"), setting.get("json_ld"), f"{SITE_URL}{route}")
+    html = render_html_shell(meta, body)
+    return CachedResource(html, make_etag(html), last_modified)
+
+def render_blog_page(blog: dict) -> bytes:
+    json_ld = {
+        "@context": "https://schema.org",
+        "@type": "Article",
+        "headline": blog["title"],
+        "description": blog.get("excerpt"),
+        "author": {"@type": "Organization", "name": blog.get("author")},
+        "datePublished": as_utc(blog.get("created_at")),
+        "dateModified": as_utc(blog.get("updated_at")),
+    }
+    meta = PageMeta(f"{blog['title']} | TechResona Blog", blog.get("meta_description") or blog.get("excerpt"),
+                    blog.get("keywords"), blog.get("featured_image"), json_ld, f"{SITE_URL}{blog_path(blog['slug'])}", "article")
+    return render_html_shell(meta, render_blog_body(blog))
+
+async def load_blog_html(slug: str) -> Optional[CachedResource]:
+    blog = await public_reads().blogs.find_one({"slug": slug, "published": True}, {"_id": 0})
+    if not blog:
+        return None
+    html = render_blog_page(blog)
+    return CachedResource(html, make_etag(html), as_utc(blog.get("updated_at")))
+
+def html_response(request: Request, resource: CachedResource, status_code: int = 200) -> Response:
+    not_modified = not_modified_response(request, resource)
+    if not_modified:
+        return not_modified
+    return HTMLResponse(resource.value, status_code=status_code, headers=validator_headers(resource.etag, resource.last_modified))
 
 @app.get("/robots.txt", response_class=PlainTextResponse)
-async def robots_txt():
-    robots = await db.robots_txt.find_one({}, {"_id": 0}, sort=[("updated_at", -1)])
-    if not robots:
-        return "User-agent: *\nAllow: /\nSitemap: https://seo-llm-connect.preview.emergentagent.com/sitemap.xml"
-    return robots['content']
+async def robots_txt(request: Request):
+    resource = await get_robots_txt_resource()
+    not_modified = not_modified_response(request, resource)
+    if not_modified:
+        return not_modified
+    return PlainTextResponse(resource.value, headers=validator_headers(resource.etag, resource.last_modified))
 
 @app.get("/sitemap.xml", response_class=Response)
-async def sitemap_xml():
-    blogs = await db.blogs.find({"published": True}, {"_id": 0, "slug": 1, "updated_at": 1}).to_list(1000)
-    
-    base_url = "https://seo-llm-connect.preview.emergentagent.com"
-    
-    sitemap = '<?xml version="1.0" encoding="UTF-8"?>\n'
-    sitemap += '<urlset xmlns="http://www.sitemaps.org/schemas/sitemap/0.9">\n'
-    
-    static_pages = [
-        {"loc": "/", "priority": "1.0"},
-        {"loc": "/about", "priority": "0.8"},
-        {"loc": "/services", "priority": "0.9"},
-        {"loc": "/contact", "priority": "0.7"},
-        {"loc": "/blog", "priority": "0.8"},
-    ]
-    
-    for page in static_pages:
-        sitemap += f'  <url>\n'
-        sitemap += f'    <loc>{base_url}{page["loc"]}</loc>\n'
-        sitemap += f'    <changefreq>weekly</changefreq>\n'
-        sitemap += f'    <priority>{page["priority"]}</priority>\n'
-        sitemap += f'  </url>\n'
-    
-    for blog in blogs:
-        updated = blog.get('updated_at')
-        if isinstance(updated, str):
-            lastmod = updated.split('T')[0]
-        else:
-            lastmod = datetime.now(timezone.utc).strftime('%Y-%m-%d')
-        
-        sitemap += f'  <url>\n'
-        sitemap += f'    <loc>{base_url}/blog/{blog["slug"]}</loc>\n'
-        sitemap += f'    <lastmod>{lastmod}</lastmod>\n'
-        sitemap += f'    <changefreq>monthly</changefreq>\n'
-        sitemap += f'    <priority>0.6</priority>\n'
-        sitemap += f'  </url>\n'
-    
-    sitemap += '</urlset>'
-    
-    return Response(content=sitemap, media_type="application/xml")
\ No newline at end of file
+async def sitemap_xml(request: Request):
+    return await sitemap_document_response(request, "sitemap.xml")
+
+@app.get("/sitemap-{shard}.xml", response_class=Response)
+async def sitemap_shard_xml(shard: int, request: Request):
+    return await sitemap_document_response(request, f"sitemap-{shard}.xml")
+
+def render_metrics() -> str:
+    lines = [line for metric in METRICS for line in metric.render()]
+    stats = {name: cache.stats() for name, cache in CACHES.items()}
+    for field, kind, help_text in (
+        ("hits", "counter", "In-process cache hits."),
+        ("misses", "counter", "In-process cache misses."),
+        ("evictions", "counter", "In-process cache LRU evictions."),
+        ("size", "gauge", "In-process cache entries."),
+    ):
+        name = f"cache_{field}_total" if kind == "counter" else f"cache_{field}"
+        lines += [f"# HELP {name} {help_text}", f"# TYPE {name} {kind}"]
+        lines += [metric_line(name, metric_labels(("cache",), (cache,)), getattr(stat, field)) for cache, stat in stats.items()]
+    lines += ["# HELP mongo_pool_connections MongoDB pool connections per server.", "# TYPE mongo_pool_connections gauge"]
+    for pool in mongo_pool_monitor.stats():
+        for state in ("open_connections", "checked_out"):
+            labels = metric_labels(("address", "state"), (pool["address"], state.removesuffix("_connections")))
+            lines.append(metric_line("mongo_pool_connections", labels, pool[state]))
+    return "\n".join(lines) + "\n"
+
+@app.get("/metrics", response_class=PlainTextResponse)
+async def get_metrics(request: Request):
+    if not METRICS_ENABLED or not METRICS_TOKEN:
+        raise HTTPException(status_code=404, detail="Not Found")
+    supplied = request.headers.get("authorization", "").removeprefix("Bearer ")
+    if not hmac.compare_digest(supplied.encode(), METRICS_TOKEN.encode()):
+        raise HTTPException(status_code=401, detail="Invalid metrics token")
+    return PlainTextResponse(render_metrics(), media_type="text/plain; version=0.0.4")
+
+@app.get("/", response_class=HTMLResponse)
+@app.get("/about", response_class=HTMLResponse)
+@app.get("/services", response_class=HTMLResponse)
+@app.get("/contact", response_class=HTMLResponse)
+@app.get("/blog", response_class=HTMLResponse)
+async def prerendered_page(request: Request):
+    route = request.url.path
+    resource = await read_cache.get_or_load(("html", route), lambda: load_page_html(route))
+    return html_response(request, resource)
+
+@app.get("/blog/{slug}", response_class=HTMLResponse)
+async def prerendered_blog(slug: str, request: Request):
+    resource = await read_cache.get_or_load(("html", "blog", slug), lambda: load_blog_html(slug))
+    if not resource:
+        return HTMLResponse(index_html_template(), status_code=404)
+    return html_response(request, resource)
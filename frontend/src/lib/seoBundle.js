@@ -0,0 +1,20 @@
+import axios from 'axios';
+
+const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
+const API = `${BACKEND_URL}/api`;
+
+let bundleRequest = null;
+
+// One request per page load serves every public page's SEO metadata and the first page of
+// blog summaries; later route changes reuse the same response.
+export const fetchSeoBundle = () => {
+  if (!bundleRequest) {
+    bundleRequest = axios.get(`${API}/seo/bundle`).then(res => res.data).catch((error) => {
+      bundleRequest = null;
+      throw error;
+    });
+  }
+  return bundleRequest;
+};
+
+export const fetchPageSeo = (page) => fetchSeoBundle().then(bundle => bundle.seo[page] || null);
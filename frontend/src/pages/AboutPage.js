@@ -4,16 +4,13 @@ import { Target, Users, Globe, Award } from 'lucide-react';
 import Navbar from '../components/Navbar';
 import Footer from '../components/Footer';
 import SEOHead from '../components/SEOHead';
-import axios from 'axios';
-
-const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
-const API = `${BACKEND_URL}/api`;
+import { fetchPageSeo } from '../lib/seoBundle';
 
 const AboutPage = () => {
   const [seoData, setSeoData] = useState(null);
 
   useEffect(() => {
-    axios.get(`${API}/seo/about`).then(res => setSeoData(res.data)).catch(() => {});
+    fetchPageSeo('about').then(setSeoData).catch(() => {});
   }, []);
 
   return (
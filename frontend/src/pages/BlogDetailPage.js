@@ -14,6 +14,7 @@ const BlogDetailPage = () => {
   const { slug } = useParams();
   const navigate = useNavigate();
   const [blog, setBlog] = useState(null);
+  const [related, setRelated] = useState([]);
   const [loading, setLoading] = useState(true);
 
   useEffect(() => {
@@ -27,7 +28,16 @@ const BlogDetailPage = () => {
         setLoading(false);
       }
     };
+    const fetchRelated = async () => {
+      try {
+        const response = await axios.get(`${API}/blogs/${slug}/related`);
+        setRelated(response.data);
+      } catch (error) {
+        setRelated([]);
+      }
+    };
     fetchBlog();
+    fetchRelated();
   }, [slug]);
 
   const formatDate = (dateStr) => {
@@ -149,6 +159,25 @@ const BlogDetailPage = () => {
                   ))}
                 </div>
               </div>
+
+              {related.length > 0 && (
+                <div className="mt-12 pt-8 border-t border-slate-200" data-testid="related-posts">
+                  <h2 className="text-2xl font-bold text-slate-900 mb-6 font-heading">Related Articles</h2>
+                  <div className="grid sm:grid-cols-3 gap-6">
+                    {related.map((post) => (
+                      <div
+                        key={post.slug}
+                        onClick={() => navigate(`/blog/${post.slug}`)}
+                        className="p-5 bg-slate-50 rounded-xl border border-slate-200 hover:border-indigo-500/50 transition-all cursor-pointer"
+                        data-testid={`related-post-${post.slug}`}
+                      >
+                        <h3 className="font-semibold text-slate-900 mb-2">{post.title}</h3>
+                        <p className="text-sm text-slate-600 line-clamp-3">{post.excerpt}</p>
+                      </div>
+                    ))}
+                  </div>
+                </div>
+              )}
             </motion.div>
           </div>
         </article>
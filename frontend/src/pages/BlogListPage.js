@@ -6,6 +6,7 @@ import Navbar from '../components/Navbar';
 import Footer from '../components/Footer';
 import SEOHead from '../components/SEOHead';
 import axios from 'axios';
+import { fetchSeoBundle } from '../lib/seoBundle';
 
 const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
 const API = `${BACKEND_URL}/api`;
@@ -14,17 +15,17 @@ const BlogListPage = () => {
   const [blogs, setBlogs] = useState([]);
   const [seoData, setSeoData] = useState(null);
   const [loading, setLoading] = useState(true);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
   const navigate = useNavigate();
 
   useEffect(() => {
     const fetchData = async () => {
       try {
-        const [blogsRes, seoRes] = await Promise.all([
-          axios.get(`${API}/blogs`),
-          axios.get(`${API}/seo/blog`).catch(() => ({}))
-        ]);
-        setBlogs(blogsRes.data);
-        if (seoRes.data) setSeoData(seoRes.data);
+        const bundle = await fetchSeoBundle();
+        setBlogs(bundle.blogs);
+        setNextCursor(bundle.next_cursor || null);
+        if (bundle.seo.blog) setSeoData(bundle.seo.blog);
       } catch (error) {
         console.error('Error fetching blogs:', error);
       } finally {
@@ -34,6 +35,19 @@ const BlogListPage = () => {
     fetchData();
   }, []);
 
+  const loadMore = async () => {
+    setLoadingMore(true);
+    try {
+      const response = await axios.get(`${API}/blogs`, { params: { cursor: nextCursor } });
+      setBlogs((current) => [...current, ...response.data]);
+      setNextCursor(response.headers['x-next-cursor'] || null);
+    } catch (error) {
+      console.error('Error fetching more blogs:', error);
+    } finally {
+      setLoadingMore(false);
+    }
+  };
+
   const formatDate = (dateStr) => {
     try {
       return new Date(dateStr).toLocaleDateString('en-US', { year: 'numeric', month: 'long', day: 'numeric' });
@@ -126,6 +140,18 @@ const BlogListPage = () => {
                 ))}
               </div>
             )}
+            {!loading && nextCursor && (
+              <div className="text-center mt-12">
+                <button
+                  onClick={loadMore}
+                  disabled={loadingMore}
+                  className="px-6 py-3 rounded-full border border-indigo-700 text-indigo-700 font-semibold hover:bg-indigo-50 transition-all disabled:opacity-50"
+                  data-testid="blog-load-more"
+                >
+                  {loadingMore ? 'Loading...' : 'Load more articles'}
+                </button>
+              </div>
+            )}
           </div>
         </section>
 
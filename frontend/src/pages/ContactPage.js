@@ -5,10 +5,7 @@ import Navbar from '../components/Navbar';
 import Footer from '../components/Footer';
 import SEOHead from '../components/SEOHead';
 import { toast } from 'sonner';
-import axios from 'axios';
-
-const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
-const API = `${BACKEND_URL}/api`;
+import { fetchPageSeo } from '../lib/seoBundle';
 
 const ContactPage = () => {
   const [seoData, setSeoData] = useState(null);
@@ -21,7 +18,7 @@ const ContactPage = () => {
   const [isSubmitting, setIsSubmitting] = useState(false);
 
   useEffect(() => {
-    axios.get(`${API}/seo/contact`).then(res => setSeoData(res.data)).catch(() => {});
+    fetchPageSeo('contact').then(setSeoData).catch(() => {});
   }, []);
 
   const handleSubmit = async (e) => {
@@ -5,17 +5,14 @@ import { useNavigate } from 'react-router-dom';
 import Navbar from '../components/Navbar';
 import Footer from '../components/Footer';
 import SEOHead from '../components/SEOHead';
-import axios from 'axios';
-
-const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
-const API = `${BACKEND_URL}/api`;
+import { fetchPageSeo } from '../lib/seoBundle';
 
 const HomePage = () => {
   const navigate = useNavigate();
   const [seoData, setSeoData] = useState(null);
 
   useEffect(() => {
-    axios.get(`${API}/seo/home`).then(res => setSeoData(res.data)).catch(() => {});
+    fetchPageSeo('home').then(setSeoData).catch(() => {});
   }, []);
 
   const services = [
@@ -4,16 +4,13 @@ import { Cloud, Shield, Zap, Settings, Code, Search } from 'lucide-react';
 import Navbar from '../components/Navbar';
 import Footer from '../components/Footer';
 import SEOHead from '../components/SEOHead';
-import axios from 'axios';
-
-const BACKEND_URL = process.env.REACT_APP_BACKEND_URL;
-const API = `${BACKEND_URL}/api`;
+import { fetchPageSeo } from '../lib/seoBundle';
 
 const ServicesPage = () => {
   const [seoData, setSeoData] = useState(null);
 
   useEffect(() => {
-    axios.get(`${API}/seo/services`).then(res => setSeoData(res.data)).catch(() => {});
+    fetchPageSeo('services').then(setSeoData).catch(() => {});
   }, []);
 
   const services = [
@@ -43,10 +43,17 @@ const BlogManager = () => {
   const fetchBlogs = async () => {
     const token = localStorage.getItem('techresona_admin_token');
     try {
-      const response = await axios.get(`${API}/blogs?published_only=false`, {
-        headers: { Authorization: `Bearer ${token}` }
-      });
-      setBlogs(response.data);
+      const allBlogs = [];
+      let cursor = null;
+      do {
+        const response = await axios.get(`${API}/blogs`, {
+          params: { published_only: false, limit: 100, ...(cursor ? { cursor } : {}) },
+          headers: { Authorization: `Bearer ${token}` }
+        });
+        allBlogs.push(...response.data);
+        cursor = response.headers['x-next-cursor'] || null;
+      } while (cursor);
+      setBlogs(allBlogs);
     } catch (error) {
       console.error('Error fetching blogs:', error);
       if (error.response?.status === 401) {
@@ -57,8 +64,17 @@ const BlogManager = () => {
     }
   };
 
-  const handleOpenDialog = (blog = null) => {
-    if (blog) {
+  const handleOpenDialog = async (summary = null) => {
+    if (summary) {
+      let blog = summary;
+      try {
+        const response = await axios.get(`${API}/blogs/${summary.slug}`);
+        blog = response.data;
+      } catch (error) {
+        toast.error('Failed to load blog content');
+        console.error(error);
+        return;
+      }
       setEditingBlog(blog);
       setFormData({
         slug: blog.slug,
@@ -27,6 +27,9 @@ const API = `${BACKEND_URL}/api`;
 const KeywordTracker = () => {
   const [keywords, setKeywords] = useState([]);
   const [loading, setLoading] = useState(true);
+  const [nextCursor, setNextCursor] = useState(null);
+  const [loadingMore, setLoadingMore] = useState(false);
+  const [filters, setFilters] = useState({ page: 'all', difficulty: 'all', sort: '-tracked_at' });
   const [isDialogOpen, setIsDialogOpen] = useState(false);
   const [formData, setFormData] = useState({
     keyword: '',
@@ -39,18 +42,36 @@ const KeywordTracker = () => {
 
   const pages = ['home', 'about', 'services', 'contact', 'blog'];
   const difficulties = ['Low', 'Medium', 'High'];
+  const sortOptions = [
+    { value: '-tracked_at', label: 'Recently tracked' },
+    { value: 'ranking', label: 'Best ranking' },
+    { value: '-ranking', label: 'Worst ranking' },
+    { value: '-search_volume', label: 'Highest volume' },
+    { value: 'keyword', label: 'Keyword A-Z' },
+  ];
 
   useEffect(() => {
     fetchKeywords();
-  }, []);
+  }, [filters]);
 
-  const fetchKeywords = async () => {
+  const keywordParams = (cursor) => {
+    const params = { sort: filters.sort };
+    if (filters.page !== 'all') params.page = filters.page;
+    if (filters.difficulty !== 'all') params.difficulty = filters.difficulty;
+    if (cursor) params.cursor = cursor;
+    return params;
+  };
+
+  const fetchKeywords = async (cursor = null) => {
     const token = localStorage.getItem('techresona_admin_token');
+    if (cursor) setLoadingMore(true);
     try {
       const response = await axios.get(`${API}/keywords`, {
-        headers: { Authorization: `Bearer ${token}` }
+        headers: { Authorization: `Bearer ${token}` },
+        params: keywordParams(cursor)
       });
-      setKeywords(response.data);
+      setKeywords((current) => (cursor ? [...current, ...response.data] : response.data));
+      setNextCursor(response.headers['x-next-cursor'] || null);
     } catch (error) {
       console.error('Error fetching keywords:', error);
       if (error.response?.status === 401) {
@@ -58,6 +79,7 @@ const KeywordTracker = () => {
       }
     } finally {
       setLoading(false);
+      setLoadingMore(false);
     }
   };
 
@@ -219,6 +241,41 @@ const KeywordTracker = () => {
       </div>
 
       <div className="p-6 max-w-7xl mx-auto">
+        <div className="flex flex-wrap gap-4 mb-6" data-testid="keyword-filters">
+          <Select value={filters.page} onValueChange={(value) => setFilters({...filters, page: value})}>
+            <SelectTrigger className="w-44 bg-white" data-testid="filter-page-select">
+              <SelectValue placeholder="All pages" />
+            </SelectTrigger>
+            <SelectContent>
+              <SelectItem value="all">All pages</SelectItem>
+              {pages.map(page => (
+                <SelectItem key={page} value={page}>{page}</SelectItem>
+              ))}
+            </SelectContent>
+          </Select>
+          <Select value={filters.difficulty} onValueChange={(value) => setFilters({...filters, difficulty: value})}>
+            <SelectTrigger className="w-44 bg-white" data-testid="filter-difficulty-select">
+              <SelectValue placeholder="All difficulties" />
+            </SelectTrigger>
+            <SelectContent>
+              <SelectItem value="all">All difficulties</SelectItem>
+              {difficulties.map(diff => (
+                <SelectItem key={diff} value={diff}>{diff}</SelectItem>
+              ))}
+            </SelectContent>
+          </Select>
+          <Select value={filters.sort} onValueChange={(value) => setFilters({...filters, sort: value})}>
+            <SelectTrigger className="w-48 bg-white" data-testid="sort-select">
+              <SelectValue />
+            </SelectTrigger>
+            <SelectContent>
+              {sortOptions.map(option => (
+                <SelectItem key={option.value} value={option.value}>{option.label}</SelectItem>
+              ))}
+            </SelectContent>
+          </Select>
+        </div>
+
         {keywords.length === 0 ? (
           <div className="text-center py-20 bg-white rounded-xl" data-testid="no-keywords">
             <p className="text-slate-500">No keywords tracked yet. Start tracking your keywords!</p>
@@ -271,6 +328,18 @@ const KeywordTracker = () => {
                 </tbody>
               </table>
             </div>
+            {nextCursor && (
+              <div className="text-center py-4 border-t border-slate-200">
+                <Button
+                  variant="outline"
+                  onClick={() => fetchKeywords(nextCursor)}
+                  disabled={loadingMore}
+                  data-testid="keywords-load-more"
+                >
+                  {loadingMore ? 'Loading...' : 'Load more keywords'}
+                </Button>
+              </div>
+            )}
           </div>
         )}
       </div>
@@ -0,0 +1,52 @@
+import os
+import sys
+from pathlib import Path
+
+import pytest
+
+sys.path.insert(0, str(Path(__file__).resolve().parent.parent / "backend"))
+
+os.environ.setdefault("MONGO_URL", "mongodb://localhost:27017")
+os.environ.setdefault("DB_NAME", "techresona_test")
+os.environ.setdefault("CACHE_SYNC_MODE", "off")
+
+import httpx  # noqa: E402
+from mongomock_motor import AsyncMongoMockClient  # noqa: E402
+
+import server  # noqa: E402
+
+
+@pytest.fixture
+def anyio_backend():
+    return "asyncio"
+
+
+@pytest.fixture
+async def db(monkeypatch):
+    """A fresh in-memory database with the app's indexes, and cleared in-process state."""
+    client = AsyncMongoMockClient(tz_aware=True)
+    database = client[os.environ["DB_NAME"]]
+    monkeypatch.setattr(server, "client", client)
+    monkeypatch.setattr(server, "db", database)
+    monkeypatch.setattr(server, "sitemap_cache", server.SitemapCache())
+    monkeypatch.setattr(server, "blog_search_index", server.BlogSearchIndex())
+    monkeypatch.setattr(server, "related_posts", server.RelatedPostsIndex())
+    monkeypatch.setattr(server, "login_rate_limiter", server.SlidingWindowRateLimiter())
+    for cache in server.CACHES.values():
+        cache.clear()
+    await server.ensure_indexes(database)
+    return database
+
+
+@pytest.fixture
+async def api(db):
+    async with httpx.AsyncClient(transport=httpx.ASGITransport(app=server.app), base_url="http://test") as client:
+        yield client
+
+
+
+@pytest.fixture
+async def admin_headers(db):
+    email = "admin@techresona.com"
+    await db.admins.insert_one(server.Admin(email=email, password_hash="unused").model_dump())
+    return {"Authorization": f"Bearer {server.create_access_token({'sub': email})}"}
@@ -0,0 +1,9 @@
+import server
+
+
+def blog_doc(slug, **fields):
+    now = server.datetime.now(server.timezone.utc)
+    return server.Blog(**{
+        "slug": slug, "title": f"Post {slug}", "excerpt": f"Excerpt {slug}", "content": f"Content for {slug}",
+        "keywords": "cloud, devops", "meta_description": f"About {slug}", "created_at": now, "updated_at": now, **fields,
+    }).model_dump()
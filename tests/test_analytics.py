@@ -0,0 +1,52 @@
+from datetime import timedelta
+
+import pytest
+
+import server
+from tests.helpers import blog_doc
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def seeded(db):
+    start = server.datetime(2024, 4, 1, tzinfo=server.timezone.utc)
+    await db.blogs.insert_many(
+        [blog_doc(f"post-{n}", title=f"Post {n}", updated_at=start + timedelta(days=n)) for n in range(7)]
+        + [blog_doc(f"draft-{n}", title=f"Draft {n}", published=False, updated_at=start - timedelta(days=n + 1)) for n in range(3)]
+    )
+    rankings = [1, 3, 4, 10, 11, 20, 21, 50, 51, 100, 101, 250, None, None]
+    await db.keywords.insert_many([server.Keyword(keyword=f"kw-{n}", page="home", ranking=ranking).model_dump() for n, ranking in enumerate(rankings)])
+    await db.seo_settings.insert_many([server.SEOSettings(page=page).model_dump() for page in ("home", "services", "about")])
+
+
+async def test_counts_match_the_seeded_documents(api, admin_headers, seeded):
+    response = await api.get("/api/analytics", headers=admin_headers)
+    assert response.status_code == 200
+    analytics = response.json()
+    assert analytics["total_pages"] == 3
+    assert analytics["total_blogs"] == 10
+    assert analytics["blog_status_counts"] == {"published": 7, "draft": 3}
+    assert analytics["recent_updates"] == ["Post 6", "Post 5", "Post 4", "Post 3", "Post 2"]
+    assert analytics["total_keywords"] == 14
+    assert analytics["keyword_ranking_distribution"] == {
+        "1-3": 2, "4-10": 2, "11-20": 2, "21-50": 2, "51-100": 2, "100+": 2, "unranked": 2,
+    }
+
+
+async def test_empty_database(api, admin_headers):
+    analytics = (await api.get("/api/analytics", headers=admin_headers)).json()
+    assert (analytics["total_blogs"], analytics["total_keywords"], analytics["recent_updates"]) == (0, 0, [])
+    assert set(analytics["keyword_ranking_distribution"].values()) == {0}
+
+
+async def test_snapshot_is_reused_until_it_expires(db, api, admin_headers, seeded):
+    first = (await api.get("/api/analytics", headers=admin_headers)).json()
+    await db.blogs.insert_one(blog_doc("post-late"))
+    assert (await api.get("/api/analytics", headers=admin_headers)).json() == first
+    server.analytics_cache.clear()
+    assert (await api.get("/api/analytics", headers=admin_headers)).json()["total_blogs"] == 11
+
+
+async def test_requires_admin(api):
+    assert (await api.get("/api/analytics")).status_code in (401, 403)
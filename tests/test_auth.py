@@ -0,0 +1,57 @@
+import pytest
+from starlette.requests import Request
+
+import server
+
+pytestmark = pytest.mark.anyio
+
+
+def request_from(peer, forwarded=None):
+    headers = [(b"x-forwarded-for", forwarded.encode())] if forwarded else []
+    return Request({"type": "http", "headers": headers, "client": (peer, 40000)})
+
+
+@pytest.mark.parametrize("peer, forwarded, expected", [
+    ("203.0.113.9", None, "203.0.113.9"),
+    ("203.0.113.9", "198.51.100.1", "203.0.113.9"),
+    ("10.0.0.2", "198.51.100.1", "198.51.100.1"),
+    ("10.0.0.2", "6.6.6.6, 198.51.100.1, 10.0.0.7", "198.51.100.1"),
+    ("10.0.0.2", None, None),
+    ("127.0.0.1", "10.0.0.7", None),
+])
+def test_client_ip_skips_trusted_proxies(peer, forwarded, expected):
+    assert server.client_ip(request_from(peer, forwarded)) == expected
+
+
+async def test_failures_through_the_proxy_do_not_lock_out_other_admins(api):
+    # The test client connects from 127.0.0.1 without X-Forwarded-For, like an ingress that strips it.
+    for n in range(server.LOGIN_RATE_LIMIT + 2):
+        response = await api.post("/api/auth/login", json={"email": f"attacker{n}@example.com", "password": "wrong"})
+        assert response.status_code == 401
+    response = await api.post("/api/auth/login", json={"email": "admin@example.com", "password": "wrong"})
+    assert response.status_code == 401
+
+
+async def test_forwarded_client_is_limited(api):
+    headers = {"x-forwarded-for": "198.51.100.1"}
+    statuses = [
+        (await api.post("/api/auth/login", json={"email": f"user{n}@example.com", "password": "wrong"}, headers=headers)).status_code
+        for n in range(server.LOGIN_RATE_LIMIT + 1)
+    ]
+    assert statuses[:-1] == [401] * server.LOGIN_RATE_LIMIT
+    assert statuses[-1] == 429
+    other = await api.post("/api/auth/login", json={"email": "admin@example.com", "password": "wrong"}, headers={"x-forwarded-for": "198.51.100.2"})
+    assert other.status_code == 401
+
+
+async def test_rotating_the_forwarded_header_does_not_reset_the_budget(api):
+    # Hops left of the proxy's own entry are client supplied; the proxy appends the real peer.
+    statuses = [
+        (await api.post(
+            "/api/auth/login",
+            json={"email": f"user{n}@example.com", "password": "wrong"},
+            headers={"x-forwarded-for": f"192.0.2.{n}, 198.51.100.7"},
+        )).status_code
+        for n in range(server.LOGIN_RATE_LIMIT + 1)
+    ]
+    assert statuses[-1] == 429
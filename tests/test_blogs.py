@@ -0,0 +1,52 @@
+from datetime import timedelta
+
+import pytest
+
+import server
+from tests.helpers import blog_doc
+
+pytestmark = pytest.mark.anyio
+
+
+async def seed_page(db, count=5):
+    start = server.datetime(2024, 1, 1, tzinfo=server.timezone.utc)
+    await db.blogs.insert_many([
+        blog_doc(f"post-{n}", created_at=start + timedelta(days=n), updated_at=start + timedelta(days=n, hours=1))
+        for n in range(count)
+    ])
+
+
+@pytest.mark.parametrize("fields", ["title,content", "title", "slug,excerpt"])
+async def test_sparse_fields_without_updated_at(db, api, fields):
+    await seed_page(db)
+    response = await api.get("/api/blogs", params={"fields": fields, "limit": 2})
+    assert response.status_code == 200
+    assert "last-modified" not in response.headers
+    assert len(response.json()) == 2
+    follow = await api.get("/api/blogs", params={"fields": fields, "limit": 2, "cursor": response.headers["x-next-cursor"]})
+    assert follow.status_code == 200
+    assert [blog["id"] for blog in follow.json()] == [blog["id"] for blog in (await api.get("/api/blogs")).json()[2:4]]
+
+
+async def test_last_modified_is_newest_updated_at_on_page(db, api):
+    await seed_page(db)
+    response = await api.get("/api/blogs", params={"fields": "title,updated_at", "limit": 2})
+    assert response.headers["last-modified"] == "Fri, 05 Jan 2024 01:00:00 GMT"
+
+
+@pytest.mark.parametrize("term, expected", [
+    ("amp", "AT&amp;T ships <mark>amp</mark> &amp; quot; 3 &lt; 4"),
+    ("lt", "AT&amp;T ships amp &amp; quot; 3 &lt; 4"),
+    ("quot", "AT&amp;T ships amp &amp; <mark>quot</mark>; 3 &lt; 4"),
+    ("ships", "AT&amp;T <mark>ships</mark> amp &amp; quot; 3 &lt; 4"),
+])
+def test_search_snippet_escapes_around_marks(term, expected):
+    text = "AT&T ships amp & quot; 3 < 4"
+    assert server.search_snippet({"title": "t", "excerpt": text, "content": text}, [term]) == expected
+
+
+async def test_search_highlights_matches_in_escaped_text(db, api):
+    await db.blogs.insert_one(blog_doc("telecom", content="Carriers like AT&T & friends use amp pages; amp matters."))
+    response = await api.get("/api/blogs/search", params={"q": "amp"})
+    snippet = response.json()["items"][0]["snippet"]
+    assert snippet == "Carriers like AT&amp;T &amp; friends use <mark>amp</mark> pages; <mark>amp</mark> matters."
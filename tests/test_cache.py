@@ -0,0 +1,90 @@
+import asyncio
+
+import pytest
+
+import server
+
+pytestmark = pytest.mark.anyio
+
+
+class Loader:
+    """Loader that blocks until released and counts how often it ran."""
+
+    def __init__(self, value):
+        self.value = value
+        self.calls = 0
+        self.release = asyncio.Event()
+
+    async def __call__(self):
+        self.calls += 1
+        await self.release.wait()
+        return self.value
+
+
+async def test_concurrent_misses_share_one_load():
+    cache = server.TTLCache()
+    loader = Loader("v1")
+    waiters = [asyncio.create_task(cache.get_or_load(("blog", "a"), loader)) for _ in range(5)]
+    await asyncio.sleep(0)
+    loader.release.set()
+    assert await asyncio.gather(*waiters) == ["v1"] * 5
+    assert loader.calls == 1
+    assert cache.get(("blog", "a")) == "v1"
+
+
+@pytest.mark.parametrize("drop", [
+    lambda cache: cache.invalidate(("blog", "a")),
+    lambda cache: cache.invalidate_prefix("blog"),
+    lambda cache: cache.clear(),
+])
+async def test_invalidation_during_load_discards_result(drop):
+    cache = server.TTLCache()
+    stale = Loader("stale")
+    first = asyncio.create_task(cache.get_or_load(("blog", "a"), stale))
+    await asyncio.sleep(0)
+    drop(cache)
+
+    fresh = Loader("fresh")
+    second = asyncio.create_task(cache.get_or_load(("blog", "a"), fresh))
+    await asyncio.sleep(0)
+    assert fresh.calls == 1, "a load started before the write must not be joined after it"
+
+    stale.release.set()
+    assert await first == "stale"
+    assert cache.get(("blog", "a")) is None, "the pre-write result must not be cached"
+    fresh.release.set()
+    assert await second == "fresh"
+    assert cache.get(("blog", "a")) == "fresh"
+
+
+async def test_invalidate_prefix_leaves_other_resources():
+    cache = server.TTLCache()
+    cache.set(("blog", "a"), 1)
+    cache.set(("blogs", "list"), 2)
+    cache.set(("seo", "home"), 3)
+    cache.invalidate_prefix("blog")
+    assert cache.get(("blog", "a")) is None
+    assert cache.get(("blogs", "list")) == 2
+    assert cache.get(("seo", "home")) == 3
+    assert cache.stats().invalidations == 1
+
+
+async def test_failed_load_reaches_waiters_and_is_not_cached():
+    cache = server.TTLCache()
+    release = asyncio.Event()
+
+    async def failing():
+        await release.wait()
+        raise RuntimeError("boom")
+
+    waiters = [asyncio.create_task(cache.get_or_load(("blog", "a"), failing)) for _ in range(3)]
+    await asyncio.sleep(0)
+    release.set()
+    results = await asyncio.gather(*waiters, return_exceptions=True)
+    assert all(isinstance(result, RuntimeError) for result in results)
+    assert cache.get(("blog", "a")) is None
+
+    async def recovered():
+        return "ok"
+
+    assert await cache.get_or_load(("blog", "a"), recovered) == "ok"
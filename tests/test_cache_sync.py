@@ -0,0 +1,118 @@
+import pytest
+
+import server
+from tests.helpers import blog_doc
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def sync(db):
+    sync = server.CacheSync(mode="poll")
+    sync.source = "poll"
+    await sync.poll()
+    return sync
+
+
+@pytest.fixture
+def loads(monkeypatch):
+    counter = {"loads": 0}
+    load = server.RelatedPostsIndex._load
+
+    async def counting_load(self, database):
+        counter["loads"] += 1
+        await load(self, database)
+
+    monkeypatch.setattr(server.RelatedPostsIndex, "_load", counting_load)
+    return counter
+
+
+@pytest.fixture
+def key_scans(monkeypatch):
+    counter = {"scans": 0}
+    reconcile = server.CacheSync._reconcile
+
+    async def counting_reconcile(self, collection):
+        counter["scans"] += 1
+        await reconcile(self, collection)
+
+    monkeypatch.setattr(server.CacheSync, "_reconcile", counting_reconcile)
+    return counter
+
+
+async def create_blog(api, admin_headers, slug):
+    fields = {field: blog_doc(slug)[field] for field in server.BlogCreate.model_fields}
+    response = await api.post("/api/blogs", json=fields, headers=admin_headers)
+    assert response.status_code == 200
+
+
+async def test_deleted_blog_is_seen_from_its_tombstone(db, api, admin_headers, sync, key_scans):
+    await create_blog(api, admin_headers, "doomed")
+    await sync.poll()
+    await server.sitemap_cache.load()
+    assert (await api.get("/api/blogs/doomed")).status_code == 200
+
+    assert (await api.delete("/api/blogs/doomed", headers=admin_headers)).status_code == 200
+    await create_blog(api, admin_headers, "fresh")
+    await sync.poll()
+
+    assert await db.deletions.find_one({"collection": "blogs", "key": "doomed"}) is not None
+    assert key_scans["scans"] == 0
+    assert (await api.get("/api/blogs/doomed")).status_code == 404
+    assert (await api.get("/api/blogs/fresh")).status_code == 200
+    sitemap = (await server.sitemap_cache.get("sitemap.xml")).body
+    assert b"/blog/fresh" in sitemap
+    assert b"/blog/doomed" not in sitemap
+
+
+async def test_deleted_and_recreated_slug_stays_indexed(db, api, admin_headers, sync):
+    await create_blog(api, admin_headers, "phoenix")
+    await sync.poll()
+    await server.sitemap_cache.load()
+    assert (await api.delete("/api/blogs/phoenix", headers=admin_headers)).status_code == 200
+    await create_blog(api, admin_headers, "phoenix")
+    await sync.poll()
+    assert b"/blog/phoenix" in (await server.sitemap_cache.get("sitemap.xml")).body
+    assert list(sync._keys["blogs"].values()) == ["phoenix"]
+
+
+async def test_idle_polls_do_not_rescan_keys(db, sync, key_scans):
+    await db.blogs.insert_one(blog_doc("steady"))
+    await sync.poll()
+    for _ in range(3):
+        await sync.poll()
+    assert key_scans["scans"] == 0
+
+
+async def test_delete_outside_the_app_is_found_by_the_count(db, api, sync, key_scans):
+    await db.seo_settings.insert_one(server.SEOSettings(page="pricing", title="Pricing").model_dump())
+    await sync.poll()
+    assert (await api.get("/api/seo/pricing")).status_code == 200
+    await db.seo_settings.delete_one({"page": "pricing"})
+    await sync.poll()
+    assert key_scans["scans"] == 1
+    assert sync._keys["seo_settings"] == {}
+    assert (await api.get("/api/seo/pricing")).status_code == 404
+
+
+async def test_tombstones_expire(db):
+    indexes = await db.deletions.index_information()
+    assert indexes["deleted_at_ttl"]["expireAfterSeconds"] == server.CACHE_SYNC_TOMBSTONE_TTL_SECONDS
+
+
+async def test_own_writes_do_not_reload_related_posts(api, admin_headers, sync, loads):
+    for slug in ("cloud-costs", "cloud-savings"):
+        await create_blog(api, admin_headers, slug)
+        await sync.poll()
+    assert loads["loads"] == 1
+    assert server.related_posts._loaded
+
+
+async def test_rows_from_another_worker_are_patched_in(sync, loads):
+    await server.related_posts.upsert(blog_doc("cloud-costs"))
+    other_worker = server.RelatedPostsIndex()
+    await other_worker.upsert(blog_doc("cloud-savings"))
+    await sync.poll()
+    await server.related_posts.upsert(blog_doc("cloud-budgets"))
+    assert loads["loads"] == 2
+    assert {slug for slug, _ in server.related_posts._related["cloud-budgets"]} == {"cloud-costs", "cloud-savings"}
@@ -0,0 +1,72 @@
+import gzip
+
+import pytest
+
+import server
+from tests.helpers import blog_doc
+
+pytestmark = pytest.mark.anyio
+
+ENCODINGS = ["gzip"] + (["br"] if server.brotli is not None else [])
+
+
+@pytest.fixture
+async def long_post(db):
+    await db.blogs.insert_one(blog_doc("long-post", content="Cloud migration checklist. " * 400))
+    return "/api/blogs/long-post"
+
+
+async def fetch(api, path, encoding, **headers):
+    return await api.get(path, headers={"accept-encoding": encoding, **headers})
+
+
+@pytest.mark.parametrize("encoding", ENCODINGS)
+async def test_compressed_etag_is_suffixed_per_encoding(api, long_post, encoding):
+    identity = await fetch(api, long_post, "identity")
+    compressed = await fetch(api, long_post, encoding)
+    assert "content-encoding" not in identity.headers
+    assert compressed.headers["content-encoding"] == encoding
+    assert compressed.headers["etag"] == server.encoded_etag(identity.headers["etag"], encoding)
+    assert "Accept-Encoding" in compressed.headers["vary"]
+    assert compressed.content == identity.content
+
+
+@pytest.mark.parametrize("encoding", ENCODINGS)
+async def test_revalidation_accepts_any_representation_tag(api, long_post, encoding):
+    etag = (await fetch(api, long_post, "identity")).headers["etag"]
+    for sent in (server.encoded_etag(etag, encoding), etag, f"W/{server.encoded_etag(etag, encoding)}", f'"other", {etag}'):
+        response = await fetch(api, long_post, encoding, **{"if-none-match": sent})
+        assert response.status_code == 304, sent
+        assert response.content == b""
+    assert (await fetch(api, long_post, encoding, **{"if-none-match": '"other"'})).status_code == 200
+
+
+@pytest.mark.parametrize("encoding", ENCODINGS)
+async def test_not_modified_echoes_the_representation_tag(api, long_post, encoding):
+    etag = (await fetch(api, long_post, "identity")).headers["etag"]
+    suffixed = server.encoded_etag(etag, encoding)
+    assert (await fetch(api, long_post, encoding, **{"if-none-match": suffixed})).headers["etag"] == suffixed
+    assert (await fetch(api, long_post, "identity", **{"if-none-match": etag})).headers["etag"] == etag
+
+
+async def test_repeat_requests_reuse_compressed_bytes(api, long_post):
+    await fetch(api, long_post, "gzip")
+    hits = server.compressed_cache.stats().hits
+    await fetch(api, long_post, "gzip")
+    assert server.compressed_cache.stats().hits == hits + 1
+
+
+async def test_small_responses_are_not_compressed(db, api):
+    await db.seo_settings.insert_one(server.SEOSettings(page="home", title="Home").model_dump())
+    response = await fetch(api, "/api/seo/home", "gzip")
+    assert "content-encoding" not in response.headers
+    assert not response.headers["etag"].endswith('-gzip"')
+
+
+async def test_pre_gzipped_sitemap_passes_through(db, api):
+    await db.blogs.insert_many([blog_doc(f"post-{n}") for n in range(40)])
+    await server.sitemap_cache.load()
+    response = await api.get("/sitemap.xml", headers={"accept-encoding": "gzip"})
+    assert response.headers["content-encoding"] == "gzip"
+    document = await server.sitemap_cache.get("sitemap.xml")
+    assert gzip.decompress(document.gzipped) == response.content
@@ -0,0 +1,82 @@
+import json
+import os
+
+import pytest
+
+import export_static
+import server
+from tests.helpers import blog_doc
+
+pytestmark = pytest.mark.anyio
+
+OLD = 1_000_000_000
+
+
+def manifest(out_dir):
+    return json.loads((out_dir / export_static.MANIFEST).read_text())["files"]
+
+
+def age_files(out_dir):
+    for path in out_dir.rglob("*"):
+        if path.is_file():
+            os.utime(path, (OLD, OLD))
+
+
+def untouched(out_dir, path):
+    return (out_dir / path).stat().st_mtime == OLD
+
+
+@pytest.fixture
+async def exported(db, tmp_path):
+    await db.blogs.insert_many([blog_doc("alpha"), blog_doc("beta"), blog_doc("gamma", published=False)])
+    await db.seo_settings.insert_one(server.SEOSettings(page="home", title="Home").model_dump())
+    await export_static.export(tmp_path, incremental=False)
+    return tmp_path
+
+
+async def test_full_export_writes_every_file(exported):
+    files = manifest(exported)
+    for logical in ("index.html", "blog/index.html", "blog/alpha/index.html", "robots.txt", "sitemap.xml"):
+        assert files[logical]["path"] == logical
+    assert "blog/gamma/index.html" not in files
+    blog_json = files["api/blogs/alpha.json"]["path"]
+    assert blog_json.startswith("api/blogs/alpha.") and blog_json != "api/blogs/alpha.json"
+    assert json.loads((exported / blog_json).read_text())["slug"] == "alpha"
+    for entry in files.values():
+        assert (exported / entry["path"]).exists()
+        assert (exported / f"{entry['path']}.gz").exists()
+    assert "<h1>Post alpha</h1>" in (exported / "blog/alpha/index.html").read_text()
+
+
+async def test_incremental_export_rewrites_only_changed_posts(db, exported):
+    before = manifest(exported)
+    age_files(exported)
+    await db.blogs.update_one({"slug": "beta"}, {"$set": {"title": "Beta, revised", "updated_at": server.datetime.now(server.timezone.utc)}})
+    await export_static.export(exported, incremental=True)
+    after = manifest(exported)
+    assert untouched(exported, "blog/alpha/index.html")
+    assert after["api/blogs/alpha.json"] == before["api/blogs/alpha.json"]
+    assert not untouched(exported, "blog/beta/index.html")
+    assert "Beta, revised" in (exported / "blog/beta/index.html").read_text()
+    assert after["api/blogs/beta.json"]["path"] != before["api/blogs/beta.json"]["path"]
+    assert not (exported / before["api/blogs/beta.json"]["path"]).exists()
+
+
+async def test_unchanged_aggregates_are_left_alone(exported):
+    age_files(exported)
+    await export_static.export(exported, incremental=True)
+    assert untouched(exported, "robots.txt")
+    assert untouched(exported, "blog/alpha/index.html")
+
+
+async def test_unpublished_posts_are_removed(db, exported):
+    alpha_json = manifest(exported)["api/blogs/alpha.json"]["path"]
+    await db.blogs.update_one({"slug": "alpha"}, {"$set": {"published": False, "updated_at": server.datetime.now(server.timezone.utc)}})
+    await export_static.export(exported, incremental=True)
+    files = manifest(exported)
+    assert "api/blogs/alpha.json" not in files and "blog/alpha/index.html" not in files
+    for path in (alpha_json, "blog/alpha/index.html"):
+        for suffix in ("", ".gz", ".br"):
+            assert not (exported / f"{path}{suffix}").exists()
+    assert "/blog/alpha" not in (exported / "sitemap.xml").read_text()
+    assert (exported / "blog/beta/index.html").exists()
@@ -0,0 +1,71 @@
+from datetime import timedelta
+
+import pytest
+
+import server
+from tests.helpers import blog_doc
+
+pytestmark = pytest.mark.anyio
+
+ROUTES = [
+    "/api/seo",
+    "/api/seo/home",
+    "/api/seo/services",
+    "/api/blogs",
+    "/api/blogs?published_only=false&limit=2",
+    "/api/blogs?fields=title,excerpt,updated_at",
+    "/api/blogs/first-post",
+    "/api/blogs/draft-post",
+    "/api/keywords?sort=-ranking",
+    "/api/keywords?sort=search_volume&limit=2",
+]
+
+
+@pytest.fixture
+async def content(db):
+    start = server.datetime(2024, 5, 1, 8, 30, 15, 123000, tzinfo=server.timezone.utc)
+    await db.blogs.insert_many([
+        blog_doc("first-post", created_at=start, updated_at=start + timedelta(days=1), featured_image="https://cdn.example.com/a.png"),
+        blog_doc("second-post", created_at=start + timedelta(days=2), title='Quotes "and" unicode – ✓'),
+        blog_doc("draft-post", created_at=start + timedelta(days=3), published=False),
+    ])
+    await db.seo_settings.insert_many([
+        server.SEOSettings(page="home", title="Home", json_ld={"@type": "Organization", "sameAs": ["a", "b"], "n": 1.5}).model_dump(),
+        server.SEOSettings(page="services", description="Services", updated_at=start).model_dump(),
+    ])
+    await db.keywords.insert_many([
+        server.Keyword(keyword="cloud", page="home", ranking=3, search_volume=None, tracked_at=start).model_dump(),
+        server.Keyword(keyword="devops", page="services", ranking=None, search_volume=500, difficulty="high").model_dump(),
+        server.Keyword(keyword="ai", page="home", ranking=1, search_volume=120).model_dump(),
+    ])
+
+
+async def fetch_all(api, headers, monkeypatch, fast):
+    monkeypatch.setattr(server, "FAST_JSON", fast)
+    monkeypatch.setattr(server, "FAST_JSON_VALIDATE", fast)
+    for cache in server.CACHES.values():
+        cache.clear()
+    responses = {}
+    for route in ROUTES:
+        response = await api.get(route, headers=headers)
+        assert response.status_code == 200, (route, response.text)
+        responses[route] = response
+    return responses
+
+
+async def test_fast_path_matches_pydantic_output(api, admin_headers, content, monkeypatch):
+    slow = await fetch_all(api, admin_headers, monkeypatch, fast=False)
+    fast = await fetch_all(api, admin_headers, monkeypatch, fast=True)
+    for route in ROUTES:
+        assert fast[route].json() == slow[route].json(), route
+        assert fast[route].headers["content-type"] == "application/json"
+        for header in ("etag", "last-modified", "x-next-cursor"):
+            assert fast[route].headers.get(header) == slow[route].headers.get(header), (route, header)
+
+
+async def test_validation_rejects_a_divergent_body(content, monkeypatch):
+    monkeypatch.setattr(server, "FAST_JSON_VALIDATE", True)
+    blog = await server.db.blogs.find_one({"slug": "first-post"}, {"_id": 0})
+    body = server.json_body(server.Blog, blog)
+    with pytest.raises(ValueError):
+        server.check_json_body(server.Blog, blog, body.replace(b"first-post", b"other-post"), False, False)
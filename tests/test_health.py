@@ -0,0 +1,38 @@
+import pytest
+
+import server
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+def pool_monitor(monkeypatch):
+    monitor = server.MongoPoolMonitor()
+    monitor.open["mongo-0.internal:27017"] = 3
+    monkeypatch.setattr(server, "mongo_pool_monitor", monitor)
+    return monitor
+
+
+async def test_readiness_exposes_no_pool_detail(api, pool_monitor):
+    response = await api.get("/api/health/ready")
+    assert response.status_code == 200
+    assert set(response.json()) == {"ready", "mongo_ping_ms"}
+    assert response.json()["ready"] is True
+    assert "mongo-0" not in response.text
+
+
+async def test_paused_pool_fails_readiness(api, pool_monitor):
+    pool_monitor.paused.add("mongo-0.internal:27017")
+    response = await api.get("/api/health/ready")
+    assert response.status_code == 503
+    assert response.json() == {"ready": False, "mongo_ping_ms": response.json()["mongo_ping_ms"]}
+
+
+async def test_pool_detail_requires_admin(api, admin_headers, pool_monitor):
+    assert (await api.get("/api/health/mongo")).status_code in (401, 403)
+    response = await api.get("/api/health/mongo", headers=admin_headers)
+    assert response.status_code == 200
+    assert response.json()["pools"] == [
+        {"address": "mongo-0.internal:27017", "open_connections": 3, "checked_out": 0, "paused": False}
+    ]
+    assert response.json()["check_out_failures"] == 0
@@ -0,0 +1,55 @@
+import json
+
+import pytest
+
+pytestmark = pytest.mark.anyio
+
+ROWS = [
+    {"keyword": "cloud migration", "page": "services", "ranking": 4, "search_volume": 900},
+    {"keyword": "devops consulting", "page": "services", "ranking": None, "search_volume": 300},
+    {"keyword": "seo audit", "page": "home", "ranking": 12},
+]
+
+
+def ndjson(rows):
+    return "\n".join(json.dumps(row) for row in rows).encode()
+
+
+async def import_rows(api, headers, body, content_type="application/x-ndjson"):
+    response = await api.post("/api/keywords/bulk", content=body, headers={**headers, "content-type": content_type})
+    assert response.status_code == 200
+    return response.json()
+
+
+async def test_undecodable_line_is_a_row_error(api, admin_headers):
+    body = ndjson(ROWS[:1]) + b"\n\xff\xfe\n" + ndjson(ROWS[1:])
+    result = await import_rows(api, admin_headers, body)
+    assert result["inserted"] == 3
+    assert result["failed"] == 1
+    assert result["errors"][0]["line"] == 2
+    assert "utf-8" in result["errors"][0]["error"]
+
+
+@pytest.mark.parametrize("export_format, content_type", [("ndjson", "application/x-ndjson"), ("csv", "text/csv")])
+async def test_reimporting_an_export_updates_in_place(db, api, admin_headers, export_format, content_type):
+    await import_rows(api, admin_headers, ndjson(ROWS))
+    before = sorted((await api.get("/api/keywords", params={"limit": 500}, headers=admin_headers)).json(), key=lambda k: k["id"])
+    observations = await db.keyword_rankings.count_documents({})
+
+    exported = await api.get("/api/keywords/export", params={"format": export_format}, headers=admin_headers)
+    result = await import_rows(api, admin_headers, exported.content, content_type)
+
+    assert (result["inserted"], result["updated"], result["failed"]) == (0, 3, 0)
+    after = sorted((await api.get("/api/keywords", params={"limit": 500}, headers=admin_headers)).json(), key=lambda k: k["id"])
+    assert after == before
+    assert await db.keyword_rankings.count_documents({}) == observations
+
+
+async def test_reimport_with_a_new_ranking_records_it(db, api, admin_headers):
+    await import_rows(api, admin_headers, ndjson(ROWS[:1]))
+    keyword = await db.keywords.find_one({}, {"_id": 0})
+    changed = {**keyword, "ranking": 2, "tracked_at": "2030-01-01T00:00:00+00:00"}
+    result = await import_rows(api, admin_headers, ndjson([changed]))
+    assert (result["inserted"], result["updated"]) == (0, 1)
+    assert (await db.keywords.find_one({"id": keyword["id"]}))["ranking"] == 2
+    assert await db.keyword_rankings.count_documents({"keyword_id": keyword["id"]}) == 2
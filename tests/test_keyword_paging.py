@@ -0,0 +1,72 @@
+import random
+from datetime import timedelta
+
+import pytest
+
+import server
+
+pytestmark = pytest.mark.anyio
+
+
+async def seed_keywords(db, count=37):
+    rng = random.Random(13)
+    start = server.datetime(2024, 3, 1, tzinfo=server.timezone.utc)
+    docs = [
+        server.Keyword(
+            keyword=rng.choice(["cloud", "devops", "seo", "ai"]),
+            page=rng.choice(["home", "services"]),
+            ranking=rng.choice([None, None, 1, 2, 3]),
+            search_volume=rng.choice([None, 100, 250]),
+            tracked_at=start + timedelta(hours=rng.choice([0, 1, 2])),
+        ).model_dump()
+        for _ in range(count)
+    ]
+    await db.keywords.insert_many([dict(doc) for doc in docs])
+    return docs
+
+
+def expected_order(docs, sort, descending):
+    ordered = sorted(docs, key=lambda doc: (doc[sort] is not None, doc[sort] if doc[sort] is not None else 0, doc["id"]))
+    return [doc["id"] for doc in (reversed(ordered) if descending else ordered)]
+
+
+async def page_through(api, headers, params):
+    ids, cursor = [], None
+    for _ in range(200):
+        response = await api.get("/api/keywords", params={**params, **({"cursor": cursor} if cursor else {})}, headers=headers)
+        assert response.status_code == 200
+        ids += [keyword["id"] for keyword in response.json()]
+        cursor = response.headers.get("x-next-cursor")
+        if not cursor:
+            return ids
+    raise AssertionError("paging did not terminate")
+
+
+@pytest.mark.parametrize("sort", server.KEYWORD_SORT_FIELDS)
+@pytest.mark.parametrize("descending", [False, True])
+@pytest.mark.parametrize("limit", [1, 4, 10])
+async def test_pages_have_no_gaps_or_duplicates(db, api, admin_headers, sort, descending, limit):
+    docs = await seed_keywords(db)
+    ids = await page_through(api, admin_headers, {"sort": f"{'-' if descending else ''}{sort}", "limit": limit})
+    assert len(ids) == len(set(ids))
+    assert ids == expected_order(docs, sort, descending)
+
+
+@pytest.mark.parametrize("sort", ["ranking", "-ranking", "search_volume", "-search_volume"])
+async def test_paging_with_filters(db, api, admin_headers, sort):
+    docs = await seed_keywords(db)
+    ids = await page_through(api, admin_headers, {"sort": sort, "limit": 3, "page": "services"})
+    services = [doc for doc in docs if doc["page"] == "services"]
+    assert ids == expected_order(services, sort.lstrip("-"), sort.startswith("-"))
+
+
+async def test_cursor_for_another_sort_is_rejected(db, api, admin_headers):
+    await seed_keywords(db)
+    cursor = (await api.get("/api/keywords", params={"sort": "ranking", "limit": 2}, headers=admin_headers)).headers["x-next-cursor"]
+    response = await api.get("/api/keywords", params={"sort": "-ranking", "limit": 2, "cursor": cursor}, headers=admin_headers)
+    assert response.status_code == 400
+
+
+async def test_default_order_is_most_recently_tracked(db, api, admin_headers):
+    docs = await seed_keywords(db)
+    assert await page_through(api, admin_headers, {"limit": 5}) == expected_order(docs, "tracked_at", True)
@@ -0,0 +1,21 @@
+import pytest
+
+import server
+
+pytestmark = pytest.mark.anyio
+
+
+async def test_metrics_are_not_served_without_a_token(api, monkeypatch):
+    monkeypatch.setattr(server, "METRICS_TOKEN", None)
+    monkeypatch.setattr(server, "METRICS_ENABLED", True)
+    assert (await api.get("/metrics")).status_code == 404
+
+
+async def test_metrics_require_the_configured_token(api, monkeypatch):
+    monkeypatch.setattr(server, "METRICS_TOKEN", "scrape-secret")
+    monkeypatch.setattr(server, "METRICS_ENABLED", True)
+    assert (await api.get("/metrics")).status_code == 401
+    assert (await api.get("/metrics", headers={"Authorization": "Bearer wrong"})).status_code == 401
+    response = await api.get("/metrics", headers={"Authorization": "Bearer scrape-secret"})
+    assert response.status_code == 200
+    assert "# TYPE cache_hits_total counter" in response.text
@@ -0,0 +1,30 @@
+import pytest
+
+import migrate_dates
+import server
+
+pytestmark = pytest.mark.anyio
+
+
+@pytest.fixture
+async def legacy_keywords(db, monkeypatch):
+    monkeypatch.setattr(migrate_dates, "db", db)
+    await db.keywords.insert_many(
+        [{"id": str(n), "tracked_at": f"2024-01-{n + 1:02d}T08:00:00"} for n in range(7)]
+        + [{"id": "bad", "tracked_at": "last tuesday"}, {"id": "native", "tracked_at": server.datetime(2024, 2, 1, tzinfo=server.timezone.utc)}]
+    )
+    return db
+
+
+async def test_dry_run_counts_without_writing(legacy_keywords, capsys):
+    assert await migrate_dates.migrate_field("keywords", "tracked_at", 2, 0, dry_run=True) == 7
+    assert await legacy_keywords.keywords.count_documents({"tracked_at": {"$type": "string"}}) == 8
+    assert capsys.readouterr().out.count("unparseable value 'last tuesday'") == 1
+
+
+async def test_run_converts_in_batches_and_skips_unparseable(legacy_keywords):
+    assert await migrate_dates.migrate_field("keywords", "tracked_at", 2, 0, dry_run=False) == 7
+    remaining = await legacy_keywords.keywords.find({"tracked_at": {"$type": "string"}}).to_list(None)
+    assert [doc["id"] for doc in remaining] == ["bad"]
+    converted = await legacy_keywords.keywords.find_one({"id": "3"})
+    assert converted["tracked_at"] == server.datetime(2024, 1, 4, 8, tzinfo=server.timezone.utc)
@@ -0,0 +1,76 @@
+import pytest
+
+import server
+
+pytestmark = pytest.mark.anyio
+
+UTC = server.timezone.utc
+
+
+@pytest.fixture
+async def keywords(api, admin_headers):
+    created = {}
+    for name, page in (("cloud", "services"), ("devops", "services"), ("seo", "home")):
+        response = await api.post("/api/keywords", json={"keyword": name, "page": page}, headers=admin_headers)
+        created[name] = response.json()["id"]
+    return created
+
+
+async def observe(api, headers, keyword_id, ranking, observed_at):
+    response = await api.post(f"/api/keywords/{keyword_id}/rankings", json={"ranking": ranking, "observed_at": observed_at.isoformat()}, headers=headers)
+    assert response.status_code == 200
+    return response.json()
+
+
+async def test_recording_upserts_day_and_week_buckets(db, api, admin_headers, keywords):
+    # 2024-05-06 is a Monday; the 8th and 12th fall in the same week, the 13th starts the next one.
+    for ranking, observed_at in ((8, server.datetime(2024, 5, 8, 9, tzinfo=UTC)), (4, server.datetime(2024, 5, 8, 17, tzinfo=UTC)),
+                                 (6, server.datetime(2024, 5, 12, 23, tzinfo=UTC)), (2, server.datetime(2024, 5, 13, 1, tzinfo=UTC))):
+        await observe(api, admin_headers, keywords["cloud"], ranking, observed_at)
+    rollups = {
+        (doc["period"], doc["bucket"].date().isoformat()): (doc["count"], doc["sum"], doc["min"], doc["max"])
+        async for doc in db.keyword_ranking_rollups.find({"scope": "keyword", "key": keywords["cloud"]})
+    }
+    assert rollups == {
+        ("day", "2024-05-08"): (2, 12, 4, 8),
+        ("day", "2024-05-12"): (1, 6, 6, 6),
+        ("day", "2024-05-13"): (1, 2, 2, 2),
+        ("week", "2024-05-06"): (3, 18, 4, 8),
+        ("week", "2024-05-13"): (1, 2, 2, 2),
+    }
+    assert await db.keyword_ranking_rollups.count_documents({"scope": "page", "key": "services"}) == 5
+
+
+async def test_keyword_trend_is_an_ordered_series(api, admin_headers, keywords):
+    for day, ranking in ((20, 9), (3, 5), (11, 7)):
+        await observe(api, admin_headers, keywords["cloud"], ranking, server.datetime(2024, 6, day, 12, tzinfo=UTC))
+    response = await api.get(f"/api/keywords/{keywords['cloud']}/trend",
+                             params={"since": "2024-06-01T00:00:00Z", "until": "2024-06-30T00:00:00Z"}, headers=admin_headers)
+    assert response.status_code == 200
+    points = response.json()["points"]
+    assert [(point["bucket"][:10], point["avg"]) for point in points] == [("2024-06-03", 5), ("2024-06-11", 7), ("2024-06-20", 9)]
+    window = await api.get(f"/api/keywords/{keywords['cloud']}/trend",
+                           params={"since": "2024-06-10T00:00:00Z", "until": "2024-06-15T00:00:00Z"}, headers=admin_headers)
+    assert [point["bucket"][:10] for point in window.json()["points"]] == ["2024-06-11"]
+
+
+async def test_page_trend_combines_its_keywords(api, admin_headers, keywords):
+    day = server.datetime(2024, 7, 2, 8, tzinfo=UTC)
+    await observe(api, admin_headers, keywords["cloud"], 3, day)
+    await observe(api, admin_headers, keywords["devops"], 9, day)
+    await observe(api, admin_headers, keywords["devops"], 5, day.replace(day=9))
+    await observe(api, admin_headers, keywords["seo"], 1, day)
+    response = await api.get("/api/keywords/trend", params={"page": "services", "period": "week",
+                                                            "since": "2024-07-01T00:00:00Z", "until": "2024-07-31T00:00:00Z"}, headers=admin_headers)
+    points = response.json()["points"]
+    assert [(point["bucket"][:10], point["avg"], point["min"], point["max"], point["count"]) for point in points] == [
+        ("2024-07-01", 6, 3, 9, 2),
+        ("2024-07-08", 5, 5, 5, 1),
+    ]
+
+
+async def test_missing_keyword_is_404(api, admin_headers, keywords):
+    assert (await api.get("/api/keywords/no-such-id/trend", headers=admin_headers)).status_code == 404
+    response = await api.post("/api/keywords/no-such-id/rankings", json={"ranking": 3}, headers=admin_headers)
+    assert response.status_code == 404
+    assert (await api.get(f"/api/keywords/{keywords['seo']}/trend", headers=admin_headers)).json()["points"] == []
@@ -0,0 +1,94 @@
+import numpy as np
+import pytest
+
+import server
+from tests.helpers import blog_doc
+
+pytestmark = pytest.mark.anyio
+
+TOPICS = {
+    "k8s": ("kubernetes cluster autoscaling", "kubernetes, containers"),
+    "pasta": ("fresh pasta dough recipe", "cooking, pasta"),
+}
+
+
+def post(slug, topic, extra=""):
+    title, keywords = TOPICS[topic]
+    return blog_doc(slug, title=f"{title} {extra}".strip(), keywords=keywords, content=f"{title} {extra}".strip())
+
+
+def neighbours(index, slug):
+    return [other for other, _ in index._related.get(slug, [])]
+
+
+async def stored_lists(db):
+    return {doc["slug"]: [entry["slug"] for entry in doc["related"]] async for doc in db.blog_related.find({})}
+
+
+@pytest.fixture
+async def index(db, monkeypatch):
+    index = server.RelatedPostsIndex(top_n=2)
+    monkeypatch.setattr(server, "related_posts", index)
+    return index
+
+
+async def test_upserts_link_posts_on_the_same_topic(db, index):
+    for slug, topic in (("k8s-1", "k8s"), ("pasta-1", "pasta"), ("k8s-2", "k8s"), ("pasta-2", "pasta")):
+        await index.upsert(post(slug, topic))
+    assert neighbours(index, "k8s-1") == ["k8s-2"]
+    assert neighbours(index, "pasta-2") == ["pasta-1"]
+    assert (await stored_lists(db))["k8s-2"] == ["k8s-1"]
+
+
+async def test_delete_removes_the_post_from_other_lists(db, index):
+    for n in range(3):
+        await index.upsert(post(f"k8s-{n}", "k8s", extra="scheduler" if n else ""))
+    assert "k8s-1" in neighbours(index, "k8s-0")
+    await index.remove("k8s-1")
+    assert all("k8s-1" not in related for related in index._related.values())
+    lists = await stored_lists(db)
+    assert "k8s-1" not in lists
+    assert all("k8s-1" not in related for related in lists.values())
+    assert neighbours(index, "k8s-0") == ["k8s-2"]
+
+
+async def test_unpublishing_drops_the_post(db, index):
+    await index.upsert(post("k8s-0", "k8s"))
+    await index.upsert(post("k8s-1", "k8s"))
+    await index.upsert({**post("k8s-1", "k8s"), "published": False})
+    assert neighbours(index, "k8s-0") == []
+    assert "k8s-1" not in await stored_lists(db)
+
+
+async def test_lists_are_cut_at_top_n_and_ranked(db, index):
+    await index.upsert(post("k8s-0", "k8s", extra="helm operators"))
+    await index.upsert(post("k8s-close", "k8s", extra="helm operators"))
+    await index.upsert(post("k8s-near", "k8s", extra="helm"))
+    for n in range(4):
+        await index.upsert(post(f"k8s-far-{n}", "k8s", extra=f"topic{n}"))
+    for related in index._related.values():
+        scores = [score for _, score in related]
+        assert len(related) <= 2
+        assert scores == sorted(scores, reverse=True)
+    assert neighbours(index, "k8s-0") == ["k8s-close", "k8s-near"]
+
+
+async def test_incremental_norms_match_a_full_recompute(db, index):
+    for n in range(6):
+        await index.upsert(post(f"post-{n}", "k8s" if n % 2 else "pasta", extra=f"part {n}"))
+    await index.remove("post-3")
+    await index.upsert(post("post-0", "k8s", extra="rewritten"))
+    idf = np.log((1 + len(index._slots)) / (1 + index._df)) + 1
+    expected = np.sqrt((index._matrix.astype(np.float64) ** 2) @ (idf ** 2))
+    np.testing.assert_allclose(index._norms(), expected, rtol=1e-6)
+
+
+async def test_missing_rows_are_built_on_startup(db, index):
+    await db.blogs.insert_many([post("k8s-0", "k8s"), post("k8s-1", "k8s"), {**post("k8s-draft", "k8s"), "published": False}])
+    await server.build_missing_related_posts()
+    await index._building
+    assert await stored_lists(db) == {"k8s-0": ["k8s-1"], "k8s-1": ["k8s-0"]}
+    await db.blogs.insert_one(post("k8s-2", "k8s"))
+    await server.build_missing_related_posts()
+    await index._building
+    assert "k8s-2" not in await stored_lists(db)
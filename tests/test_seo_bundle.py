@@ -0,0 +1,84 @@
+from datetime import timedelta
+
+import pytest
+
+import server
+from tests.helpers import blog_doc
+
+pytestmark = pytest.mark.anyio
+
+START = server.datetime(2024, 3, 1, tzinfo=server.timezone.utc)
+
+
+@pytest.fixture
+async def site(db):
+    await db.seo_settings.insert_many([
+        server.SEOSettings(page="home", title="Home", updated_at=START).model_dump(),
+        server.SEOSettings(page="services", title="Services", json_ld={"@type": "Service"}, updated_at=START + timedelta(days=2)).model_dump(),
+    ])
+    await db.blogs.insert_many(
+        [blog_doc(f"post-{n:02d}", created_at=START + timedelta(hours=n), updated_at=START + timedelta(days=1, hours=n)) for n in range(server.BLOG_PAGE_DEFAULT_LIMIT + 3)]
+        + [blog_doc("draft", published=False, created_at=START + timedelta(days=30))]
+    )
+
+
+async def test_bundle_holds_every_page_and_the_first_blog_page(api, site):
+    response = await api.get("/api/seo/bundle")
+    assert response.status_code == 200
+    bundle = response.json()
+    assert sorted(bundle["seo"]) == ["home", "services"]
+    assert bundle["seo"]["services"]["json_ld"] == {"@type": "Service"}
+    slugs = [blog["slug"] for blog in bundle["blogs"]]
+    assert slugs == [f"post-{n:02d}" for n in range(server.BLOG_PAGE_DEFAULT_LIMIT + 2, 2, -1)]
+    assert all("content" not in blog for blog in bundle["blogs"])
+    assert bundle["next_cursor"]
+    follow = await api.get("/api/blogs", params={"cursor": bundle["next_cursor"]})
+    assert [blog["slug"] for blog in follow.json()] == ["post-02", "post-01", "post-00"]
+
+
+async def test_bundle_matches_the_individual_routes(api, site):
+    bundle = (await api.get("/api/seo/bundle")).json()
+    assert bundle["seo"]["home"] == (await api.get("/api/seo/home")).json()
+    listed = (await api.get("/api/blogs", params={"fields": ",".join(server.BLOG_SUMMARY_FIELDS)})).json()
+    assert bundle["blogs"] == listed
+
+
+async def test_validators_and_not_modified(api, site):
+    response = await api.get("/api/seo/bundle")
+    # Newest of the SEO pages and the listed posts: services at day 2 beats post-22 at day 1 22:00.
+    assert response.headers["last-modified"] == "Sun, 03 Mar 2024 00:00:00 GMT"
+    etag = response.headers["etag"]
+    assert (await api.get("/api/seo/bundle", headers={"if-none-match": etag})).status_code == 304
+    assert (await api.get("/api/seo/bundle", headers={"if-modified-since": response.headers["last-modified"]})).status_code == 304
+    assert (await api.get("/api/seo/bundle", headers={"if-none-match": '"stale"'})).status_code == 200
+
+
+async def test_served_from_cache_until_written(db, api, site):
+    first = await api.get("/api/seo/bundle")
+    await db.seo_settings.update_one({"page": "home"}, {"$set": {"title": "Changed behind the cache"}})
+    assert (await api.get("/api/seo/bundle")).headers["etag"] == first.headers["etag"]
+
+
+@pytest.mark.parametrize("write", [
+    lambda api, headers: api.put("/api/seo/home", json={"page": "home", "title": "New home"}, headers=headers),
+    lambda api, headers: api.post("/api/seo", json={"page": "pricing", "title": "Pricing"}, headers=headers),
+    lambda api, headers: api.post("/api/blogs", json={field: blog_doc("fresh")[field] for field in server.BlogCreate.model_fields}, headers=headers),
+    lambda api, headers: api.put("/api/blogs/post-22", json={"title": "Retitled"}, headers=headers),
+    lambda api, headers: api.delete("/api/blogs/post-22", headers=headers),
+])
+async def test_admin_writes_invalidate_the_bundle(api, admin_headers, site, write):
+    before = await api.get("/api/seo/bundle")
+    assert (await write(api, admin_headers)).status_code == 200
+    after = await api.get("/api/seo/bundle")
+    assert after.headers["etag"] != before.headers["etag"]
+    assert after.json() != before.json()
+    assert (await api.get("/api/seo/bundle", headers={"if-none-match": before.headers["etag"]})).status_code == 200
+
+
+async def test_writes_from_another_worker_invalidate_the_bundle(db, api, site):
+    before = (await api.get("/api/seo/bundle")).json()
+    await db.seo_settings.update_one({"page": "services"}, {"$set": {"title": "Managed services"}})
+    server.CacheSync(mode="off").apply("seo_settings", await db.seo_settings.find_one({"page": "services"}, {"_id": 0}))
+    after = (await api.get("/api/seo/bundle")).json()
+    assert after["seo"]["services"]["title"] == "Managed services"
+    assert after["blogs"] == before["blogs"]
@@ -0,0 +1,130 @@
+import xml.etree.ElementTree as ET
+from datetime import timedelta
+
+import pytest
+
+import server
+from tests.helpers import blog_doc
+
+pytestmark = pytest.mark.anyio
+
+NS = {"sm": "http://www.sitemaps.org/schemas/sitemap/0.9"}
+
+
+def locs(body: bytes, tag: str = "url"):
+    return [node.text for node in ET.fromstring(body).findall(f"sm:{tag}/sm:loc", NS)]
+
+
+async def seed_blogs(db, published: int, drafts: int = 0):
+    start = server.datetime(2024, 1, 1, tzinfo=server.timezone.utc)
+    docs = [blog_doc(f"post-{n:03d}", created_at=start + timedelta(hours=n)) for n in range(published)]
+    docs += [blog_doc(f"draft-{n:03d}", published=False, created_at=start + timedelta(hours=n)) for n in range(drafts)]
+    await db.blogs.insert_many(docs)
+    return [f"{server.SITE_URL}/blog/post-{n:03d}" for n in range(published)]
+
+
+def expected_urls(blog_urls):
+    return [loc for loc, _, _, _ in server.static_sitemap_urls()] + blog_urls
+
+
+async def test_single_document_below_max_urls(db):
+    blog_urls = await seed_blogs(db, 3, drafts=2)
+    documents = await server.SitemapCache(max_urls=50).documents()
+    assert list(documents) == ["sitemap.xml"]
+    assert locs(documents["sitemap.xml"].body) == expected_urls(blog_urls)
+
+
+async def test_shards_cover_every_url_once(db):
+    blog_urls = await seed_blogs(db, 23, drafts=4)
+    documents = await server.SitemapCache(max_urls=10).documents()
+    total = len(expected_urls(blog_urls))
+    shard_names = [f"sitemap-{n}.xml" for n in range(1, -(-total // 10) + 1)]
+    assert sorted(documents) == sorted(["sitemap.xml"] + shard_names)
+    assert locs(documents["sitemap.xml"].body, "sitemap") == [f"{server.SITE_URL}/{name}" for name in shard_names]
+    shards = [locs(documents[name].body) for name in shard_names]
+    assert all(len(shard) <= 10 for shard in shards)
+    assert [url for shard in shards for url in shard] == expected_urls(blog_urls)
+
+
+async def test_streamed_shards_match_cached_shards(db, api, monkeypatch):
+    await seed_blogs(db, 23)
+    cache = server.SitemapCache(max_urls=10)
+    monkeypatch.setattr(server, "sitemap_cache", cache)
+    monkeypatch.setattr(server, "SITEMAP_STREAMING", True)
+    streamed = {}
+    for name in ["sitemap.xml", "sitemap-1.xml", "sitemap-2.xml", "sitemap-3.xml"]:
+        response = await api.get(f"/{name}")
+        assert response.status_code == 200
+        streamed[name] = response.content
+    assert (await api.get("/sitemap-4.xml")).status_code == 404
+    cached = await cache.documents()
+    assert locs(streamed["sitemap.xml"], "sitemap") == locs(cached["sitemap.xml"].body, "sitemap")
+    for name in ["sitemap-1.xml", "sitemap-2.xml", "sitemap-3.xml"]:
+        assert locs(streamed[name]) == locs(cached[name].body)
+
+
+async def test_patches_reshard_without_reload(db):
+    blog_urls = await seed_blogs(db, 9)
+    cache = server.SitemapCache(max_urls=10)
+    documents = await cache.documents()
+    assert len(documents) == 3
+    for n in range(5):
+        cache.remove(f"post-{n:03d}")
+    documents = await cache.documents()
+    assert list(documents) == ["sitemap.xml"]
+    assert locs(documents["sitemap.xml"].body) == expected_urls(blog_urls[5:])
+    cache.upsert("post-new", server.datetime(2024, 6, 1, tzinfo=server.timezone.utc))
+    body = (await cache.get("sitemap.xml")).body
+    assert f"{server.SITE_URL}/blog/post-new" in locs(body)
+    assert b"<lastmod>2024-06-01</lastmod>" in body
+
+
+async def test_forced_rebuild_requires_admin(db, api, admin_headers):
+    await seed_blogs(db, 2)
+    assert (await api.get("/api/sitemap/generate")).status_code in (401, 403)
+    response = await api.get("/api/sitemap/generate", headers=admin_headers)
+    assert response.status_code == 200
+    assert f"{server.SITE_URL}/blog/post-001" in locs(response.content)
+
+
+async def test_warm_sitemap_is_served_without_rescanning(db, api, monkeypatch):
+    await seed_blogs(db, 2)
+    await server.sitemap_cache.load()
+    scans = []
+    monkeypatch.setattr(server, "published_blog_cursor", lambda *args, **kwargs: scans.append(args) or [])
+    for _ in range(3):
+        assert (await api.get("/sitemap.xml")).status_code == 200
+    assert scans == []
+
+
+@pytest.mark.parametrize("accept, encoded", [("gzip", True), ("br, gzip;q=0.5", True), ("gzip;q=0", False), ("identity", False)])
+async def test_sitemap_gzip_follows_quality_values(db, api, accept, encoded):
+    await seed_blogs(db, 2)
+    await server.sitemap_cache.load()
+    response = await api.get("/sitemap.xml", headers={"accept-encoding": accept})
+    assert (response.headers.get("content-encoding") == "gzip") is encoded
+    assert locs(response.content)[-1] == f"{server.SITE_URL}/blog/post-001"
+
+
+async def test_cold_stream_fills_the_cache_in_one_scan(db, api, monkeypatch):
+    blog_urls = await seed_blogs(db, 4)
+    scans = []
+    cursor = server.published_blog_cursor
+    monkeypatch.setattr(server, "published_blog_cursor", lambda *args, **kwargs: scans.append(args) or cursor(*args, **kwargs))
+    cold = await api.get("/sitemap.xml")
+    assert locs(cold.content) == expected_urls(blog_urls)
+    assert server.sitemap_cache.warm
+    warm = await api.get("/sitemap.xml")
+    assert locs(warm.content) == expected_urls(blog_urls)
+    assert len(scans) == 1
+
+
+async def test_write_during_cold_stream_loads_instead_of_filling(db):
+    await seed_blogs(db, 2)
+    cache = server.SitemapCache()
+    fill = cache.filler()
+    cache.upsert("post-new", None)
+    fill({"post-000": "2024-01-01"})
+    assert not cache.warm
+    await cache._warming
+    assert cache.warm
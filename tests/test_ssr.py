@@ -0,0 +1,109 @@
+import json
+from html.parser import HTMLParser
+
+import pytest
+
+import server
+from tests.helpers import blog_doc
+
+pytestmark = pytest.mark.anyio
+
+HOSTILE_SLUG = 'x" onmouseover="alert(1)'
+HOSTILE_TITLE = '"><script>alert(1)</script>'
+
+
+class Page(HTMLParser):
+    """Collects the elements a crawler would read from a pre-rendered page."""
+
+    def __init__(self, html: str):
+        super().__init__()
+        self.elements, self.scripts, self.text, self._tag = [], [], {}, None
+        self.feed(html)
+
+    def handle_starttag(self, tag, attrs):
+        self.elements.append((tag, dict(attrs)))
+        self._tag = tag
+
+    def handle_data(self, data):
+        if self._tag == "script":
+            self.scripts.append(data)
+        elif self._tag in ("title", "a", "h1", "p"):
+            self.text.setdefault(self._tag, []).append(data)
+
+    def handle_endtag(self, tag):
+        self._tag = None
+
+    def find(self, tag, **attrs):
+        return [found for name, found in self.elements if name == tag and all(found.get(k) == v for k, v in attrs.items())]
+
+    def meta(self, key):
+        tags = self.find("meta", name=key) or self.find("meta", property=key)
+        return [tag["content"] for tag in tags]
+
+
+async def test_home_head_tags_come_from_seo_settings(db, api):
+    await db.seo_settings.insert_one(server.SEOSettings(
+        page="home", title="TechResona Cloud", description="Cloud & DevOps", keywords="cloud, devops",
+        og_image="https://cdn.example.com/og.png", json_ld={"@type": "Organization", "name": "TechResona"},
+    ).model_dump())
+    page = Page((await api.get("/")).text)
+    assert page.text["title"] == ["TechResona Cloud"]
+    assert page.meta("description") == ["Cloud & DevOps"]
+    assert page.meta("og:title") == page.meta("twitter:title") == ["TechResona Cloud"]
+    assert page.meta("og:image") == ["https://cdn.example.com/og.png"]
+    assert page.meta("og:type") == ["website"]
+    assert [link["href"] for link in page.find("link", rel="canonical")] == [f"{server.SITE_URL}/"]
+    assert [json.loads(script) for script in page.scripts] == [{"@type": "Organization", "name": "TechResona"}]
+
+
+async def test_page_without_settings_keeps_the_template_title(db, api):
+    page = Page((await api.get("/about")).text)
+    assert page.text["title"] == ["TechResona | Your Tech Partner"]
+    assert page.meta("description") == []
+
+
+async def test_blog_list_body_links_published_posts(db, api):
+    start = server.datetime(2024, 1, 1, tzinfo=server.timezone.utc)
+    await db.blogs.insert_many([
+        blog_doc("first", title="First post", excerpt="One", created_at=start),
+        blog_doc("second", title="Second post", excerpt="Two", created_at=start.replace(day=2)),
+        blog_doc("hidden", title="Draft", published=False, created_at=start.replace(day=3)),
+    ])
+    page = Page((await api.get("/blog")).text)
+    assert [link["href"] for link in page.find("a")] == ["/blog/second", "/blog/first"]
+    assert page.text["a"] == ["Second post", "First post"]
+    assert page.text["p"] == ["Two", "One"]
+
+
+async def test_blog_page_renders_the_article(db, api):
+    await db.blogs.insert_one(blog_doc("guide", title="Guide", content="Intro\n\nDetails", meta_description="A guide"))
+    page = Page((await api.get("/blog/guide")).text)
+    assert page.text["title"] == ["Guide | TechResona Blog"]
+    assert page.text["h1"] == ["Guide"]
+    assert page.text["p"] == ["Intro", "Details"]
+    assert page.meta("og:type") == ["article"]
+    assert json.loads(page.scripts[0])["headline"] == "Guide"
+    assert (await api.get("/blog/missing")).status_code == 404
+
+
+async def test_hostile_slug_and_title_stay_inside_their_attributes(db, api):
+    await db.blogs.insert_one(blog_doc(HOSTILE_SLUG, title=HOSTILE_TITLE, excerpt="<b>bold</b>"))
+    html = (await api.get("/blog")).text
+    page = Page(html)
+    [link] = page.find("a")
+    assert link == {"href": "/blog/x%22%20onmouseover%3D%22alert%281%29"}
+    assert page.text["a"] == [HOSTILE_TITLE]
+    assert "<script>alert(1)" not in html
+    assert not [attrs for _, attrs in page.elements if "onmouseover" in attrs]
+
+
+def test_head_tags_escape_quotes_and_script_breakouts():
+    meta = server.PageMeta(HOSTILE_TITLE, 'say "hi" & <leave>', None, None,
+                           {"name": "</script><script>alert(1)</script>"}, f"{server.SITE_URL}/blog/{HOSTILE_SLUG}")
+    head = server.render_head_tags(meta)
+    page = Page(head)
+    assert page.text["title"] == [HOSTILE_TITLE]
+    assert page.meta("description") == ['say "hi" & <leave>']
+    assert page.find("link", rel="canonical")[0]["href"] == f"{server.SITE_URL}/blog/{HOSTILE_SLUG}"
+    assert not [attrs for _, attrs in page.elements if "onmouseover" in attrs]
+    assert [json.loads(script) for script in page.scripts] == [{"name": "</script><script>alert(1)</script>"}]
@@ -0,0 +1,60 @@
+import asyncio
+
+import pytest
+
+import server
+from tests.helpers import blog_doc
+
+pytestmark = pytest.mark.anyio
+
+
+def create_body(slug, **fields):
+    return {field: blog_doc(slug, **fields)[field] for field in server.BlogCreate.model_fields}
+
+
+async def test_duplicate_slug_is_400_from_the_unique_index(db, api, admin_headers):
+    assert (await api.post("/api/blogs", json=create_body("taken"), headers=admin_headers)).status_code == 200
+    response = await api.post("/api/blogs", json=create_body("taken", title="Second try"), headers=admin_headers)
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Blog with this slug already exists"
+    assert [blog["title"] async for blog in db.blogs.find({"slug": "taken"})] == ["Post taken"]
+
+
+async def test_concurrent_creates_of_one_slug_admit_one(db, api, admin_headers):
+    responses = await asyncio.gather(*(api.post("/api/blogs", json=create_body("race"), headers=admin_headers) for _ in range(4)))
+    assert sorted(response.status_code for response in responses) == [200, 400, 400, 400]
+    assert await db.blogs.count_documents({"slug": "race"}) == 1
+
+
+async def test_duplicate_email_is_400(db, api):
+    credentials = {"email": "editor@techresona.com", "password": "correct horse battery"}
+    assert (await api.post("/api/auth/register", json=credentials)).status_code == 200
+    response = await api.post("/api/auth/register", json={**credentials, "password": "another password"})
+    assert response.status_code == 400
+    assert response.json()["detail"] == "Email already registered"
+    assert await db.admins.count_documents({"email": credentials["email"]}) == 1
+
+
+async def test_duplicate_seo_page_is_400(db, api, admin_headers):
+    assert (await api.post("/api/seo", json={"page": "home", "title": "Home"}, headers=admin_headers)).status_code == 200
+    assert (await api.post("/api/seo", json={"page": "home", "title": "Again"}, headers=admin_headers)).status_code == 400
+    assert await db.seo_settings.count_documents({"page": "home"}) == 1
+
+
+async def test_updating_a_missing_slug_is_404_without_upsert(db, api, admin_headers):
+    response = await api.put("/api/blogs/ghost", json={"title": "Boo"}, headers=admin_headers)
+    assert response.status_code == 404
+    assert await db.blogs.count_documents({}) == 0
+
+
+async def test_update_returns_the_stored_document(db, api, admin_headers):
+    await api.post("/api/blogs", json=create_body("live"), headers=admin_headers)
+    response = await api.put("/api/blogs/live", json={"title": "Retitled"}, headers=admin_headers)
+    assert response.status_code == 200
+    stored = await db.blogs.find_one({"slug": "live"}, {"_id": 0})
+    assert response.json()["title"] == stored["title"] == "Retitled"
+    assert server.as_utc(stored["updated_at"]) > server.as_utc(stored["created_at"])
+
+
+async def test_deleting_a_missing_slug_is_404(db, api, admin_headers):
+    assert (await api.delete("/api/blogs/ghost", headers=admin_headers)).status_code == 404